@@ -36,7 +36,8 @@ class Subplot:
     """Definition of a subplot within a plot.
 
     :param name: Name of the subplot, must be unique within the plot.
-    :param hvalues: `1xN` array with values for the horizontal axis, they must satisfy the requirement `x[n] < x[n+1]`.
+    :param hvalues: `1xN` array with values for the horizontal axis, they must satisfy the requirement `x[n] < x[n+1]`,
+        or their start and step for uniformly spaced values, which are calculated as `start + n * step` when plotted.
     :param hunits: The units for the horizontal axis.
     :param vvalues: `1xN` array with the values for the vertical axis.
     :param vunits: The units for the vertical axis.
@@ -50,7 +51,7 @@ class Subplot:
     # pylint: disable=too-many-instance-attributes
 
     name: str
-    hvalues: npt.NDArray[np.float_]
+    hvalues: npt.NDArray[np.float_] | tuple[float, float]
     hunits: Units
     vvalues: npt.NDArray[np.float_]
     vunits: Units
@@ -29,6 +29,7 @@ import matplotlib.figure
 import matplotlib.patheffects
 import matplotlib.pyplot
 import numpy as np
+import numpy.typing as npt
 
 from ..definitions import get_logger
 from ..exceptions import PlotterError
@@ -40,6 +41,8 @@ class Plotter:
 
     #: Path to the matplotlib style file.
     _style = os.path.join(os.path.normpath(os.path.dirname(__file__)), "style", "style.mplstyle")
+    #: Number of values checked at once when validating the values of the horizontal axis of a subplot.
+    _check_block = 65536
 
     ## Private API #####################################################################################################
     def __init__(self, *args, mode: Mode = Mode.LINEAR, rows: int = 1, columns: int = 1, **kwargs) -> None:
@@ -86,6 +89,75 @@ class Plotter:
             return None
         return self._area[row][column]
 
+    def _is_increasing(self, values: np.ndarray) -> bool:
+        """Checks that values satisfy the `x[n] < x[n+1]` requirement, in blocks to avoid temporary copies of them.
+
+        :param values: The values to check.
+        :return: ``True`` if the values satisfy the requirement, ``False`` otherwise."""
+        for start in range(0, len(values) - 1, self._check_block):
+            block = values[start : start + self._check_block + 1]
+            if np.any(block[1:] <= block[:-1]):
+                return False
+        return True
+
+    def _is_valid(self, subplot: Subplot) -> bool:
+        """Checks that the values of the axes of a subplot are not empty, have the same length, and that the values of
+        the horizontal axis satisfy the `x[n] < x[n+1]` requirement, which for uniformly spaced values only requires
+        the first and last values to be finite and the step to be positive.
+
+        :param subplot: The subplot to check.
+        :return: ``True`` if the values are valid, ``False`` otherwise."""
+        if isinstance(subplot.hvalues, tuple):
+            return all(
+                [
+                    len(subplot.vvalues) > 0,
+                    subplot.hvalues[1] > 0,
+                    len(subplot.vvalues) == 0 or np.all(np.isfinite(self._hvalues_at(subplot, [0, -1]))),
+                ]
+            )
+        return not any(
+            [
+                len(subplot.hvalues) != len(subplot.vvalues),
+                len(subplot.vvalues) == 0,
+                len(subplot.hvalues) == 0,
+                not self._is_increasing(subplot.hvalues),  # Check x[n] < x[n+1].
+            ]
+        )
+
+    @staticmethod
+    def _hvalues_at(subplot: Subplot, indices: npt.ArrayLike | slice) -> npt.NDArray[np.float_]:
+        """Obtains the values of the horizontal axis of a subplot at the indices given, calculated from the start and
+        the step for uniformly spaced values.
+
+        :param subplot: The subplot.
+        :param indices: The indices, as an integer, an array of integers or a slice.
+        :return: The values at the indices."""
+        if not isinstance(subplot.hvalues, tuple):
+            return subplot.hvalues[indices]
+        if isinstance(indices, slice):
+            indices = np.arange(*indices.indices(len(subplot.vvalues)))
+        indices = np.asarray(indices)
+        (start, step) = subplot.hvalues
+        return (
+            np.multiply(np.where(indices < 0, indices + len(subplot.vvalues), indices), step, dtype=np.float_) + start
+        )
+
+    def _hsearch(self, subplot: Subplot, value: float, side: str) -> int:
+        """Finds the index where a value would be inserted in the values of the horizontal axis of a subplot, as in
+        :func:`numpy.searchsorted`, for uniformly spaced values the index is estimated from the start and the step and
+        then refined with the values around it.
+
+        :param subplot: The subplot.
+        :param value: The value to search for.
+        :param side: The side of the search, ``left`` or ``right``.
+        :return: The index."""
+        if not isinstance(subplot.hvalues, tuple):
+            return int(np.searchsorted(subplot.hvalues, value, side))  # type: ignore
+        (start, step) = subplot.hvalues
+        estimate = int(np.clip(np.ceil((value - start) / step), 0, len(subplot.vvalues)))
+        (lower, upper) = (max(estimate - 2, 0), min(estimate + 2, len(subplot.vvalues)))
+        return lower + int(np.searchsorted(self._hvalues_at(subplot, slice(lower, upper)), value, side))  # type: ignore
+
     def _get_plot_coords(self, subplot_id: str) -> tuple[int, int] | None:
         """Obtains the row and column indices for a plot from one of its subplot identifiers.
 
@@ -115,14 +187,7 @@ class Plotter:
         if subplot.begin > subplot.end:
             raise PlotterError("Subplot begin value must be less than the subplot end value.")
         # Check that the horizontal values and vertical values of the subplot to add satisfy requirements.
-        if any(
-            [
-                len(subplot.hvalues) != len(subplot.vvalues),
-                len(subplot.vvalues) == 0,
-                len(subplot.hvalues) == 0,
-                len(np.where(np.diff(subplot.hvalues) <= 0)[0]) > 0,  # Check x[n] < x[n+1].
-            ]
-        ):
+        if not self._is_valid(subplot):
             raise PlotterError("Values of the axis of the subplot to add are invalid.")
         # Check if the coordinates are valid.
         if (plot := self._get_plot(row, column)) is None:
@@ -167,7 +232,7 @@ class Plotter:
         if not all(subplot_id in [i.name for i in plot] for subplot_id in cursor.subplot_ids):
             raise PlotterError("At least one of the subplot identifiers does not exist in plot.")
         # Check that all the indices exist in all the subplots.
-        if not all(0 <= cursor.hindex < len(i.hvalues) for i in plot if i.name in cursor.subplot_ids):
+        if not all(0 <= cursor.hindex < len(i.vvalues) for i in plot if i.name in cursor.subplot_ids):
             raise PlotterError("The cursor horizontal axis index value does not exist in all subplots in plot.")
 
         self._cursors.append(cursor)
@@ -231,17 +296,24 @@ class Plotter:
 
                         # Calculate begin and end values keeping into account the margin, with limits check.
                         mval = (end - begin) * subplot.munits
-                        begin = subplot.hvalues[0] if (begin - mval) < subplot.hvalues[0] else (begin - mval)
-                        end = subplot.hvalues[-1] if (end + mval) > subplot.hvalues[-1] else (end + mval)
-
-                        # Get the relevand indices of the data to plot, if there is no data, the continue with the next.
-                        indices = np.where((subplot.hvalues >= begin) & (subplot.hvalues <= end))[0]
-                        if len(indices) == 0:
+                        (hfirst, hlast) = self._hvalues_at(subplot, [0, -1])
+                        begin = hfirst if (begin - mval) < hfirst else (begin - mval)
+                        end = hlast if (end + mval) > hlast else (end + mval)
+
+                        # Get the relevant range of the data to plot, as the values of the horizontal axis are sorted,
+                        # if there is no data, then continue with the next.
+                        first = self._hsearch(subplot, begin, "left")
+                        if (last := self._hsearch(subplot, end, "right")) <= first:
                             continue
 
-                        # Get the values to plot from the horizontal and vertical axis.
-                        hvalues = subplot.hvalues[indices]
-                        vvalues = subplot.vvalues[indices]
+                        # Get the values to plot from the horizontal and vertical axis, as views of the range, values
+                        # of the horizontal axis uniformly spaced are only calculated for the range.
+                        hvalues = self._hvalues_at(subplot, slice(first, last))
+                        vvalues = subplot.vvalues[first:last]
+                        # Values of the vertical axis broadcast from a single value, such as those of state levels,
+                        # are a horizontal line, which is plotted with its first and last values when not marked.
+                        if vvalues.strides == (0,) and subplot.marker == "none":
+                            (hvalues, vvalues) = (hvalues[[0, -1]], vvalues[[0, -1]])
 
                         # Plot, use rasters and use pixels as markers after the raster limit to speed up plotting.
                         marker = subplot.marker if any([len(hvalues) < raster_limit, subplot.marker == "none"]) else ","
@@ -301,7 +373,7 @@ class Plotter:
                         # Get relevant subplots for cursor, at least one exists.
                         subplots = [subplot for subplot in column if subplot.name in cursor.subplot_ids]
                         # Get horizontal value from first subplot as a reference.
-                        cursor_hvalue = subplots[0].hvalues[cursor.hindex]
+                        cursor_hvalue = self._hvalues_at(subplots[0], cursor.hindex)
 
                         # Build label for cursor.
                         label = f"{cursor.name}: [X: {np.round(cursor_hvalue, cursor.hvdec)}"
@@ -4,5 +4,5 @@
 
 ## Public API ##########################################################################################################
 from . import edges, filters, generator, sample, state_levels
-from .signal import Signal
+from .signal import CacheInfo, Signal
 from .voltage_signal import VoltageSignal
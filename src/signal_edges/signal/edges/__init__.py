@@ -3,5 +3,6 @@
 ## Initialization code #################################################################################################
 
 ## Public API ##########################################################################################################
-from .definitions import Edge, IntPointPolicy, Type
+from .definitions import Edge, EdgeTable, Engine, IntPointPolicy, Output, Type
 from .edges import EdgesMixin
+from .stream import EdgeStream
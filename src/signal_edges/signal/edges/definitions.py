@@ -1,13 +1,13 @@
 """Definitions for signal edges."""
 
+from collections.abc import Iterator, Sequence
 from enum import IntEnum, auto
-from typing import TypedDict
+from typing import TypedDict, overload
 
 import numpy as np
 import numpy.typing as npt
 
-from ..signal import Signal
-from ..state_levels import StateLevelsMixin
+from ...exceptions import EdgesError
 
 
 class IntPointPolicy(IntEnum):
@@ -26,6 +26,37 @@ class IntPointPolicy(IntEnum):
     POLICY_2 = auto()
 
 
+class Engine(IntEnum):
+    """Engines that dictate how the edges of a signal are extracted.
+
+    All the engines walk the same state machine over the logical areas defined in :class:`~.edges.definitions.Type`,
+    and thus return the same edges for the same signal and state levels, they only differ in their performance."""
+
+    #: Walk the signal edge by edge, with binary searches on the indices of the values in each area, as regular
+    #: Python code that holds the GIL, thus it does not run faster with several workers.
+    SEARCH = auto()
+    #: Label each value of the signal by area once, and find the edges from the transitions between areas.
+    VECTORIZED = auto()
+    #: Label each value of the signal by area once, and walk the labels one at a time with kernels compiled to native
+    #: code with the optional ``numba`` package, or falls back to :attr:`SEARCH` if it is not installed.
+    JIT = auto()
+
+
+class Output(IntEnum):
+    """Outputs that dictate what is returned for the edges of a signal.
+
+    The outputs other than the table skip the calculation of the intermediate points and the lookup of the values of
+    the points of the edges, and are meant for cases where only the position or the number of edges is relevant."""
+
+    #: An :class:`.EdgeTable` with all the points of the edges.
+    TABLE = auto()
+    #: The ``ibegin``, ``iend`` and ``edge_type`` columns of the table as three `1xN` arrays.
+    INDICES = auto()
+    #: The number of edges of each :class:`~.edges.definitions.Type` as a dictionary, which also skips splitting
+    #: the combinations of runt edges, as each of them always contains one edge of each runt type.
+    COUNTS = auto()
+
+
 class Type(IntEnum):
     """Type of an edge.
 
@@ -83,21 +114,121 @@ class Edge(TypedDict):
     vend: float
 
 
-class AreaSignal(StateLevelsMixin, Signal):
-    """Definition of a signal used to calculate state levels in a delimited area of the original signal."""
+class EdgeTable:
+    """Definition of the edges in a signal, stored in columns rather than as a sequence of :class:`.Edge`.
+
+    The edges are backed by a Numpy structured array with a field for each of the keys of :class:`.Edge`, the table
+    can be indexed in the following ways:
+
+        - With a field name, such as ``table["ibegin"]``, which returns a view of the column without copies.
+        - With an integer, such as ``table[0]``, which returns the edge at that position as an :class:`.Edge`.
+        - With a slice, a boolean mask or an array of indices, such as ``table[table["edge_type"] == Type.FALLING]``,
+          which returns a new table with the selected edges.
+
+    Iterating over the table yields each edge as an :class:`.Edge`, thus existing code that handles sequences of
+    edges keeps working, although it is recommended to use the columns directly for large number of edges."""
+
+    # pylint: disable=invalid-name
+
+    #: Data type of the underlying structured array, with a field for each of the keys of :class:`.Edge`.
+    DTYPE = np.dtype(
+        [
+            ("edge_type", np.int8),
+            ("ibegin", np.int_),
+            ("hbegin", np.float_),
+            ("vbegin", np.float_),
+            ("iintermediate", np.int_),
+            ("hintermediate", np.float_),
+            ("vintermediate", np.float_),
+            ("iend", np.int_),
+            ("hend", np.float_),
+            ("vend", np.float_),
+        ]
+    )
+
+    # pylint: enable=invalid-name
 
     ## Private API #####################################################################################################
+    def __init__(self, values: npt.NDArray[np.void] | None = None) -> None:
+        """Class constructor.
+
+        :param values: A `1xN` structured array of data type :attr:`.EdgeTable.DTYPE`, defaults to no edges.
+        :raise EdgesError: The values provided are not a `1xN` structured array of the expected data type."""
+        if values is None:
+            values = np.empty(0, dtype=self.DTYPE)
+        # Ensure the values are a 1xN structured array of the expected data type.
+        if values.dtype != self.DTYPE or len(values.shape) != 1:
+            raise EdgesError("The values of the edge table must be a 1xN structured array of the edge table type.")
+
+        #: The structured array with the edges.
+        self.__values = values
+
+    def __len__(self) -> int:
+        """Number of edges in the table.
+
+        :return: The number of edges."""
+        return len(self.__values)
+
+    def __iter__(self) -> Iterator[Edge]:
+        """Iterates over the edges in the table in order of appearance in the signal.
+
+        :return: An iterator over the edges."""
+        names = self.DTYPE.names if self.DTYPE.names is not None else ()
+        for row in self.__values.tolist():
+            edge = dict(zip(names, row))
+            edge["edge_type"] = Type(edge["edge_type"])
+            yield edge  # type: ignore
+
+    @overload
+    def __getitem__(self, key: int) -> Edge:
+        ...
+
+    @overload
+    def __getitem__(self, key: str) -> npt.NDArray:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice | Sequence[int] | npt.NDArray) -> "EdgeTable":
+        ...
+
+    def __getitem__(self, key: int | str | slice | Sequence[int] | npt.NDArray) -> "Edge | npt.NDArray | EdgeTable":
+        """Obtains an edge, a column or a subset of the edges in the table.
+
+        :param key: An integer for an edge, a field name for a column, or a slice, a boolean mask or an array of
+            indices for a subset of the edges.
+        :return: The edge as an :class:`.Edge`, the column as an array or the subset as a new table."""
+        if isinstance(key, str):
+            return self.__values[key]
+        if isinstance(key, (int, np.integer)):
+            names = self.DTYPE.names if self.DTYPE.names is not None else ()
+            edge = dict(zip(names, self.__values[key].tolist()))
+            edge["edge_type"] = Type(edge["edge_type"])
+            return edge  # type: ignore
+        return EdgeTable(self.__values[key])
 
     ## Protected API ###################################################################################################
 
     ## Public API ######################################################################################################
-    def load(self, hvalues: npt.NDArray[np.float_], vvalues: npt.NDArray[np.float_]) -> "AreaSignal":
-        """Loads the values specified into the signal.
+    @classmethod
+    def from_edges(cls, edges: Sequence[Edge]) -> "EdgeTable":
+        """Creates a table from a sequence of edges.
+
+        :param edges: The sequence of edges.
+        :return: The table with the edges."""
+        names = cls.DTYPE.names if cls.DTYPE.names is not None else ()
+        return cls(np.array([tuple(edge[name] for name in names) for edge in edges], dtype=cls.DTYPE))  # type: ignore
+
+    @classmethod
+    def concatenate(cls, tables: Sequence["EdgeTable"]) -> "EdgeTable":
+        """Creates a table with the edges of several tables, one after the other.
+
+        :param tables: The sequence of tables.
+        :return: The table with the edges."""
+        return cls(np.concatenate([table.values for table in tables])) if len(tables) > 0 else cls()
 
-        :param hvalues: The values for the horizontal axis.
-        :param vvalues: The values for the vertical axis.
-        :return: Instance of the class."""
-        self._hv = hvalues
-        self._vv = vvalues
+    @property
+    def values(self) -> npt.NDArray[np.void]:
+        """The structured array with the edges, changes to it are reflected in the table.
 
-        return self
+        :return: The structured array."""
+        return self.__values
@@ -1,7 +1,13 @@
 """The edges mixin, :class:`.EdgesMixin`, can be added to :class:`.Signal` to obtain different types,
-:class:`~.edges.definitions.Type`, of edges of a signal. Each of the resulting edges are returned as a :class:`.Edge`.
+:class:`~.edges.definitions.Type`, of edges of a signal. The resulting edges are returned as an :class:`.EdgeTable`,
+which can also be iterated as a sequence of :class:`.Edge`. To find only the first edges of a long signal, use
+:meth:`.EdgesMixin.iter_edges` instead, which yields the edges as they are found. For signals whose baseline drifts
+over time, the edges can be extracted with state levels that vary over the signal, such as those obtained with
+:meth:`.StateLevelsMixin.state_levels_windowed`. For signals with more than two states, such as pulse amplitude
+modulated signals, the edges between all the states are extracted at once with :meth:`.EdgesMixin.edges_multi`.
 
-To configure how to calculate the intermediate point of the edge, refer to :class:`.IntPointPolicy`.
+To configure how to calculate the intermediate point of the edge, refer to :class:`.IntPointPolicy`, and to configure
+how the edges are searched for in the signal, refer to :class:`.Engine`.
 
 The edges mixin requires the :class:`.StateLevelsMixin` to also be added to the signal, the code snippet below shows
 how to add the edges functionality to a signal:
@@ -45,20 +51,28 @@ This code snippet generates the following plot:
     The generated signal with the edges begin, intermediate and end points marked."""
 
 try:
-    from typing import Literal, Self
+    from typing import Any, Literal, Self
 except ImportError:
-    from typing_extensions import Self, Literal
+    from typing_extensions import Any, Self, Literal
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import numpy.typing as npt
 
 from ... import plotter as sep
 from ...exceptions import EdgesError
-from ..state_levels import StateLevels
-from .definitions import AreaSignal, Edge, IntPointPolicy, Type
+from ..signal import Signal
+from ..state_levels import StateLevels, StateLevelsArray, StateLevelsMixin
+from . import jit
+from .definitions import Edge, EdgeTable, Engine, IntPointPolicy, Output, Type
+
+#: The ``ibegin``, ``iend`` and ``edge_type`` columns of the edges, as returned for :attr:`.Output.INDICES`.
+EdgeIndices = tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int8]]
+#: The number of edges of each type, as returned for :attr:`.Output.COUNTS`.
+EdgeCounts = dict[Type, int]
 
 
 class EdgesMixin:
@@ -88,6 +102,48 @@ class EdgesMixin:
     #: Runt low area identifier.
     __RUNT_LOW = 5
 
+    # Each value of the signal can be labelled by the band between state levels it falls in, from which the areas
+    # it belongs to are derived, as some of the areas overlap between each other.
+
+    #: Label for values that satisfy `value < low`, in ``low`` area.
+    __LABEL_LOW = 0
+    #: Label for values that satisfy `low <= value < low_runt`, in ``int_low`` and ``runt_low`` areas.
+    __LABEL_LOW_RUNT = 1
+    #: Label for values that satisfy `low_runt <= value <= intermediate`, in ``int_low``, ``runt_low`` and
+    #: ``runt_high`` areas.
+    __LABEL_INT_LOW = 2
+    #: Label for values that satisfy `intermediate < value <= high_runt`, in ``int_high``, ``runt_low`` and
+    #: ``runt_high`` areas.
+    __LABEL_INT_HIGH = 3
+    #: Label for values that satisfy `high_runt < value <= high`, in ``int_high`` and ``runt_high`` areas.
+    __LABEL_HIGH_RUNT = 4
+    #: Label for values that satisfy `value > high`, in ``high`` area.
+    __LABEL_HIGH = 5
+    #: Label for values that do not belong to any area, such as ``NaN`` values.
+    __LABEL_NONE = 6
+
+    #: Lookup table indexed as ``[area_id][label]`` that determines if values with a label belong to an area.
+    __AREA_LABELS = np.array(
+        (
+            (False, False, False, False, False, True, False),
+            (False, False, False, True, True, False, False),
+            (False, True, True, False, False, False, False),
+            (True, False, False, False, False, False, False),
+            (False, False, True, True, True, False, False),
+            (False, True, True, True, False, False, False),
+        ),
+        dtype=np.bool_,
+    )
+
+    #: Initial number of labels scanned at once when searching for a value in an area.
+    __SCAN_BLOCK_MIN = 64
+    #: Maximum number of labels scanned at once when searching for a value in an area.
+    __SCAN_BLOCK_MAX = 65536
+    #: Initial number of values processed at once when iterating over the edges.
+    __ITER_BLOCK_MIN = 4096
+    #: Maximum number of values processed at once when iterating over the edges.
+    __ITER_BLOCK_MAX = 1048576
+
     # pylint: enable=invalid-name
 
     ## Private API #####################################################################################################
@@ -95,14 +151,14 @@ class EdgesMixin:
         """Class constructor."""
         super().__init__(*args, **kwargs)
 
-        #: Area with indices of the values that satisfy `x > high`.
-        self.__areas: list[npt.NDArray[np.int_]] = [np.empty(shape=(1, 1), dtype=np.int_) for _ in range(0, 6)]
+        #: The labels of the values of the signal, from which the areas are derived.
+        self.__labels: npt.NDArray[np.int8] = np.empty(0, dtype=np.int8)
+        #: The lookup tables for the areas, or combinations of areas, searched so far.
+        self.__lookups: dict[int | tuple[int, ...], npt.NDArray[np.bool_]] = {}
         #: The state levels.
-        self.__state_levels: StateLevels
+        self.__state_levels: StateLevels | StateLevelsArray
         #: The intermediate point policy to apply.
         self.__int_policy: IntPointPolicy
-        #: Temporary area for state levels in runt edges.
-        self.__area_signal: AreaSignal = AreaSignal(hvalues=[1, 2], vvalues=[1, 2])
 
         # Relevant members of Signal class, make them available here for type checks and the like.
         self._logger: logging.Logger
@@ -110,117 +166,138 @@ class EdgesMixin:
         self._vv: npt.NDArray[np.float_]
         self._hunits: sep.Units
         self._vunits: sep.Units
-
-    def __area_update(self, levels: StateLevels) -> Self:
+        self._codes: npt.NDArray[np.unsignedinteger] | None
+        self._code_values: npt.NDArray[np.float_] | None
+        self._vv_at: Callable[[npt.ArrayLike | slice], npt.NDArray[np.float_]]
+        self._hv_at: Callable[[npt.ArrayLike | slice], npt.NDArray[np.float_]]
+        self._hv_axis: npt.NDArray[np.float_] | tuple[np.float_, np.float_]
+        self._length: int
+        self.window_offset: int
+        self.window: Callable[[float, float], Any]
+        self._cached: Callable[[Hashable, Callable[[], Any]], Any]
+
+    def __area_update(self, levels: StateLevels | StateLevelsArray) -> Self:
         """Updates the internal areas from the state levels provided.
 
         The ``high``, ``int_high``, ``int_low`` and ``low`` areas have all values unique between each other.
 
         The ``runt_high`` and ``runt_low`` areas share values with the ``int_high`` and ``int_low``.
 
-        The values in each area are unique and sorted in ascending order, which suits well for fast analysis using
-        binary search.
+        The areas are not stored as indices, instead each value of the signal is labelled with the band between the
+        state levels it falls in, which takes a single byte per value, and the areas are derived from the labels.
 
-        :param levels: The state levels for the signal.
+        :param levels: The state levels for the signal, either the same for all the values or one for each value.
         :raise EdgesError: The state levels do not satisfy `low < low_runt < intermediate < high_runt < high`.
+        :raise EdgesError: The state levels do not have one level for each value of the signal.
         :return: Instance of the class."""
-        # Sanity check on the levels.
-        if not levels.low < levels.low_runt < levels.intermediate < levels.high_runt < levels.high:
-            raise EdgesError("The state levels do not satisfy low < low_runt < intermediate < high_runt < high.")
-
-        # Get values.
-        high = np.float_(levels.high)
-        high_runt = np.float_(levels.high_runt)
-        intermediate = np.float_(levels.intermediate)
-        low_runt = np.float_(levels.low_runt)
-        low = np.float_(levels.low)
-
-        # Normal areas.
-        self.__areas[self.__HIGH] = np.where(self._vv > high)[0]
-        self.__areas[self.__INT_HIGH] = np.where((self._vv <= high) & (self._vv > intermediate))[0]
-        self.__areas[self.__INT_LOW] = np.where((self._vv <= intermediate) & (self._vv >= low))[0]
-        self.__areas[self.__LOW] = np.where(self._vv < low)[0]
-
-        # Runt areas.
-        self.__areas[self.__RUNT_LOW] = np.where((self._vv <= high_runt) & (self._vv >= low))[0]
-        self.__areas[self.__RUNT_HIGH] = np.where((self._vv >= low_runt) & (self._vv <= high))[0]
+        # Label values, areas are derived from the labels on each search.
+        self.__labels = self.__area_labels(levels)
 
         # Keep track of state levels calculated.
         self.__state_levels = levels
 
         return self
 
-    def __area_first(self, area_id: int, begin: np.int_, end: np.int_ | None = None) -> np.int_ | None:
+    def __area_lookup(self, area_id: int | tuple[int, ...]) -> npt.NDArray[np.bool_]:
+        """Obtains the lookup table that determines if values with a label belong to the area or areas specified.
+
+        :param area_id: The area identifier, or several area identifiers to belong to any of them.
+        :return: A `1xN` array indexed by label."""
+        lookup = self.__lookups.get(area_id)
+        if lookup is None:
+            ids = list(area_id) if isinstance(area_id, tuple) else [area_id]
+            lookup = self.__lookups[area_id] = np.any(self.__AREA_LABELS[ids], axis=0)
+        return lookup
+
+    def __area_first(
+        self, area_id: int | tuple[int, ...], begin: np.int_, end: np.int_ | None = None
+    ) -> np.int_ | None:
         """Obtains the first value in the area specified between the given ``begin`` and ``end`` values.
 
-        :param area_id: The area identifier.
+        The labels are scanned forward in blocks that double in size, thus the cost of the search is proportional
+        to the distance between ``begin`` and the value found rather than to the length of the signal.
+
+        :param area_id: The area identifier, or several area identifiers to search for a value in any of them.
         :param begin: The value to use as reference for the beginning of the search.
         :param end: The value to use as reference for the end of the search, or ``None`` to use no reference.
         :raise EdgesError: The ``begin`` reference value is not in the range `0 <= begin < len(values)`.
         :raise EdgesError: The ``end`` reference value is not in the range `0 <= end < len(values)`.
         :return: A value ``begin <= value < end`` if ``end`` was specified, otherwise `begin <= value`.
         If no value exists for the specified ``begin`` and ``end`` values, then ``None`` is returned."""
-        # Ensure the begin value is in the range 0 <= begin < len(values).
-        if begin < 0 or begin >= len(self._vv):
+        # Ensure the begin value is in the range 0 <= begin < len(values), there is one label for each value.
+        length = len(self.__labels)
+        if begin < 0 or begin >= length:
             raise EdgesError(f"The begin, {begin}, reference value is not in the range 0 <= begin < len(values).")
         # If an end value was provided, ensure it is in the range 0 <= end < len(values).
-        if end is not None and (end < 0 or end >= len(self._vv)):
+        if end is not None and (end < 0 or end >= length):
             raise EdgesError(f"The end, {end}, reference value is not in the range 0 <= end < len(values).")
 
-        # Get relevant area from area identifier, and check if empty.
-        area = self.__areas[area_id]
-        # Obtain index that satisfies area[bindex-1] < begin <= area[bindex];
-        bindex = np.searchsorted(area, begin, "left")
-        # If the index is zero or greater, it is the desired value, if it matches the length, then no value exists.
-        bvalue = None if bindex >= len(area) else area[bindex]
+        # Get relevant lookup table from area identifier and the limit of the search.
+        lookup = self.__area_lookup(area_id)
+        stop = length if end is None else int(end)
 
-        # Check if a end value was specified, and delimit the calculated value further.
-        if bvalue is not None and end is not None:
-            # An end value was provided, if value found is greater or equal than end value the invalidate it.
-            bvalue = None if bvalue >= end else bvalue
+        # Scan blocks of labels forward until a value in the area is found or the limit is reached.
+        (start, size) = (int(begin), self.__SCAN_BLOCK_MIN)
+        while start < stop:  # pylint: disable=while-used
+            block = lookup[self.__labels[start : min(start + size, stop)]]
+            index = np.argmax(block)
+            if block[index]:
+                return np.int_(start + index)
+            (start, size) = (start + size, min(size * 2, self.__SCAN_BLOCK_MAX))
 
-        return bvalue
+        return None
 
-    def __area_last(self, area_id: int, end: np.int_, begin: np.int_ | None = None) -> np.int_ | None:
+    def __area_last(self, area_id: int | tuple[int, ...], end: np.int_, begin: np.int_ | None = None) -> np.int_ | None:
         """Obtains the last value in the area specified between the given ``begin`` and ``end`` values.
 
-        :param area_id: The area identifier.
+        The labels are scanned backward in blocks that double in size, thus the cost of the search is proportional
+        to the distance between ``end`` and the value found rather than to the length of the signal.
+
+        :param area_id: The area identifier, or several area identifiers to search for a value in any of them.
         :param end: The value to use as reference for the end of the search.
         :param begin: The value to use as reference for the begin of the search, or ``None`` to use no reference.
         :raise EdgesError: The ``end`` reference value is not in the range `0 <= end < len(values)`.
         :raise EdgesError: The ``begin`` reference value is not in the range `0 <= begin < len(values)`.
         :return: A value ``begin <= value < end`` if ``begin`` was specified, otherwise `value < end`.
         If no value exists for the specified ``begin`` and ``end`` values, then ``None`` is returned."""
-        # pylint: disable=too-many-locals
-
-        # Ensure the end value is in the range 0 <= end < len(values).
-        if end < 0 or end >= len(self._vv):
+        # Ensure the end value is in the range 0 <= end < len(values), there is one label for each value.
+        length = len(self.__labels)
+        if end < 0 or end >= length:
             raise EdgesError(f"The end, {end}, reference value is not in the range 0 <= end < len(values).")
         # If an begin value was provided, ensure it is in the range 0 <= begin < len(values).
-        if begin is not None and (begin < 0 or begin >= len(self._vv)):
+        if begin is not None and (begin < 0 or begin >= length):
             raise EdgesError(f"The begin, {begin}, reference value is not in the range 0 <= begin < len(values).")
 
-        # Get relevant area from area identifier.
-        area = self.__areas[area_id]
-        # Obtain index that satisfies area[eindex-1] < end <= area[eindex], and fetch the previous index.
-        eindex = np.searchsorted(area, end, "left")
-        eindex = eindex - 1 if eindex > 0 else eindex
-        # If the index is zero or greater, it is the desired value, if it matches the length, then no value exists.
-        evalue = None if eindex >= len(area) else area[eindex]
+        # Get relevant lookup table from area identifier and the limit of the search.
+        lookup = self.__area_lookup(area_id)
+        stop = 0 if begin is None else int(begin)
 
-        # Check if a begin value was specified, and double check the value calculated.
-        if evalue is not None and begin is not None:
-            # A begin value exists, if value found is less than end value the invalidate it.
-            evalue = None if evalue < begin else evalue
+        # Scan blocks of labels backward until a value in the area is found or the limit is reached.
+        (finish, size) = (int(end), self.__SCAN_BLOCK_MIN)
+        while finish > stop:  # pylint: disable=while-used
+            start = max(finish - size, stop)
+            block = lookup[self.__labels[start:finish]][::-1]
+            index = np.argmax(block)
+            if block[index]:
+                return np.int_(finish - 1 - index)
+            (finish, size) = (start, min(size * 2, self.__SCAN_BLOCK_MAX))
 
-        return evalue
+        return None
 
-    def __extract_edge(self, edge_type: Type, begin: np.int_, end: np.int_) -> Edge:
+    def __extract_edge(
+        self,
+        edge_type: Type,
+        begin: np.int_,
+        end: np.int_,
+        values: tuple[Callable[[np.int_], np.float_], Callable[[np.int_], np.float_], npt.NDArray[np.float_]],
+    ) -> Edge:
         """Extracts an single edge from its ``begin`` and ``end`` values.
 
         :param edge_type: The type of edge to extract.
         :param begin: The value for the beginning of the edge.
         :param end: The value for the end of the edge.
+        :param values: The functions that obtain the value of the horizontal axis and the value of the vertical axis
+            at an index, and the value of the intermediate level for each value of the signal.
         :raise EdgesError: The ``end`` reference value is not in the range `0 <= end < len(values)`.
         :raise EdgesError: The ``begin`` reference value is not in the range `0 <= begin < len(values)`.
         :raise EdgesError: The ``begin`` and end reference values is do not satisfy `begin < end`.
@@ -228,29 +305,29 @@ class EdgesMixin:
         # pylint: disable=too-complex,too-many-branches,too-many-statements,too-many-locals
 
         # Ensure the begin value is in the range 0 <= begin < len(values).
-        if begin < 0 or begin >= len(self._vv):
+        if begin < 0 or begin >= self._length:
             raise EdgesError(f"The begin, {begin}, reference value is not in the range 0 <= begin < len(values).")
         # Ensure the end value is in the range 0 <= end < len(values).
-        if end < 0 or end >= len(self._vv):
+        if end < 0 or end >= self._length:
             raise EdgesError(f"The end, {end}, reference value is not in the range 0 <= end < len(values).")
         # Ensure the begin occurs before the end.
         if begin >= end:
             raise EdgesError(f"The begin, {begin}, and end, {end}, reference values do not satisfy begin < end.")
 
+        (hv_at, vv_at, vint) = values
+
         # Handle beginning of the edge, this is common for all edge types.
         ibegin = begin
-        hbegin = self._hv[ibegin]
-        vbegin = self._vv[ibegin]
+        hbegin = hv_at(ibegin)
+        vbegin = vv_at(ibegin)
 
         # Handle end of the edge, this is common for all edge types.
         iend = end
-        hend = self._hv[iend]
-        vend = self._vv[iend]
+        hend = hv_at(iend)
+        vend = vv_at(iend)
 
         # Handle intermediate of the edge, depending on the type of edge and the policies.
         iint = None
-        vint = np.float_(self.__state_levels.intermediate)
-        vmax = np.float_(self.__state_levels.highest - self.__state_levels.lowest)
         ################################################################################################################
         if edge_type in (Type.FALLING, Type.FALLING_RUNT):
             # Check intermediate point policy for forced values, otherwise proceed with calculation.
@@ -273,22 +350,23 @@ class EdgesMixin:
                 else:
                     int_low_v = self.__area_first(self.__INT_LOW, ibegin, iend)
 
-                # Calculate distance to the intermediate points from all candidates that exist.
+                # Calculate distance to the intermediate points from all candidates, non existing candidates are
+                # never the nearest.
                 indices = np.array(
                     (
                         ibegin,
                         iend,
-                        0 if int_high_v is None else int_high_v,
-                        0 if int_low_v is None else int_low_v,
+                        ibegin if int_high_v is None else int_high_v,
+                        ibegin if int_low_v is None else int_low_v,
                     )
                 )
                 diffs = np.abs(
                     np.array(
                         (
-                            self._vv[ibegin] - vint,
-                            vint - self._vv[iend],
-                            vmax if int_high_v is None else self._vv[int_high_v] - vint,
-                            vmax if int_low_v is None else vint - self._vv[int_low_v],
+                            vbegin - vint[ibegin],
+                            vint[iend] - vend,
+                            np.inf if int_high_v is None else vv_at(int_high_v) - vint[int_high_v],
+                            np.inf if int_low_v is None else vint[int_low_v] - vv_at(int_low_v),
                         )
                     )
                 )
@@ -317,22 +395,23 @@ class EdgesMixin:
                 else:
                     int_high_v = self.__area_first(self.__INT_HIGH, ibegin, iend)
 
-                # Calculate distance to the intermediate points from all candidates that exist.
+                # Calculate distance to the intermediate points from all candidates, non existing candidates are
+                # never the nearest.
                 indices = np.array(
                     (
                         ibegin,
                         iend,
-                        0 if int_high_v is None else int_high_v,
-                        0 if int_low_v is None else int_low_v,
+                        ibegin if int_high_v is None else int_high_v,
+                        ibegin if int_low_v is None else int_low_v,
                     )
                 )
                 diffs = np.abs(
                     np.array(
                         (
-                            vint - self._vv[ibegin],
-                            self._vv[iend] - vint,
-                            vmax if int_high_v is None else vint - self._vv[int_high_v],
-                            vmax if int_low_v is None else self._vv[int_low_v] - vint,
+                            vint[ibegin] - vbegin,
+                            vend - vint[iend],
+                            np.inf if int_high_v is None else vint[int_high_v] - vv_at(int_high_v),
+                            np.inf if int_low_v is None else vv_at(int_low_v) - vint[int_low_v],
                         )
                     )
                 )
@@ -347,90 +426,720 @@ class EdgesMixin:
             "hbegin": float(hbegin),
             "vbegin": float(vbegin),
             "iintermediate": int(iint),
-            "hintermediate": float(self._hv[iint]),
-            "vintermediate": float(self._vv[iint]),
+            "hintermediate": float(hv_at(iint)),
+            "vintermediate": float(vv_at(iint)),
             "iend": int(iend),
             "hend": float(hend),
             "vend": float(vend),
         }
 
-    def __extract_runt_edges(self, edge_type: Type, begin: np.int_, end: np.int_) -> tuple[Edge, Edge]:
-        """Extracts a combination of runt edges from the ``begin`` of the first edge and the ``end`` of the
+    def __extract_edges(self, spans: Sequence[tuple[Type, np.int_, np.int_]]) -> list[Edge]:
+        """Extracts several edges from their types and their ``begin`` and ``end`` values, where the runt types
+        denote a combination of runt edges from the ``begin`` of the first edge, with that type, to the ``end`` of the
         last edge.
 
-        :param edge_type: The type of the first edge to extract.
-        :param begin: The value for the beginning of the edge.
-        :param end: The value for the end of the edge.
-        :raise EdgesError: The type of edge to extract must be a runt type of edge.
+        :param spans: The type, the value for the beginning and the value for the end of each edge.
         :raise EdgesError: The ``end`` reference value is not in the range `0 <= end < len(values)`.
         :raise EdgesError: The ``begin`` reference value is not in the range `0 <= begin < len(values)`.
         :raise EdgesError: The ``begin`` and end reference values is do not satisfy `begin < end`.
-        :return: The two runt edges extracted."""
-        # Ensure the edge type is a runt edge.
-        if edge_type not in (Type.FALLING_RUNT, Type.RISING_RUNT):
-            raise EdgesError("The type of edge to extract must be of runt type.")
-        # Ensure the begin value is in the range 0 <= begin < len(values).
-        if begin < 0 or begin >= len(self._vv):
-            raise EdgesError(f"The begin, {begin}, reference value is not in the range 0 <= begin < len(values).")
-        # Ensure the end value is in the range 0 <= end < len(values).
-        if end < 0 or end >= len(self._vv):
-            raise EdgesError(f"The end, {end}, reference value is not in the range 0 <= end < len(values).")
-        # Ensure the begin occurs before the end.
-        if begin >= end:
-            raise EdgesError(f"The begin, {begin}, and end, {end}, reference values do not satisfy begin < end.")
+        :raise EdgesError: A combination of runt edges can't be split in two runt edges.
+        :return: The edges extracted, with two edges for each combination of runt edges."""
+        # Split all the combinations of runt edges at once.
+        runts = [span for span in spans if span[0] in (Type.FALLING_RUNT, Type.RISING_RUNT)]
+        (first_end, second_begin) = self.__split_runt_edges(
+            np.array([i[0] for i in runts], dtype=np.int_),
+            np.array([i[1] for i in runts], dtype=np.int_),
+            np.array([i[2] for i in runts], dtype=np.int_),
+        )
+
+        # Read the values from the arrays of the signal if they are already ``numpy.float64``, as the edges are
+        # extracted one at a time, otherwise only the values needed are calculated, and do the same for the levels.
+        (hv_at, vv_at) = (self._hv_at, self._vv_at)
+        hv_axis = self._hv_axis
+        if self._codes is None and self._vv.dtype == np.float_ and isinstance(hv_axis, np.ndarray):
+            (hv_at, vv_at) = (hv_axis.__getitem__, self._vv.__getitem__)
+        values = (hv_at, vv_at, self.__level_values(self.__state_levels, "intermediate"))
+
+        # Extract the edges, with the combinations of runt edges in the order they were split.
+        edges = []
+        runt_index = 0
+        for edge_type, begin, end in spans:
+            if edge_type is Type.FALLING_RUNT:
+                edges.append(self.__extract_edge(Type.FALLING_RUNT, begin, first_end[runt_index], values))
+                edges.append(self.__extract_edge(Type.RISING_RUNT, second_begin[runt_index], end, values))
+                runt_index += 1
+            elif edge_type is Type.RISING_RUNT:
+                edges.append(self.__extract_edge(Type.RISING_RUNT, begin, first_end[runt_index], values))
+                edges.append(self.__extract_edge(Type.FALLING_RUNT, second_begin[runt_index], end, values))
+                runt_index += 1
+            else:
+                edges.append(self.__extract_edge(edge_type, begin, end, values))
+
+        return edges
+
+    def __split_runt_edges(
+        self, types: npt.NDArray[np.int_], begin: npt.NDArray[np.int_], end: npt.NDArray[np.int_]
+    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+        """Splits several combinations of runt edges from the ``begin`` of the first edge and the ``end`` of the
+        last edge in the two runt edges, using the state levels of the portion of the signal with the runt edges.
+
+        The state levels of all the portions are calculated at once, and the portions are split at once.
+
+        :param types: The types of the first edge of each combination, which must be runt types of edges.
+        :param begin: The values for the beginning of the first edges.
+        :param end: The values for the end of the last edges.
+        :raise EdgesError: The ``end`` and ``begin`` reference values do not satisfy `0 <= begin < end < len(values)`.
+        :raise EdgesError: A combination of runt edges can't be split in two runt edges.
+        :return: The values for the end of the first edges and the values for the beginning of the last edges."""
+        # Nothing to split if there are no combinations of runt edges.
+        if len(types) == 0:
+            return (np.empty(0, dtype=np.int_), np.empty(0, dtype=np.int_))
+        # Ensure the begin and end values are in the signal and the begin occurs before the end.
+        if np.any(begin < 0) or np.any(begin >= end) or np.any(end >= self._length):
+            raise EdgesError("The begin and end reference values do not satisfy 0 <= begin < end < len(values).")
+
+        # Calculate the state levels for the portions of the signal with the runt edges.
+        # TODO: Allow to get these from outside, for now use defaults.
+        levels = self._state_levels_segments(begin, end)
+
+        # Gather the values of all the portions one after the other, with the position of each value in its portion.
+        lengths = end - begin + 1
+        offsets = np.cumsum(lengths) - lengths
+        portions = np.repeat(np.arange(0, len(begin)), lengths)
+        positions = np.arange(0, np.sum(lengths)) - offsets[portions]
+        values = self._vv_at(begin[portions] + positions)
+
+        # Extract 'low' area of each portion for falling runt edges, and 'high' area for rising runt edges.
+        area = np.where(
+            (types == Type.FALLING_RUNT)[portions], values < levels.low[portions], values > levels.high[portions]
+        )
+
+        # Calculate end of the first edge as the first point, not 'begin', in the area.
+        first = np.flatnonzero(area & (positions > 0))
+        first_index = np.searchsorted(first, offsets, "left")
+        # Calculate begin of the last edge as the last point, not 'end', in the area.
+        last = np.flatnonzero(area & (positions < lengths[portions] - 1))
+        last_index = np.searchsorted(last, offsets + lengths, "left") - 1
+
+        # Ensure both points exist in each portion.
+        if (
+            np.any(first_index >= len(first))
+            or np.any(first[np.minimum(first_index, len(first) - 1)] >= offsets + lengths)
+            or np.any(last_index < 0)
+            or np.any(last[np.maximum(last_index, 0)] < offsets)
+        ):
+            raise EdgesError("A combination of runt edges can't be split in two runt edges.")
+
+        return (begin + first[first_index] - offsets, begin + last[last_index] - offsets)
+
+    def __level_values(
+        self,
+        levels: StateLevels | StateLevelsArray,
+        level_id: Literal["high", "high_runt", "intermediate", "low_runt", "low"],
+    ) -> npt.NDArray[np.float_]:
+        """Obtains the value of a level for each value of the signal, as a read-only view without copies for state
+        levels that do not vary over the signal.
+
+        :param levels: The state levels for the signal, either the same for all the values or one for each value.
+        :param level_id: The level identifier.
+        :return: A `1xN` array with the value of the level for each value of the signal."""
+        if isinstance(levels, StateLevelsArray):
+            return getattr(levels, level_id)
+        return np.broadcast_to(np.float_(getattr(levels, level_id)), (self._length,))
+
+    def __area_labels(self, levels: StateLevels | StateLevelsArray) -> npt.NDArray[np.int8]:
+        """Labels each value of the signal with the band between the state levels provided it falls in, the areas
+        of each value can be then derived from its label.
+
+        :param levels: The state levels for the signal, either the same for all the values or one for each value.
+        :raise EdgesError: The state levels do not satisfy `low < low_runt < intermediate < high_runt < high`.
+        :raise EdgesError: The state levels do not have one level for each value of the signal.
+        :return: A `1xN` array with the labels of each value of the signal."""
+        # Sanity check on the levels, which can vary over the signal.
+        if isinstance(levels, StateLevelsArray):
+            if len(levels) != self._length:
+                raise EdgesError("The state levels do not have one level for each value of the signal.")
+            valid = np.all(
+                (levels.low < levels.low_runt)
+                & (levels.low_runt < levels.intermediate)
+                & (levels.intermediate < levels.high_runt)
+                & (levels.high_runt < levels.high)
+            )
+        else:
+            valid = levels.low < levels.low_runt < levels.intermediate < levels.high_runt < levels.high
+        if not valid:
+            raise EdgesError("The state levels do not satisfy low < low_runt < intermediate < high_runt < high.")
 
-        # Build temporary signal from the portion of the signal with the runt edges, and calculate the state
-        # levels for that area. TODO: Allow to get these from outside, for now use defaults.
-        hvalues = self._hv[begin : end + 1]
-        vvalues = self._vv[begin : end + 1]
-        self.__area_signal.load(hvalues, vvalues)
-        (state_levels, _) = self.__area_signal.state_levels()
-        edges: list[Edge] = []
-
-        if edge_type is Type.FALLING_RUNT:
-            # Extract 'low' area of the area signal.
-            low_area = np.where(vvalues < np.float_(state_levels.low))[0]
-
-            # Calculate end of the falling edge as the first point, not 'begin', in the 'low' area.
-            edge_begin = begin
-            edge_end = begin + low_area[0] if low_area[0] > 0 else begin + low_area[1]
-            edges.append(self.__extract_edge(Type.FALLING_RUNT, edge_begin, edge_end))
-
-            # Calculate begin of the rising edge as the last point, not 'end', in the 'low' area.
-            edge_begin = begin + low_area[-1] if low_area[-1] < (len(vvalues) - 1) else begin + low_area[-2]
-            edge_end = end
-            edges.append(self.__extract_edge(Type.RISING_RUNT, edge_begin, edge_end))
+        # The labels for the same state levels over the whole signal are cached, and read-only as they are shared.
+        if isinstance(levels, StateLevels):
+            ids = ("low", "low_runt", "intermediate", "high_runt", "high")
+            key = ("edges_labels", *(float(getattr(levels, i)) for i in ids))
+            return self._cached(key, lambda: self.__area_labels_values(levels))
+        return self.__area_labels_values(levels)
+
+    def __area_labels_values(self, levels: StateLevels | StateLevelsArray) -> npt.NDArray[np.int8]:
+        """Computes the labels of the values of the signal from the state levels provided, which are already checked.
+
+        :param levels: The state levels for the signal, either the same for all the values or one for each value.
+        :return: A read-only `1xN` array with the labels of each value of the signal."""
+        # For signals created from codes, label the value of each possible code, and then look up the label of each
+        # code, which is the same as comparing the codes with the state levels quantized to codes.
+        (codes, code_values) = (self._codes, self._code_values)
+        labels = (
+            self.__values_labels(code_values, levels)[codes]
+            if codes is not None and code_values is not None and isinstance(levels, StateLevels)
+            else self.__values_labels(self._vv, levels)
+        )
+        labels.flags.writeable = False
+
+        return labels
+
+    @staticmethod
+    def __threshold(level: npt.ArrayLike, dtype: np.dtype, inclusive: bool) -> npt.NDArray:
+        """Converts a level to the data type of the values it is compared with, such that the comparison of the values
+        with the level converted is the same as the exact comparison of the values with the level.
+
+        For `value >= level` the level is converted to the lowest value of the data type that is not below it, and for
+        `value > level` to the highest value of the data type that is not above it.
+
+        :param level: The level, or a `1xN` array with a level for each value.
+        :param dtype: The data type of the values.
+        :param inclusive: Whether the values equal to the level are above it, `value >= level`, or not, `value > level`.
+        :return: The level converted to the data type of the values."""
+        level = np.asarray(level, dtype=np.float_)
+        if dtype == level.dtype:
+            return level
+        converted = level.astype(dtype)
+        if inclusive:
+            return np.where(converted < level, np.nextafter(converted, dtype.type(np.inf)), converted)
+        return np.where(converted > level, np.nextafter(converted, dtype.type(-np.inf)), converted)
+
+    @classmethod
+    def __values_labels(
+        cls, values: npt.NDArray[np.float_], levels: StateLevels | StateLevelsArray
+    ) -> npt.NDArray[np.int8]:
+        """Labels each of the values given with the band between the state levels provided it falls in.
+
+        :param values: A `1xN` array with the values.
+        :param levels: The state levels, either the same for all the values or one for each value.
+        :return: A `1xN` array with the labels of each value."""
+        # Each value is labelled with the number of levels it is above of, reusing the same mask for each level.
+        labels = np.zeros(len(values), dtype=np.int8)
+        mask = np.empty(len(values), dtype=np.bool_)
+        (low, low_runt) = (cls.__threshold(getattr(levels, i), values.dtype, True) for i in ("low", "low_runt"))
+        (intermediate, high_runt, high) = (
+            cls.__threshold(getattr(levels, i), values.dtype, False) for i in ("intermediate", "high_runt", "high")
+        )
+        np.add(labels, np.greater_equal(values, low, out=mask), out=labels)
+        np.add(labels, np.greater_equal(values, low_runt, out=mask), out=labels)
+        np.add(labels, np.greater(values, intermediate, out=mask), out=labels)
+        np.add(labels, np.greater(values, high_runt, out=mask), out=labels)
+        np.add(labels, np.greater(values, high, out=mask), out=labels)
+
+        # Values that can't be compared, such as NaN values, do not belong to any area.
+        if np.any(np.isnan(values, out=mask)):
+            labels[mask] = cls.__LABEL_NONE
+
+        return labels
+
+    def __edges_vectorized(
+        self, levels: StateLevels | StateLevelsArray, output: Output
+    ) -> EdgeTable | EdgeIndices | EdgeCounts:
+        """Extracts the edges in the signal from the state levels given, by finding the transitions between the
+        ``high`` and ``low`` areas with array operations rather than walking the signal edge by edge.
+
+        Consecutive values with the same label are grouped in runs, the runs in the ``high`` and ``low`` areas
+        drive the state machine, and the following transitions between consecutive runs of those are possible:
+
+            - From ``high`` to ``low``, which is a falling edge.
+            - From ``low`` to ``high``, which is a rising edge.
+            - From ``high`` to ``high``, which is a runt falling edge and a runt rising edge if there is a value in
+              ``runt_low`` between them, and no edge otherwise.
+            - From ``low`` to ``low``, which is a runt rising edge and a runt falling edge if there is a value in
+              ``runt_high`` between them, and no edge otherwise.
+
+        :param levels: State levels.
+        :param output: The output to return for the edges.
+        :raise EdgesError: Invalid state levels.
+        :return: The edges found in order of appearance in the signal, in the output requested."""
+        # pylint: disable=too-many-locals
+
+        # Label values and group them in runs, with the indices of the first and last value of each run.
+        labels = self.__area_labels(levels)
+        rbegin = np.flatnonzero(labels[1:] != labels[:-1]) + 1
+        rend = np.append(rbegin - 1, len(labels) - 1)
+        rbegin = np.insert(rbegin, 0, 0)
+        rlabels = labels[rbegin]
+
+        # Find the runs in 'high' and 'low' areas, at least two are required for an edge to exist.
+        runs = np.flatnonzero((rlabels == self.__LABEL_HIGH) | (rlabels == self.__LABEL_LOW))
+        if len(runs) < 2:
+            if output is not Output.TABLE:
+                return self.__spans_output(output, *(np.empty(0, dtype=np.int_) for _ in range(0, 3)))
+            return EdgeTable()
+        (prev_runs, next_runs) = (runs[:-1], runs[1:])
+        from_high = rlabels[prev_runs] == self.__LABEL_HIGH
+        to_high = rlabels[next_runs] == self.__LABEL_HIGH
+
+        # Check for values in 'runt_low' or 'runt_high' between consecutive runs from the accumulated number of runs.
+        runt_low_runs = np.cumsum(self.__AREA_LABELS[self.__RUNT_LOW][rlabels])
+        runt_high_runs = np.cumsum(self.__AREA_LABELS[self.__RUNT_HIGH][rlabels])
+        runt_low = (runt_low_runs[next_runs - 1] - runt_low_runs[prev_runs]) > 0
+        runt_high = (runt_high_runs[next_runs - 1] - runt_high_runs[prev_runs]) > 0
+
+        # Classify the transitions, and discard those that are not edges.
+        conditions = (
+            from_high & ~to_high,
+            ~from_high & to_high,
+            from_high & to_high & runt_low,
+            ~from_high & ~to_high & runt_high,
+        )
+        types = np.select(conditions, (Type.FALLING, Type.RISING, Type.FALLING_RUNT, Type.RISING_RUNT), 0)
+        transitions = np.flatnonzero(types)
+        types = types[transitions]
+        # The begin of the edge is the last value of the run before, and the end the first value of the run after.
+        ibegin = rend[prev_runs[transitions]]
+        iend = rbegin[next_runs[transitions]]
+        if output is not Output.TABLE:
+            return self.__spans_output(output, types, ibegin, iend)
+
+        # Split the pairs of runt edges in two edges.
+        (types, ibegin, iend) = self.__split_spans(types, ibegin, iend)
+
+        # Calculate the intermediate points of all the edges, and build the table with them.
+        iint = self.__intermediate_vectorized(levels, (rbegin, rend, rlabels), types, ibegin, iend)
+
+        return self.__build_table(types, ibegin, iint, iend)
+
+    def __split_spans(
+        self, types: npt.NDArray[np.int_], ibegin: npt.NDArray[np.int_], iend: npt.NDArray[np.int_]
+    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+        """Splits the combinations of runt edges among the spans of several edges in two edges each.
+
+        :param types: The types of the edges, where the runt types denote a combination of runt edges with the type of
+            the first edge.
+        :param ibegin: The values for the beginning of the edges.
+        :param iend: The values for the end of the edges.
+        :raise EdgesError: A combination of runt edges can't be split in two runt edges.
+        :return: The types, the values for the beginning and the values for the end of the edges after the split."""
+        # Each pair of runt edges is split in two edges, the first one keeps the type of the transition.
+        count = np.where((types == Type.FALLING_RUNT) | (types == Type.RISING_RUNT), 2, 1)
+        first = np.cumsum(count) - count
+        (types, ibegin, iend) = (np.repeat(types, count), np.repeat(ibegin, count), np.repeat(iend, count))
+        pairs = first[count == 2]
+        (iend[pairs], ibegin[pairs + 1]) = self.__split_runt_edges(types[pairs], ibegin[pairs], iend[pairs])
+        types[pairs + 1] = np.where(types[pairs] == Type.FALLING_RUNT, Type.RISING_RUNT, Type.FALLING_RUNT)
+
+        return (types, ibegin, iend)
+
+    def __spans_output(
+        self, output: Output, types: npt.NDArray[np.int_], ibegin: npt.NDArray[np.int_], iend: npt.NDArray[np.int_]
+    ) -> EdgeIndices | EdgeCounts:
+        """Obtains the output requested, other than the table, from the spans of several edges.
+
+        :param output: The output to return for the edges, other than :attr:`.Output.TABLE`.
+        :param types: The types of the edges, where the runt types denote a combination of runt edges with the type of
+            the first edge.
+        :param ibegin: The values for the beginning of the edges.
+        :param iend: The values for the end of the edges.
+        :raise EdgesError: A combination of runt edges can't be split in two runt edges.
+        :return: The indices or the counts of the edges."""
+        # Each combination of runt edges has one edge of each runt type, thus the counts do not require the split.
+        if output is Output.COUNTS:
+            runts = int(np.count_nonzero((types == Type.FALLING_RUNT) | (types == Type.RISING_RUNT)))
+            return {
+                Type.FALLING: int(np.count_nonzero(types == Type.FALLING)),
+                Type.FALLING_RUNT: runts,
+                Type.RISING: int(np.count_nonzero(types == Type.RISING)),
+                Type.RISING_RUNT: runts,
+            }
+
+        (types, ibegin, iend) = self.__split_spans(types, ibegin, iend)
+        return (ibegin, iend, types.astype(np.int8))
+
+    def __edges_jit(
+        self, levels: StateLevels | StateLevelsArray, output: Output
+    ) -> EdgeTable | EdgeIndices | EdgeCounts:
+        """Extracts the edges in the signal from the state levels given, by walking the labels of the values of the
+        signal one value at a time with the kernels in :mod:`~.edges.jit`, compiled to native code if possible.
+
+        :param levels: State levels.
+        :param output: The output to return for the edges.
+        :raise EdgesError: Invalid state levels.
+        :return: The edges found in order of appearance in the signal, in the output requested."""
+        (spans_kernel, intermediates_kernel) = jit.kernels()
+
+        # Find the spans of the edges, with a second pass in the unlikely case the initial buffers were not enough.
+        labels = self.__area_labels(levels)
+        (runt_low, runt_high) = (self.__AREA_LABELS[self.__RUNT_LOW], self.__AREA_LABELS[self.__RUNT_HIGH])
+        size = len(labels) // 16 + 16
+        for _ in range(0, 2):
+            (types, ibegin, iend) = (np.empty(size, dtype=np.int_) for _ in range(0, 3))
+            count = spans_kernel(labels, self.__LABEL_HIGH, self.__LABEL_LOW, runt_low, runt_high, types, ibegin, iend)
+            if count <= size:
+                break
+            size = count
+        (types, ibegin, iend) = (types[:count], ibegin[:count], iend[:count])
+        if output is not Output.TABLE:
+            return self.__spans_output(output, types, ibegin, iend)
+
+        # Split the pairs of runt edges in two edges.
+        (types, ibegin, iend) = self.__split_spans(types, ibegin, iend)
+
+        # Calculate the intermediate points of all the edges, and build the table with them.
+        if self.__int_policy is IntPointPolicy.POLICY_0:
+            iint = np.empty_like(ibegin)
+            intermediates_kernel(
+                labels,
+                self._vv,
+                self.__AREA_LABELS[self.__INT_HIGH],
+                self.__AREA_LABELS[self.__INT_LOW],
+                self.__level_values(levels, "intermediate"),
+                types,
+                ibegin,
+                iend,
+                iint,
+            )
         else:
-            # Extract 'high' area of the area signal.
-            high_area = np.where(vvalues > np.float_(state_levels.high))[0]
+            falling = (types == Type.FALLING) | (types == Type.FALLING_RUNT)
+            iint = np.where(falling == (self.__int_policy is IntPointPolicy.POLICY_1), ibegin, iend)
+
+        return self.__build_table(types, ibegin, iint, iend)
 
-            # Calculate end of the rising edge as the first point, not 'begin', in the 'high' area.
-            edge_begin = begin
-            edge_end = begin + high_area[0] if high_area[0] > 0 else begin + high_area[1]
-            edges.append(self.__extract_edge(Type.RISING_RUNT, edge_begin, edge_end))
+    def __runs_first(
+        self,
+        runs: tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int8]],
+        area_id: int,
+        begin: npt.NDArray[np.int_],
+        end: npt.NDArray[np.int_],
+    ) -> npt.NDArray[np.int_]:
+        """Obtains the first value in the area specified between each of the given ``begin`` and ``end`` values, from
+        the runs of values with the same label.
+
+        :param runs: The indices of the first and last value of each run, and the label of each run.
+        :param area_id: The area identifier.
+        :param begin: The values to use as reference for the beginning of the search.
+        :param end: The values to use as reference for the end of the search.
+        :return: The values that satisfy ``begin <= value < end``, or ``-1`` where no value exists."""
+        # Get the runs in the area, and check if empty.
+        in_area = self.__AREA_LABELS[area_id][runs[2]]
+        (abegin, aend) = (runs[0][in_area], runs[1][in_area])
+        if len(abegin) == 0:
+            return np.full_like(begin, -1)
+
+        # Obtain the first run that ends at or after begin, the value is the begin or the first value of the run.
+        index = np.searchsorted(aend, begin, "left")
+        value = np.maximum(abegin[np.minimum(index, len(abegin) - 1)], begin)
+
+        return np.where((index < len(abegin)) & (value < end), value, -1)
+
+    def __runs_last(
+        self,
+        runs: tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int8]],
+        area_id: int,
+        end: npt.NDArray[np.int_],
+        begin: npt.NDArray[np.int_],
+    ) -> npt.NDArray[np.int_]:
+        """Obtains the last value in the area specified between each of the given ``begin`` and ``end`` values, from
+        the runs of values with the same label.
+
+        :param runs: The indices of the first and last value of each run, and the label of each run.
+        :param area_id: The area identifier.
+        :param end: The values to use as reference for the end of the search.
+        :param begin: The values to use as reference for the beginning of the search.
+        :return: The values that satisfy ``begin <= value < end``, or ``-1`` where no value exists."""
+        # Get the runs in the area, and check if empty.
+        in_area = self.__AREA_LABELS[area_id][runs[2]]
+        (abegin, aend) = (runs[0][in_area], runs[1][in_area])
+        if len(abegin) == 0:
+            return np.full_like(begin, -1)
+
+        # Obtain the last run that starts before end, the value is the value before end or the last value of the run.
+        index = np.searchsorted(abegin, end, "left") - 1
+        value = np.minimum(aend[np.maximum(index, 0)], end - 1)
+
+        return np.where((index >= 0) & (value >= begin), value, -1)
+
+    def __intermediate_vectorized(
+        self,
+        levels: StateLevels | StateLevelsArray,
+        runs: tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int8]],
+        types: npt.NDArray[np.int_],
+        ibegin: npt.NDArray[np.int_],
+        iend: npt.NDArray[np.int_],
+    ) -> npt.NDArray[np.int_]:
+        """Calculates the intermediate points of several edges at once, following the same criteria as for a single
+        edge in :meth:`.EdgesMixin.__extract_edge`.
 
-            # Calculate begin of the falling edge as the last point, not 'end', in the 'high' area.
-            edge_begin = begin + high_area[-1] if high_area[-1] < (len(vvalues) - 1) else begin + high_area[-2]
-            edge_end = end
-            edges.append(self.__extract_edge(Type.FALLING_RUNT, edge_begin, edge_end))
+        :param levels: The state levels for the signal.
+        :param runs: The indices of the first and last value of each run, and the label of each run.
+        :param types: The types of the edges.
+        :param ibegin: The values for the beginning of the edges.
+        :param iend: The values for the end of the edges.
+        :return: The values for the intermediate points of the edges."""
+        # pylint: disable=too-many-arguments,too-many-locals
+
+        falling = (types == Type.FALLING) | (types == Type.FALLING_RUNT)
+
+        # Check intermediate point policy for forced values, otherwise proceed with calculation.
+        if self.__int_policy is IntPointPolicy.POLICY_1:
+            return np.where(falling, ibegin, iend)
+        if self.__int_policy is IntPointPolicy.POLICY_2:
+            return np.where(falling, iend, ibegin)
+
+        # For falling edges, the candidates are the last value in 'int_high' and the first value in 'int_low' after it.
+        (fbegin, fend) = (ibegin[falling], iend[falling])
+        int_high_f = self.__runs_last(runs, self.__INT_HIGH, fend, fbegin)
+        int_low_f = self.__runs_first(runs, self.__INT_LOW, np.where(int_high_f >= 0, int_high_f, fbegin), fend)
+
+        # For rising edges, the candidates are the last value in 'int_low' and the first value in 'int_high' after it.
+        (rbegin, rend) = (ibegin[~falling], iend[~falling])
+        int_low_r = self.__runs_last(runs, self.__INT_LOW, rend, rbegin)
+        int_high_r = self.__runs_first(runs, self.__INT_HIGH, np.where(int_low_r >= 0, int_low_r, rbegin), rend)
+
+        # Merge the candidates of both types of edges, where a negative value means that the candidate does not exist.
+        (int_high, int_low) = (np.empty_like(ibegin), np.empty_like(ibegin))
+        (int_high[falling], int_high[~falling]) = (int_high_f, int_high_r)
+        (int_low[falling], int_low[~falling]) = (int_low_f, int_low_r)
+
+        # Calculate distance to the intermediate level from all candidates, non existing ones are never the nearest.
+        indices = np.stack((ibegin, iend, int_high, int_low), axis=1)
+        diffs = np.abs(
+            self._vv_at(np.maximum(indices, 0)) - self.__level_values(levels, "intermediate")[np.maximum(indices, 0)]
+        )
+        diffs[indices < 0] = np.inf
+
+        # Take the index of the point that is the nearest to the intermediate level.
+        return indices[np.arange(0, len(indices)), np.argmin(diffs, axis=1)]
+
+    def __states_labels(self, levels: Sequence[StateLevels]) -> npt.NDArray[np.int16]:
+        """Labels each value of the signal with the state it is in, for state levels of several pairs of adjacent
+        states, where a value is in a state if it is above the ``high`` level of the pair below the state and below
+        the ``low`` level of the pair above the state.
+
+        :param levels: The state levels of each pair of adjacent states, from the lowest to the highest.
+        :raise EdgesError: No state levels are given.
+        :raise EdgesError: The state levels of a pair do not satisfy `low < low_runt < intermediate < high_runt < high`.
+        :raise EdgesError: The state levels of the pairs do not satisfy `high < low` for consecutive pairs.
+        :return: A `1xN` array with the state of each value of the signal, or `-1` for values in no state."""
+        # Sanity check on the levels, the 'low' and 'high' levels of all the pairs must be increasing.
+        if len(levels) == 0:
+            raise EdgesError("The state levels of at least one pair of states must be given.")
+        for level in levels:
+            if not level.low < level.low_runt < level.intermediate < level.high_runt < level.high:
+                raise EdgesError("The state levels do not satisfy low < low_runt < intermediate < high_runt < high.")
+        thresholds = np.array([(level.low, level.high) for level in levels], dtype=np.float_)
+        if np.any(thresholds[1:, 0] <= thresholds[:-1, 1]):
+            raise EdgesError("The state levels of consecutive pairs of states do not satisfy high < low.")
+
+        # Each value is labelled with the number of levels it is above of, where an even number means it is in the
+        # state with half that number, for signals created from codes the value of each possible code is labelled.
+        (codes, code_values) = (self._codes, self._code_values)
+        values = code_values if codes is not None and code_values is not None else self._vv
+        labels = np.zeros(len(values), dtype=np.int16)
+        mask = np.empty(len(values), dtype=np.bool_)
+        for low, high in thresholds:
+            np.add(labels, np.greater_equal(values, self.__threshold(low, values.dtype, True), out=mask), out=labels)
+            np.add(labels, np.greater(values, self.__threshold(high, values.dtype, False), out=mask), out=labels)
+        labels = np.where(labels % 2 == 0, labels // 2, -1).astype(np.int16)
+
+        # Values that can't be compared, such as NaN values, are in no state.
+        if np.any(np.isnan(values, out=mask)):
+            labels[mask] = -1
+
+        return labels[codes] if codes is not None and code_values is not None else labels
+
+    def __intermediate_nearest(
+        self, levels: npt.NDArray[np.float_], ibegin: npt.NDArray[np.int_], iend: npt.NDArray[np.int_]
+    ) -> npt.NDArray[np.int_]:
+        """Calculates the intermediate points of several edges at once, as the value of each edge, including its
+        ``begin`` and ``end``, that is the nearest to its intermediate level, the first one for the same distance.
+
+        :param levels: The intermediate level of each edge.
+        :param ibegin: The values for the beginning of the edges.
+        :param iend: The values for the end of the edges.
+        :return: The values for the intermediate points of the edges."""
+        if len(ibegin) == 0:
+            return np.empty(0, dtype=np.int_)
+
+        # Gather the values of all the edges one after the other, and their distances to the intermediate levels.
+        lengths = iend - ibegin + 1
+        offsets = np.cumsum(lengths) - lengths
+        spans = np.repeat(np.arange(0, len(ibegin)), lengths)
+        indices = ibegin[spans] + np.arange(0, np.sum(lengths)) - offsets[spans]
+        diffs = np.abs(self._vv_at(indices) - levels[spans])
+
+        # Take the first value of each edge at the minimum distance.
+        hits = np.flatnonzero(diffs == np.minimum.reduceat(diffs, offsets)[spans])
+        return indices[hits[np.searchsorted(hits, offsets, "left")]]
+
+    def __build_table(
+        self,
+        types: npt.NDArray[np.int_],
+        ibegin: npt.NDArray[np.int_],
+        iint: npt.NDArray[np.int_],
+        iend: npt.NDArray[np.int_],
+    ) -> EdgeTable:
+        """Builds a table of edges from the types and the indices of the points of the edges.
+
+        :param types: The types of the edges.
+        :param ibegin: The values for the beginning of the edges.
+        :param iint: The values for the intermediate points of the edges.
+        :param iend: The values for the end of the edges.
+        :return: The table with the edges."""
+        values = np.empty(len(types), dtype=EdgeTable.DTYPE)
+        values["edge_type"] = types
+        (values["ibegin"], values["hbegin"], values["vbegin"]) = (ibegin, self._hv_at(ibegin), self._vv_at(ibegin))
+        (values["iintermediate"], values["hintermediate"], values["vintermediate"]) = (
+            iint,
+            self._hv_at(iint),
+            self._vv_at(iint),
+        )
+        (values["iend"], values["hend"], values["vend"]) = (iend, self._hv_at(iend), self._vv_at(iend))
+
+        return EdgeTable(values)
+
+    def __edges_partition(
+        self,
+        levels: StateLevels | StateLevelsArray,
+        int_policy: IntPointPolicy,
+        engine: Engine,
+        output: Output,
+        bounds: tuple[int, int],
+    ) -> EdgeTable | EdgeIndices | EdgeCounts:
+        """Extracts the edges in a partition of the signal, with the indices of the edges relative to the signal.
+
+        :param levels: The state levels for the signal, either the same for all the values or one for each value.
+        :param int_policy: The policy to use for intermediate point calculation.
+        :param engine: The engine to use for the extraction of the edges.
+        :param output: The output to return for the edges.
+        :param bounds: The values for the beginning and the end of the partition, both included in the partition.
+        :return: The edges found in order of appearance in the partition, in the output requested."""
+        # pylint: disable=too-many-arguments
+
+        # The partition is a window of the signal, its values are views of the values of the signal.
+        (begin, end) = bounds
+        signal = self.window(self._hv_at(begin), self._hv_at(end))
+        if isinstance(levels, StateLevelsArray):
+            levels = levels[begin : end + 1]
+        edges = signal.edges(levels, int_policy, engine, output=output)
+        if isinstance(edges, EdgeTable):
+            for column in ("ibegin", "iintermediate", "iend"):
+                np.add(edges[column], begin, out=edges[column])
+        elif isinstance(edges, tuple):
+            edges = (edges[0] + begin, edges[1] + begin, edges[2])
+
+        return edges
+
+    def __edges_parallel(
+        self,
+        levels: StateLevels | StateLevelsArray,
+        int_policy: IntPointPolicy,
+        engine: Engine,
+        output: Output,
+        workers: int,
+    ) -> EdgeTable | EdgeIndices | EdgeCounts:
+        """Extracts the edges in the signal from the state levels given, splitting the signal in partitions that
+        are processed in parallel.
+
+        The signal is split at values in the ``high`` or ``low`` areas, the state of the edge search is fully
+        determined at those values and no edge includes them other than as its beginning or end, thus each edge of
+        the signal is found in exactly one partition, as if the signal was processed as a whole.
+
+        :param levels: The state levels for the signal, either the same for all the values or one for each value.
+        :param int_policy: The policy to use for intermediate point calculation.
+        :param engine: The engine to use for the extraction of the edges.
+        :param output: The output to return for the edges.
+        :param workers: The maximum number of partitions to process in parallel.
+        :raise EdgesError: Invalid state levels.
+        :return: The edges found in order of appearance in the signal, in the output requested."""
+        # pylint: disable=too-many-arguments
+        # The search engine runs as regular Python code holding the GIL, thus the threads do not run in parallel.
+        if engine is Engine.SEARCH:
+            self._logger.warning("The search engine holds the GIL, the partitions of the signal run one at a time.")
+
+        # Split the signal evenly at the first value in 'high' or 'low' after each split point, each partition begins
+        # at the value where the previous partition ends.
+        self.__area_update(levels)
+        bounds = [0]
+        for index in range(1, workers):
+            split_value = max(self._length * index // workers, bounds[-1] + 1)
+            if split_value >= self._length - 1:
+                break
+            split_value = self.__area_first((self.__HIGH, self.__LOW), np.int_(split_value))
+            if split_value is None or split_value >= self._length - 1:
+                break
+            bounds.append(int(split_value))
+        bounds.append(self._length - 1)
+
+        # Extract the edges of each partition in parallel, the threads share the values of the signal.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outputs = list(
+                executor.map(
+                    lambda begin, end: self.__edges_partition(levels, int_policy, engine, output, (begin, end)),
+                    bounds[:-1],
+                    bounds[1:],
+                )
+            )
 
-        return (edges[0], edges[1])
+        # Merge the outputs of the partitions, in the same order as the partitions.
+        if output is Output.COUNTS:
+            return {i: sum(j[i] for j in outputs) for i in Type}  # type: ignore
+        if output is Output.INDICES:
+            return tuple(np.concatenate(i) for i in zip(*outputs))  # type: ignore
+        return EdgeTable.concatenate(outputs)  # type: ignore
 
     ## Protected API ###################################################################################################
 
     ## Public API ######################################################################################################
-    def edges(self, levels: StateLevels, int_policy: IntPointPolicy = IntPointPolicy.POLICY_0) -> tuple[Edge, ...]:
+    def edges(
+        self,
+        levels: StateLevels | StateLevelsArray,
+        int_policy: IntPointPolicy = IntPointPolicy.POLICY_0,
+        engine: Engine = Engine.SEARCH,
+        workers: int = 1,
+        output: Output = Output.TABLE,
+    ) -> EdgeTable | EdgeIndices | EdgeCounts:
         """Extracts the edges in the signal from the state levels given.
 
-        :param levels: State levels.
+        :param levels: State levels, or a :class:`.StateLevelsArray` with the state levels for each value of the
+            signal for levels that vary over the signal, see :meth:`.StateLevelsMixin.state_levels_windowed`.
         :param int_policy: The policy to use for intermediate point calculation.
+        :param engine: The engine to use for the extraction of the edges, all engines return the same edges.
+        :param workers: The maximum number of threads used to extract the edges in partitions of the signal, the
+            edges are the same regardless of the number of threads. Only the :attr:`.Engine.VECTORIZED` and
+            :attr:`.Engine.JIT` engines run in parallel in several threads, as they spend most of their time in Numpy
+            operations and compiled kernels that release the GIL. The :attr:`.Engine.SEARCH` engine holds the GIL
+            for most of its time, thus it is not faster with several threads, and a warning is logged in that case.
+        :param output: The output to return for the edges, the outputs other than :attr:`.Output.TABLE` are faster
+            as they do not calculate the intermediate points, in which case the intermediate point policy is ignored.
         :raise EdgesError: Invalid state levels.
+        :raise EdgesError: The number of workers is not a positive number.
         :raise EdgesError: Assertion error in the algorithm for the signal provided.
-        :return: The edges found in order of appearance in the signal."""
-        # pylint: disable=too-complex,too-many-branches,too-many-statements,redefined-variable-type
-
-        # Edges collected.
-        edges = []
+        :return: The edges found in order of appearance in the signal, in the output requested."""
+        # pylint: disable=too-complex,too-many-branches,too-many-statements,too-many-locals,redefined-variable-type
+        # pylint: disable=too-many-arguments,too-many-return-statements
+
+        # Edges collected, with each combination of runt edges as a single span until all of them are split.
+        spans: list[tuple[Type, np.int_, np.int_]] = []
+
+        # Without numba the kernels of the JIT engine run as regular Python code, slower than the search engine.
+        if engine is Engine.JIT and jit.fallback(self._logger):
+            engine = Engine.SEARCH
+
+        # Ensure the number of workers is valid, and split the signal in partitions if more than one is requested.
+        if workers < 1:
+            raise EdgesError(f"The number of workers, {workers}, must be a positive number.")
+        if workers > 1:
+            return self.__edges_parallel(levels, int_policy, engine, output, workers)
+
+        # Use the vectorized engine or the JIT engine if requested, which do not require the areas.
+        if engine is Engine.VECTORIZED:
+            self.__int_policy = int_policy
+            return self.__edges_vectorized(levels, output)
+        if engine is Engine.JIT:
+            self.__int_policy = int_policy
+            return self.__edges_jit(levels, output)
 
         # Update thresholds from the state levels provided.
         self.__area_update(levels)
@@ -438,31 +1147,22 @@ class EdgesMixin:
         self.__int_policy = int_policy
 
         # Set the initial type of edge to look for based on which logical state the signal enters first.
-        high_value = self.__area_first(self.__HIGH, np.int_(0))
-        low_value = self.__area_first(self.__LOW, np.int_(0))
+        first_value = self.__area_first((self.__HIGH, self.__LOW), np.int_(0))
         edge_search: Type
         curr_value: np.int_
-        # There are both 'low' and 'high' values, check which one occurs first.
-        if low_value is not None and high_value is not None:
-            if high_value < low_value:
-                # A 'high' occurs first, thus we are in 'high' looking for a falling edge.
-                curr_value = high_value
-                edge_search = Type.FALLING
-            else:
-                # A 'low' occurs first, thus we are in 'low' looking for a rising edge.
-                curr_value = low_value
-                edge_search = Type.RISING
-        # No 'high' exists, thus we are in 'low' looking for a rising edge.
-        elif low_value is not None and high_value is None:
-            curr_value = low_value
-            edge_search = Type.RISING
-        # No 'low' exists, thus we are in 'high' looking for a falling edge.
-        elif low_value is None and high_value is not None:
-            curr_value = high_value
-            edge_search = Type.FALLING
         # No 'low' nor 'high' exists, which implies there are no edges at all in the signal.
+        if first_value is None:
+            if output is not Output.TABLE:
+                return self.__spans_output(output, *(np.empty(0, dtype=np.int_) for _ in range(0, 3)))
+            return EdgeTable()
+        # A 'high' occurs first, thus we are in 'high' looking for a falling edge.
+        if self.__labels[first_value] == self.__LABEL_HIGH:
+            curr_value = first_value
+            edge_search = Type.FALLING
+        # A 'low' occurs first, thus we are in 'low' looking for a rising edge.
         else:
-            return tuple(edges)
+            curr_value = first_value
+            edge_search = Type.RISING
 
         # Run indefinitely until an exit condition is reached while searching for edges.
         while True:  # pylint: disable=while-used
@@ -478,12 +1178,21 @@ class EdgesMixin:
                 # - One falling edge, which transitions from 'high' to 'low'.
                 # - Two runt edges, one falling from 'high' to 'runt_low', one rising from 'runt_low' to 'high'.
 
-                # Get the first value in 'low' from the current index.
-                low_value = self.__area_first(self.__LOW, curr_value)
-                # Get the first value in 'runt_low' from the current index.
-                runt_low_value = self.__area_first(self.__RUNT_LOW, curr_value)
-                # Get the first value in 'high' after 'runt_low' current index, if it exists.
-                high_value = None if runt_low_value is None else self.__area_first(self.__HIGH, runt_low_value)
+                # Only the first of the values below are relevant to determine the edges, thus the searches stop as
+                # soon as the type of the edge is known, values not searched for are set to 'None'.
+                (low_value, runt_low_value, high_value) = (None, None, None)
+                # Get the first value in 'low' or 'runt_low' from the current index, whichever occurs first.
+                next_value = self.__area_first((self.__LOW, self.__RUNT_LOW), curr_value)
+                if next_value is not None and self.__labels[next_value] == self.__LABEL_LOW:
+                    low_value = next_value
+                elif next_value is not None:
+                    runt_low_value = next_value
+                    # Get the first value in 'low' or 'high' after 'runt_low', whichever occurs first.
+                    next_value = self.__area_first((self.__LOW, self.__HIGH), runt_low_value)
+                    if next_value is not None and self.__labels[next_value] == self.__LABEL_HIGH:
+                        high_value = next_value
+                    else:
+                        low_value = next_value
 
                 # If there is a value in both 'low' and 'runt_low', then 'high' and ordering needs to be checked.
                 if low_value is not None and runt_low_value is not None:
@@ -528,8 +1237,8 @@ class EdgesMixin:
                     # The end of edge is the calculated 'low'.
                     edge_end_value = low_value
 
-                    # Extract single edge.
-                    edges.append(self.__extract_edge(Type.FALLING, edge_begin_value, edge_end_value))
+                    # Keep single edge, extracted with all the others.
+                    spans.append((Type.FALLING, edge_begin_value, edge_end_value))
 
                     # Move current index to the end of the edge, in 'low'.
                     curr_value = edge_end_value
@@ -549,8 +1258,8 @@ class EdgesMixin:
                     # The end of the runt area is 'high'.
                     edge_end_value = high_value
 
-                    # Extract runt edges.
-                    edges.extend(self.__extract_runt_edges(Type.FALLING_RUNT, edge_begin_value, edge_end_value))
+                    # Keep runt edges, split and extracted with all the others.
+                    spans.append((Type.FALLING_RUNT, edge_begin_value, edge_end_value))
 
                     # Move current index to the end of the edge, in 'high'.
                     curr_value = edge_end_value
@@ -562,12 +1271,21 @@ class EdgesMixin:
                 # - One rising edge, which transitions from 'low' to 'high'.
                 # - Two runt edges, one rising from 'low' to 'runt_high', one falling from 'runt_high' to 'low'.
 
-                # Get the first value in 'high' from the current index.
-                high_value = self.__area_first(self.__HIGH, curr_value)
-                # Get the first value in 'runt_high' from the current index.
-                runt_high_value = self.__area_first(self.__RUNT_HIGH, curr_value)
-                # Get the first value in 'low' after 'runt_high' current index, if it exists.
-                low_value = None if runt_high_value is None else self.__area_first(self.__LOW, runt_high_value)
+                # Only the first of the values below are relevant to determine the edges, thus the searches stop as
+                # soon as the type of the edge is known, values not searched for are set to 'None'.
+                (high_value, runt_high_value, low_value) = (None, None, None)
+                # Get the first value in 'high' or 'runt_high' from the current index, whichever occurs first.
+                next_value = self.__area_first((self.__HIGH, self.__RUNT_HIGH), curr_value)
+                if next_value is not None and self.__labels[next_value] == self.__LABEL_HIGH:
+                    high_value = next_value
+                elif next_value is not None:
+                    runt_high_value = next_value
+                    # Get the first value in 'high' or 'low' after 'runt_high', whichever occurs first.
+                    next_value = self.__area_first((self.__HIGH, self.__LOW), runt_high_value)
+                    if next_value is not None and self.__labels[next_value] == self.__LABEL_LOW:
+                        low_value = next_value
+                    else:
+                        high_value = next_value
 
                 # If there is a value in both 'high' and 'runt_high', then 'low' and ordering needs to be checked.
                 if high_value is not None and runt_high_value is not None:
@@ -612,8 +1330,8 @@ class EdgesMixin:
                     # The end of edge is the calculated 'high'.
                     edge_end_value = high_value
 
-                    # Extract single edge.
-                    edges.append(self.__extract_edge(Type.RISING, edge_begin_value, edge_end_value))
+                    # Keep single edge, extracted with all the others.
+                    spans.append((Type.RISING, edge_begin_value, edge_end_value))
 
                     # Move current index to the end of the edge, in 'high'.
                     curr_value = edge_end_value
@@ -634,19 +1352,132 @@ class EdgesMixin:
                     # The end of the edge is 'low'.
                     edge_end_value = low_value
 
-                    # Extract runt edges.
-                    edges.extend(self.__extract_runt_edges(Type.RISING_RUNT, edge_begin_value, edge_end_value))
+                    # Keep runt edges, split and extracted with all the others.
+                    spans.append((Type.RISING_RUNT, edge_begin_value, edge_end_value))
 
                     # Move current index to the end of the edge, in 'low'.
                     curr_value = edge_end_value
                     # Continue looking for rising edges.
                     edge_search = Type.RISING
 
-        return tuple(edges)
+        # Extract the edges from the spans, only for the table as other outputs do not require the values.
+        if output is not Output.TABLE:
+            return self.__spans_output(
+                output,
+                np.array([i[0] for i in spans], dtype=np.int_),
+                np.array([i[1] for i in spans], dtype=np.int_),
+                np.array([i[2] for i in spans], dtype=np.int_),
+            )
+        return EdgeTable.from_edges(self.__extract_edges(spans))
+
+    def iter_edges(
+        self,
+        levels: StateLevels | StateLevelsArray,
+        int_policy: IntPointPolicy = IntPointPolicy.POLICY_0,
+        start: int | None = None,
+        stop: int | None = None,
+        engine: Engine = Engine.SEARCH,
+    ) -> Iterator[Edge]:
+        """Iterates over the edges in the signal from the state levels given, as they are found.
+
+        The signal is processed in blocks that double in size, each edge is yielded as soon as the block where it
+        completes is processed, thus the cost of obtaining the first edges is proportional to their position in the
+        signal rather than to the length of the signal, and no further work is done once the iteration stops.
+
+        The edges are the same as those returned by :meth:`.EdgesMixin.edges` for the portion of the signal between
+        ``start`` and ``stop``, with their indices relative to the signal.
+
+        :param levels: State levels, or a :class:`.StateLevelsArray` with the state levels for each value of the
+            signal for levels that vary over the signal, see :meth:`.StateLevelsMixin.state_levels_windowed`.
+        :param int_policy: The policy to use for intermediate point calculation.
+        :param start: The index of the first value of the portion of the signal to search, defaults to the first value.
+        :param stop: The index after the last value of the portion of the signal to search, defaults to the end.
+        :param engine: The engine to use for the extraction of the edges, all engines return the same edges.
+        :raise EdgesError: Invalid state levels.
+        :raise EdgesError: The ``start`` and ``stop`` values do not satisfy `0 <= start <= stop <= len(values)`.
+        :return: An iterator over the edges in order of appearance in the signal."""
+        # pylint: disable=too-many-arguments
+
+        # Ensure the portion of the signal to search is within the signal.
+        start = 0 if start is None else start
+        stop = self._length if stop is None else stop
+        if not 0 <= start <= stop <= self._length:
+            raise EdgesError(f"The start, {start}, and stop, {stop}, values do not satisfy 0 <= start <= stop <= len.")
+
+        # Extend the block processed until the end of the portion, each block starts at the last value in 'high' or
+        # 'low' of the previous one, as all the edges before that value are complete and were already yielded.
+        (begin, end, size) = (start, start, self.__ITER_BLOCK_MIN)
+        while end < stop:  # pylint: disable=while-used
+            end = min(end + size, stop)
+            yield from self.__edges_partition(levels, int_policy, engine, Output.TABLE, (begin, end - 1))
+
+            # If there is no value in 'high' or 'low', then no edge is in progress and the block can be discarded.
+            block = self._vv_at(slice(begin, end))
+            extreme = np.flatnonzero(
+                (block < self.__level_values(levels, "low")[begin:end])
+                | (block > self.__level_values(levels, "high")[begin:end])
+            )
+            begin = begin + int(extreme[-1]) if len(extreme) > 0 else end
+            size = min(size * 2, self.__ITER_BLOCK_MAX)
+
+    def edges_multi(
+        self, levels: Sequence[StateLevels], int_policy: IntPointPolicy = IntPointPolicy.POLICY_0
+    ) -> tuple[EdgeTable, npt.NDArray[np.int_]]:
+        """Finds the edges in a signal with more than two states, such as a pulse amplitude modulated signal, from the
+        state levels of each pair of adjacent states, see :meth:`.StateLevelsMixin.state_levels_multi`.
+
+        A value is in a state if it is above the ``high`` level of the pair below the state, and below the ``low``
+        level of the pair above the state. There is an edge on each transition from the last value in a state to the
+        first value in another state, which can be any other state, thus all the transitions are found in a single
+        pass over the labels of the values. The edges are :attr:`~.edges.definitions.Type.RISING` towards higher
+        states and :attr:`~.edges.definitions.Type.FALLING` towards lower states, excursions that return to the same
+        state are not edges, thus runt edges are not reported.
+
+        The intermediate level of an edge is the mean of the ``intermediate`` levels of the pairs of states it goes
+        through, which is the ``intermediate`` level of the pair for edges between adjacent states.
+
+        :param levels: The state levels of each pair of adjacent states, from the lowest to the highest.
+        :param int_policy: The policy to use for intermediate point calculation.
+        :raise EdgesError: Invalid state levels.
+        :return: The edges in order of appearance in the signal, and a `Nx2` array with the state each edge comes from
+            and the state it goes to, where the lowest state is `0`."""
+        # pylint: disable=too-many-locals
+
+        # Get the values in a state, and the transitions between consecutive values in different states.
+        labels = self.__states_labels(levels)
+        indices = np.flatnonzero(labels >= 0)
+        changes = np.flatnonzero(labels[indices[1:]] != labels[indices[:-1]])
+        (ibegin, iend) = (indices[changes], indices[changes + 1])
+        states = np.stack((labels[ibegin], labels[iend]), axis=1).astype(np.int_)
+        falling = states[:, 1] < states[:, 0]
+        types = np.where(falling, Type.FALLING, Type.RISING)
+
+        # Check intermediate point policy for forced values, otherwise proceed with calculation.
+        if int_policy is IntPointPolicy.POLICY_1:
+            iint = np.where(falling, ibegin, iend)
+        elif int_policy is IntPointPolicy.POLICY_2:
+            iint = np.where(falling, iend, ibegin)
+        else:
+            # The mean of the intermediate levels of the pairs of states each edge goes through, taken directly for
+            # edges between adjacent states.
+            intermediates = np.array([level.intermediate for level in levels], dtype=np.float_)
+            (lower, upper) = (np.min(states, axis=1), np.max(states, axis=1))
+            cumulative = np.concatenate(([0.0], np.cumsum(intermediates)))
+            iint = self.__intermediate_nearest(
+                np.where(
+                    upper - lower == 1,
+                    intermediates[np.minimum(lower, len(intermediates) - 1)],
+                    (cumulative[upper] - cumulative[lower]) / (upper - lower),
+                ),
+                ibegin,
+                iend,
+            )
+
+        return (self.__build_table(types, ibegin, iint, iend), states)
 
     def edges_to_array(
         self,
-        edges: Sequence[Edge],
+        edges: EdgeTable | Sequence[Edge],
         array_id: Literal["begin", "intermediate", "end"],
     ) -> tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
         """Converts values in a sequence of edges to relevant arrays.
@@ -663,22 +1494,99 @@ class EdgesMixin:
         if len(edges) == 0:
             raise EdgesError(f"Unable to get array '{array_id}' from empty sequence of edges.")
 
-        # Get relevant indices.
-        if array_id == "begin":
+        # Get relevant indices, directly from the columns for tables of edges.
+        if array_id not in ("begin", "intermediate", "end"):
+            raise EdgesError(f"The array identifier '{array_id}' provided is invalid.")
+        if isinstance(edges, EdgeTable):
+            indices = edges[f"i{array_id}"]
+        elif array_id == "begin":
             indices = np.asarray([i["ibegin"] for i in edges])
         elif array_id == "intermediate":
             indices = np.asarray([i["iintermediate"] for i in edges])
-        elif array_id == "end":
-            indices = np.asarray([i["iend"] for i in edges])
         else:
-            raise EdgesError(f"The array identifier '{array_id}' provided is invalid.")
+            indices = np.asarray([i["iend"] for i in edges])
         # Return relevant arrays with the values.
-        return (np.copy(self._hv[indices]), np.copy(self._vv[indices]))
+        return (np.copy(self._hv_at(indices)), np.copy(self._vv_at(indices)))
+
+    def edges_to_parent(self, edges: EdgeTable | Sequence[Edge]) -> EdgeTable:
+        """Converts the indices of the edges of a window of a signal, see :meth:`.Signal.window`, to indices of the
+        signal the window was taken from, the values of the horizontal and vertical axes of the edges are the same.
+
+        :param edges: The edges of the window.
+        :return: A new table with the edges in indices of the signal the window was taken from."""
+        values = np.copy(edges.values if isinstance(edges, EdgeTable) else EdgeTable.from_edges(edges).values)
+        for column in ("ibegin", "iintermediate", "iend"):
+            np.add(values[column], self.window_offset, out=values[column])
+
+        return EdgeTable(values)
+
+    def edges_crossings(
+        self,
+        edges: EdgeTable | Sequence[Edge],
+        levels: StateLevels,
+        level_id: Literal["high", "high_runt", "intermediate", "low_runt", "low"],
+    ) -> npt.NDArray[np.float_]:
+        """Calculates the values of the horizontal axis at which the signal crosses a level in each edge, by linear
+        interpolation between the two values of the edge around the crossing, all the edges are handled at once.
+
+        For rising edges the crossing is between the last value below the level and the value after it, and for
+        falling edges between the last value above the level and the value after it, thus if the signal crosses the
+        level several times within the edge due to noise, the last crossing is taken.
+
+        An edge crosses the level if its ``begin`` and ``end`` values are on different sides of the level, which is
+        always the case for normal edges, but not for runt edges with the levels they do not reach.
+
+        :param edges: The sequence of edges.
+        :param levels: The state levels with the level to cross.
+        :param level_id: The level identifier, which defines the level to cross.
+        :raise EdgesError: The level identifier provided is not valid.
+        :return: A `1xN` array with the values of the horizontal axis of the crossings, or ``NaN`` for the edges that
+            do not cross the level."""
+        # pylint: disable=too-many-locals
+
+        # Get the level to cross.
+        if level_id not in ("high", "high_runt", "intermediate", "low_runt", "low"):
+            raise EdgesError(f"The level identifier '{level_id}' provided is invalid.")
+        level = np.float_(getattr(levels, level_id))
+
+        # Get relevant columns, directly from the table for tables of edges.
+        table = edges if isinstance(edges, EdgeTable) else EdgeTable.from_edges(edges)
+        (ibegin, iend) = (table["ibegin"], table["iend"])
+        falling = (table["edge_type"] == Type.FALLING) | (table["edge_type"] == Type.FALLING_RUNT)
+
+        # Check which edges cross the level, with 'begin' and 'end' on different sides of the level.
+        (vbegin, vend) = (self._vv_at(ibegin), self._vv_at(iend))
+        crosses = np.where(falling, (vbegin > level) & (vend <= level), (vbegin < level) & (vend >= level))
+
+        # Gather the values of all the edges one after the other, without the 'end' of each edge, and mark those on
+        # the side of the level the edge comes from.
+        lengths = iend - ibegin
+        offsets = np.cumsum(lengths) - lengths
+        spans = np.repeat(np.arange(0, len(table)), lengths)
+        indices = ibegin[spans] + np.arange(0, np.sum(lengths)) - offsets[spans]
+        values = self._vv_at(indices)
+        before = np.where(falling[spans], values > level, values < level)
+
+        # Find the last value before the crossing in each edge, which exists for edges that cross the level, the
+        # edges that do not cross the level use their 'begin' and are discarded afterwards.
+        hits = np.flatnonzero(before)
+        last = np.searchsorted(hits, offsets + lengths, "left") - 1
+        ibefore = np.copy(ibegin)
+        ibefore[crosses] = indices[hits[last[crosses]]]
+        iafter = ibefore + 1
+
+        # Interpolate linearly between the values around the crossing.
+        (hbefore, vbefore) = (self._hv_at(ibefore), self._vv_at(ibefore))
+        (hafter, vafter) = (self._hv_at(iafter), self._vv_at(iafter))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossings = hbefore + (level - vbefore) * (hafter - hbefore) / (vafter - vbefore)
+
+        return np.where(crosses, crossings, np.nan)
 
     def edges_plot(
         self,
         path: str,
-        edges: Sequence[Edge],
+        edges: EdgeTable | Sequence[Edge],
         *args,
         begin: float | None = None,
         end: float | None = None,
@@ -703,11 +1611,11 @@ class EdgesMixin:
         plotter = sep.Plotter(sep.Mode.LINEAR, rows=1, columns=1)
 
         # Adjust begin and end values if not provided.
-        begin = begin if begin is not None else float(self._hv[0])
-        end = end if end is not None else float(self._hv[-1])
+        begin = begin if begin is not None else float(self._hv_at(0))
+        end = end if end is not None else float(self._hv_at(-1))
 
         # Create plot for the signal.
-        spl = sep.Subplot("Signal", self._hv, self._hunits, self._vv, self._vunits, begin, end, munits, "red")
+        spl = sep.Subplot("Signal", self._hv_axis, self._hunits, self._vv, self._vunits, begin, end, munits, "red")
         plotter.add_plot(0, 0, spl)
 
         # Add specified points for edges, if there are any edges.
@@ -747,3 +1655,14 @@ class EdgesMixin:
         plotter.plot(path, *args, **kwargs)
 
         return self
+
+
+class PortionSignal(StateLevelsMixin, EdgesMixin, Signal):
+    """Definition of a signal used to extract the edges in a portion of another signal, such as the values pending
+    to be processed by :class:`.EdgeStream`."""
+
+    ## Private API #####################################################################################################
+
+    ## Protected API ###################################################################################################
+
+    ## Public API ######################################################################################################
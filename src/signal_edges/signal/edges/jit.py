@@ -0,0 +1,176 @@
+"""Kernels for the :attr:`.Engine.JIT` engine, which walk the labels of the values of a signal one value at a time.
+
+The kernels are compiled to native code with `numba <https://numba.pydata.org/>`_ when it is installed, which is an
+optional dependency that can be installed with the ``jit`` extra of the package. Otherwise, the kernels can still run
+as regular Python code with the same results, but they are considerably slower than the :attr:`.Engine.SEARCH` engine,
+thus the :attr:`.Engine.JIT` engine falls back to the latter, see :func:`fallback`."""
+
+import logging
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from .definitions import Type
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+#: Whether numba is available to compile the kernels.
+AVAILABLE = numba is not None
+
+# pylint: disable=invalid-name
+
+#: The types of edges as integers, which the kernels handle as constants.
+_FALLING = int(Type.FALLING)
+_FALLING_RUNT = int(Type.FALLING_RUNT)
+_RISING = int(Type.RISING)
+_RISING_RUNT = int(Type.RISING_RUNT)
+
+#: The kernels compiled so far, compiled on first use.
+_COMPILED: dict[str, Callable] = {}
+
+#: Whether the fallback to the search engine was logged, it is only logged the first time.
+_FALLBACK_LOGGED = False
+
+# pylint: enable=invalid-name
+
+
+def spans(
+    labels: npt.NDArray[np.int8],
+    label_high: int,
+    label_low: int,
+    runt_low: npt.NDArray[np.bool_],
+    runt_high: npt.NDArray[np.bool_],
+    types: npt.NDArray[np.int_],
+    begins: npt.NDArray[np.int_],
+    ends: npt.NDArray[np.int_],
+) -> int:
+    """Finds the type, ``begin`` and ``end`` values of the edges from the labels of the values of the signal, where
+    the runt types denote a combination of runt edges, with the type of the first edge.
+
+    The edges are stored in the output arrays provided up to their length, the remaining edges are counted but not
+    stored, thus if the number returned is greater than the length of the output arrays the call must be repeated
+    with larger arrays.
+
+    :param labels: The labels of the values of the signal.
+    :param label_high: The label of the values in the ``high`` area.
+    :param label_low: The label of the values in the ``low`` area.
+    :param runt_low: Lookup table indexed by label that determines if values belong to the ``runt_low`` area.
+    :param runt_high: Lookup table indexed by label that determines if values belong to the ``runt_high`` area.
+    :param types: Output array for the types of the edges.
+    :param begins: Output array for the values for the beginning of the edges.
+    :param ends: Output array for the values for the end of the edges.
+    :return: The number of edges found."""
+    # pylint: disable=too-many-arguments,too-many-locals
+
+    # The state is the label of the last value in 'high' or 'low', and there is an edge on each transition to the
+    # opposite area, or to the same area if there were values in the corresponding runt area in between.
+    (count, state, last, in_runt_low, in_runt_high) = (0, -1, -1, False, False)
+    for index in range(0, len(labels)):  # pylint: disable=consider-using-enumerate
+        label = labels[index]
+        if label != label_high and label != label_low:  # pylint: disable=consider-using-in
+            in_runt_low = in_runt_low or runt_low[label]
+            in_runt_high = in_runt_high or runt_high[label]
+            continue
+
+        # Check the transition from the last value in 'high' or 'low' to this one.
+        edge_type = 0
+        if state == label_high:
+            edge_type = _FALLING if label == label_low else (_FALLING_RUNT if in_runt_low else 0)
+        elif state == label_low:
+            edge_type = _RISING if label == label_high else (_RISING_RUNT if in_runt_high else 0)
+        if edge_type != 0:
+            if count < len(types):
+                (types[count], begins[count], ends[count]) = (edge_type, last, index)
+            count += 1
+
+        (state, last, in_runt_low, in_runt_high) = (label, index, False, False)
+
+    return count
+
+
+def intermediates(
+    labels: npt.NDArray[np.int8],
+    values: npt.NDArray[np.float_],
+    int_high: npt.NDArray[np.bool_],
+    int_low: npt.NDArray[np.bool_],
+    intermediate: npt.NDArray[np.float_],
+    types: npt.NDArray[np.int_],
+    begins: npt.NDArray[np.int_],
+    ends: npt.NDArray[np.int_],
+    out: npt.NDArray[np.int_],
+) -> None:
+    """Calculates the intermediate points of the edges as the nearest to the intermediate level of the ``begin``,
+    the ``end``, the last value in the intermediate area the edge comes from and the first value in the other
+    intermediate area after it.
+
+    :param labels: The labels of the values of the signal.
+    :param values: The values of the vertical axis of the signal.
+    :param int_high: Lookup table indexed by label that determines if values belong to the ``int_high`` area.
+    :param int_low: Lookup table indexed by label that determines if values belong to the ``int_low`` area.
+    :param intermediate: The intermediate level for each value of the signal.
+    :param types: The types of the edges.
+    :param begins: The values for the beginning of the edges.
+    :param ends: The values for the end of the edges.
+    :param out: Output array for the intermediate points of the edges."""
+    # pylint: disable=too-many-arguments,too-many-locals
+
+    for edge in range(0, len(types)):  # pylint: disable=consider-using-enumerate
+        (begin, end) = (begins[edge], ends[edge])
+        falling = types[edge] == _FALLING or types[edge] == _FALLING_RUNT  # pylint: disable=consider-using-in
+        (area_from, area_to) = (int_high, int_low) if falling else (int_low, int_high)
+
+        # Get the last value in the area the edge comes from, and the first value in the other area after it.
+        last = -1
+        for index in range(end - 1, begin - 1, -1):
+            if area_from[labels[index]]:
+                last = index
+                break
+        first = -1
+        for index in range(last if last >= 0 else begin, end):
+            if area_to[labels[index]]:
+                first = index
+                break
+
+        # Take the candidate nearest to the intermediate level, the first one for the same distance, where the
+        # candidates are ordered as 'begin', 'end', the one in 'int_high' and the one in 'int_low'.
+        (nearest, distance) = (begin, abs(values[begin] - intermediate[begin]))
+        for candidate in (end, last, first) if falling else (end, first, last):
+            if candidate >= 0 and abs(values[candidate] - intermediate[candidate]) < distance:
+                (nearest, distance) = (candidate, abs(values[candidate] - intermediate[candidate]))
+        out[edge] = nearest
+
+
+def fallback(logger: logging.Logger) -> bool:
+    """Determines if the :attr:`.Engine.JIT` engine falls back to the :attr:`.Engine.SEARCH` engine, which is the case
+    when numba is not available, logging a warning the first time.
+
+    :param logger: The logger for the warning.
+    :return: ``True`` if the search engine must be used instead, ``False`` otherwise."""
+    global _FALLBACK_LOGGED  # pylint: disable=global-statement,invalid-name
+
+    if AVAILABLE:
+        return False
+    if not _FALLBACK_LOGGED:
+        logger.warning("The 'numba' package is not installed, the JIT engine falls back to the search engine.")
+        _FALLBACK_LOGGED = True
+
+    return True
+
+
+def kernels() -> tuple[Callable, Callable]:
+    """Obtains the kernels, compiled with numba if it is available, or as regular Python functions otherwise.
+
+    :return: The :func:`spans` and :func:`intermediates` kernels."""
+    if not AVAILABLE:
+        return (spans, intermediates)
+
+    # Compile the kernels on first use, the compilation takes a few seconds.
+    if len(_COMPILED) == 0:
+        _COMPILED["spans"] = numba.njit(nogil=True)(spans)
+        _COMPILED["intermediates"] = numba.njit(nogil=True)(intermediates)
+
+    return (_COMPILED["spans"], _COMPILED["intermediates"])
@@ -0,0 +1,118 @@
+"""The edge stream, :class:`.EdgeStream`, extracts the edges of a signal that is received in chunks, such as a capture
+streamed from an oscilloscope, without holding the whole signal in memory.
+
+The edges returned are identical to the edges returned by :meth:`.EdgesMixin.edges` on the whole signal, with their
+indices relative to the beginning of the stream, but each edge is only returned once it is complete, that is once the
+signal enters the ``high`` or ``low`` area at the end of the edge.
+
+An example of its usage is described below:
+
+.. code-block:: python
+
+    import signal_edges.signal as ses
+
+    # Create stream, from state levels calculated beforehand on a portion of the signal.
+    stream = ses.edges.EdgeStream(state_levels)
+    # Feed chunks of the signal as they are received, and collect the edges completed in each of them.
+    for (hvalues, vvalues) in chunks:
+        for edge in stream.feed(hvalues, vvalues):
+            print(edge)"""
+
+import numpy as np
+import numpy.typing as npt
+
+from ...exceptions import EdgesError
+from ..state_levels import StateLevels
+from .definitions import EdgeTable, Engine, IntPointPolicy
+from .edges import PortionSignal
+
+
+class EdgeStream:
+    """Extracts the edges of a signal received in chunks.
+
+    The state of the edge search at any point of the signal is determined by the last value in the ``high`` or ``low``
+    areas before it, thus only the values from that last value onwards are kept between chunks, which hold the type of
+    edge being searched for, the beginning of the edge and any runt edges not yet resolved. The values kept are bounded
+    by the longest portion of the signal outside of the ``high`` and ``low`` areas, plus the length of a chunk."""
+
+    ## Private API #####################################################################################################
+    def __init__(
+        self,
+        levels: StateLevels,
+        int_policy: IntPointPolicy = IntPointPolicy.POLICY_0,
+        engine: Engine = Engine.SEARCH,
+    ) -> None:
+        """Class constructor.
+
+        :param levels: State levels.
+        :param int_policy: The policy to use for intermediate point calculation.
+        :param engine: The engine to use for the extraction of the edges, all engines return the same edges.
+        :raise EdgesError: The state levels do not satisfy `low < low_runt < intermediate < high_runt < high`."""
+        # Sanity check on the levels.
+        if not levels.low < levels.low_runt < levels.intermediate < levels.high_runt < levels.high:
+            raise EdgesError("The state levels do not satisfy low < low_runt < intermediate < high_runt < high.")
+
+        #: The state levels.
+        self.__levels = levels
+        #: The intermediate point policy to apply.
+        self.__int_policy = int_policy
+        #: The engine to use for the extraction of the edges.
+        self.__engine = engine
+        #: The values for the horizontal axis pending to be processed.
+        self.__hv: npt.NDArray[np.float_] = np.empty(0, dtype=np.float_)
+        #: The values for the vertical axis pending to be processed.
+        self.__vv: npt.NDArray[np.float_] = np.empty(0, dtype=np.float_)
+        #: The index in the stream of the first value pending to be processed.
+        self.__offset = 0
+
+    ## Protected API ###################################################################################################
+
+    ## Public API ######################################################################################################
+    @property
+    def offset(self) -> int:
+        """The index in the stream of the first value pending to be processed, values before it are discarded.
+
+        :return: The index of the value."""
+        return self.__offset
+
+    @property
+    def pending(self) -> int:
+        """The number of values kept as they might be part of edges not yet complete.
+
+        :return: The number of values."""
+        return len(self.__vv)
+
+    def feed(self, hvalues: npt.NDArray[np.float_], vvalues: npt.NDArray[np.float_]) -> EdgeTable:
+        """Feeds the next chunk of the signal to the stream.
+
+        :param hvalues: The values for the horizontal axis of the chunk.
+        :param vvalues: The values for the vertical axis of the chunk.
+        :raise EdgesError: The values provided are not two `1xN` arrays of the same length.
+        :raise SignalError: The values of the horizontal axis do not satisfy `x[n] < x[n+1]`, including across chunks.
+        :return: The edges completed with the chunk, in order of appearance in the signal, with indices relative to
+            the beginning of the stream."""
+        hvalues = np.asarray(hvalues, dtype=np.float_)
+        vvalues = np.asarray(vvalues, dtype=np.float_)
+        # Ensure the values of the chunk are two 1xN arrays of the same length.
+        if len(hvalues.shape) != 1 or hvalues.shape != vvalues.shape:
+            raise EdgesError("The values of the chunk must be two 1xN arrays of the same length.")
+
+        # Append the chunk to the values pending to be processed, and extract the edges on them.
+        hvalues = np.concatenate((self.__hv, hvalues))
+        vvalues = np.concatenate((self.__vv, vvalues))
+        if len(vvalues) == 0:
+            return EdgeTable()
+        signal = PortionSignal(hvalues, vvalues, copy=False)
+        edges = signal.edges(self.__levels, self.__int_policy, self.__engine)
+        for column in ("ibegin", "iintermediate", "iend"):
+            np.add(edges[column], self.__offset, out=edges[column])
+
+        # Keep the values from the last value in 'high' or 'low', all edges before it are complete, if there is no
+        # such value then no edge is in progress and all values can be discarded.
+        extreme = (vvalues < np.float_(self.__levels.low)) | (vvalues > np.float_(self.__levels.high))
+        keep = len(vvalues) - 1 - int(np.argmax(extreme[::-1])) if np.any(extreme) else len(vvalues)
+        self.__hv = hvalues[keep:].copy()
+        self.__vv = vvalues[keep:].copy()
+        self.__offset += keep
+
+        return edges
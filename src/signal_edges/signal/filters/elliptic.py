@@ -42,8 +42,6 @@ try:
 except ImportError:
     from typing_extensions import Self
 
-from copy import deepcopy
-
 import scipy.signal
 
 from ...exceptions import FiltersError
@@ -115,10 +113,6 @@ class EllipticFiltersMixin(FiltersMixin):
         if sos is None:
             raise FiltersError("Invalid elliptic filter configuration given.")
 
-        # Create a copy of self, and update the vertical values with the new filtered values.
-        filtered_signal = deepcopy(self)
-
-        # Use zero phase filter for filtering, creating the same number of samples.
-        setattr(filtered_signal, "_vv", scipy.signal.sosfiltfilt(sos, self._vv))
-
-        return filtered_signal
+        # Use zero phase filter for filtering, creating the same number of samples, in a new signal that shares the
+        # values of the horizontal axis with this one, in the data type of the signal.
+        return self._derive(scipy.signal.sosfiltfilt(sos.astype(self.dtype), self._vv))
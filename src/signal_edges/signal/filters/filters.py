@@ -9,6 +9,7 @@ except ImportError:
 
 import logging
 from abc import ABC
+from collections.abc import Callable
 
 import numpy as np
 import numpy.typing as npt
@@ -19,7 +20,7 @@ from ... import plotter as sep
 class FiltersMixin(ABC):
     """Base class for filter mixins for :class:`.Signal` derived classes."""
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
     ## Private API #####################################################################################################
     def __init__(self, *args, **kwargs) -> None:
@@ -32,6 +33,10 @@ class FiltersMixin(ABC):
         self._vv: npt.NDArray[np.float_]
         self._hunits: sep.Units
         self._vunits: sep.Units
+        self._hv_at: Callable[[npt.ArrayLike | slice], npt.NDArray[np.float_]]
+        self._hv_axis: npt.NDArray[np.float_] | tuple[np.float_, np.float_]
+        self._derive: Callable[[npt.NDArray[np.float_]], Self]
+        self.dtype: np.dtype
 
     ## Protected API ###################################################################################################
 
@@ -60,8 +65,8 @@ class FiltersMixin(ABC):
         plotter = sep.Plotter(sep.Mode.LINEAR, rows=1, columns=1)
 
         # Adjust begin and end values if not provided.
-        begin = begin if begin is not None else float(self._hv[0])
-        end = end if end is not None else float(self._hv[-1])
+        begin = begin if begin is not None else float(self._hv_at(0))
+        end = end if end is not None else float(self._hv_at(-1))
 
         # Add subplot for the original signal.
         plotter.add_plot(
@@ -69,7 +74,7 @@ class FiltersMixin(ABC):
             0,
             sep.Subplot(
                 "Original",
-                self._hv,
+                self._hv_axis,
                 self._hunits,
                 self._vv,
                 self._vunits,
@@ -83,7 +88,7 @@ class FiltersMixin(ABC):
             0,
             sep.Subplot(
                 "Filtered",
-                getattr(signal, "_hv"),
+                getattr(signal, "_hv_axis"),
                 getattr(signal, "_hunits"),
                 getattr(signal, "_vv"),
                 getattr(signal, "_vunits"),
@@ -43,7 +43,7 @@ except ImportError:
 
 from ... import plotter as sep
 from ...exceptions import SignalError
-from ..edges import Edge
+from ..edges import Edge, EdgeTable
 from ..signal import Signal
 from ..state_levels import StateLevels
 
@@ -148,7 +148,7 @@ class Sample:
 
 ItemSignal: TypeAlias = tuple[float, float, float, str, str, Signal]
 ItemStateLevels: TypeAlias = tuple[float, float, float, Signal, StateLevels]
-ItemEdges: TypeAlias = tuple[float, float, float, Signal, Sequence[Edge]]
+ItemEdges: TypeAlias = tuple[float, float, float, Signal, EdgeTable | Sequence[Edge]]
 Item: TypeAlias = tuple[Literal["signal", "state_levels", "edges"], ItemSignal | ItemStateLevels | ItemEdges]
 
 
@@ -235,7 +235,7 @@ class SampleManager:
                     # Get relevant data from item.
                     item = cast(ItemSignal, item)
                     (begin, end, munits, name, color, signal) = item
-                    (hvalues, vvalues) = (getattr(signal, "_hv"), getattr(signal, "_vv"))
+                    (hvalues, vvalues) = (getattr(signal, "_hv_axis"), getattr(signal, "_vv"))
                     (hunits, vunits) = (getattr(signal, "_hunits"), getattr(signal, "_vunits"))
 
                     # Create subplot for signal.
@@ -36,12 +36,16 @@ Which creates the following signal:
     The generated signal in the code snippet."""
 
 try:
-    from typing import Self
+    from typing import Any, Literal, Self, TypeVar
 except ImportError:
-    from typing_extensions import Self
+    from typing_extensions import Any, Literal, Self, TypeVar
 
 import logging
 from abc import ABC
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from copy import copy as shallow_copy
+from dataclasses import dataclass
 
 import numpy as np
 import numpy.typing as npt
@@ -50,6 +54,23 @@ from .. import plotter as sep
 from ..definitions import get_logger
 from ..exceptions import SignalError
 
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Statistics of the cache of results of a signal, see :attr:`.Signal.cache_info`.
+
+    :param hits: Number of results obtained from the cache.
+    :param misses: Number of results computed as they were not in the cache.
+    :param maxsize: Maximum number of results kept in the cache.
+    :param currsize: Number of results currently kept in the cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
 
 class Signal(ABC):
     """Base class for signal, meant to be derived to create specialized signals on which to add mixins from this
@@ -64,42 +85,197 @@ class Signal(ABC):
 
         For simplicity, the Numpy arrays provided to this class are copied internally, changes outside this classs
         to the arrays provided will not reflect on the internal ones, use the relevant getters and setters to reflect
-        this changes on the internal arrays."""
+        this changes on the internal arrays.
+
+    For large signals already in memory, or memory-mapped from disk with :class:`numpy.memmap`, the arrays can be used
+    as they are by creating the signal with ``copy=False``, in which case they are only copied if their data type or
+    layout requires it. The signal never writes into the arrays, thus read-only arrays can be used, and operations that
+    modify the values, such as filters, create new arrays. Changes to the arrays outside of the signal are then
+    reflected in the signal, but not in the results in its cache.
+
+    The values of the vertical axis can also be provided as 8-bit or 16-bit integer codes, such as those of a digitizer,
+    together with the gain and the offset that convert them to values as `value = code * gain + offset`. The codes are
+    then kept as they are, the state levels and the edges are calculated from the codes directly, and the conversion is
+    only performed for the values reported, or for the whole signal on first use of features that require it.
+
+    For uniformly sampled signals, the values of the horizontal axis can be given by their start and step instead, in
+    which case they are not stored, the value at each index is calculated when needed as `start + index * step`, and the
+    whole array is only created on first use of features that require it, such as :attr:`.Signal._hv`.
 
-    # pylint: disable=too-few-public-methods
+    Regions of interest of a signal can be obtained with :meth:`.Signal.window`, which returns a signal of the same
+    class that shares the memory of the values with the signal it is taken from, and thus takes constant time and
+    memory regardless of the length of the region.
+
+    The values of the vertical axis are stored as ``numpy.float64`` by default, or as ``numpy.float32`` with
+    ``dtype=numpy.float32`` to halve their memory, such as for digitizers of up to 16 bits whose values do not require
+    more precision. The state levels and the edges are calculated from the values as they are stored, comparing them
+    exactly with the levels, thus the edges only differ from those of the ``numpy.float64`` values for values that
+    round to the other side of a level. The values of the horizontal axis are always ``numpy.float64``, as they
+    require the precision to satisfy the `x[n] < x[n+1]` requirement for large number of values.
+
+    Results that are expensive to compute and depend only on the values of the signal, such as the state levels, are
+    kept in a cache of the signal with the least recently used results evicted first. The cache is cleared when the
+    values are replaced through the setters, but not when the arrays are modified in place, thus the getters of the
+    derived classes return read-only views of the arrays."""
+
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+
+    # pylint: disable=invalid-name
+
+    #: Maximum number of results kept in the cache of the signal.
+    __CACHE_SIZE = 16
+
+    # pylint: enable=invalid-name
 
     ## Private API #####################################################################################################
     def __init__(
         self,
-        hvalues: npt.NDArray[np.float_],
+        hvalues: npt.NDArray[np.float_] | None,
         vvalues: npt.NDArray[np.float_],
         *args,
         hunits: sep.Units | None = None,
         vunits: sep.Units | None = None,
+        vgain: float | None = None,
+        voffset: float = 0.0,
+        copy: bool = True,
+        hstart: float | None = None,
+        hstep: float | None = None,
+        dtype: npt.DTypeLike = np.float_,
         **kwargs,
     ) -> None:
         """The constructor for the signal class.
 
         :meta public:
-        :param hvalues: A `1xN` array with the values of the horizontal axis to copy for the signal.
-        :param vvalues: A `1xN` array with the values of the vertical axis to copy for the signal.
+        :param hvalues: A `1xN` array with the values of the horizontal axis for the signal, or ``None`` for uniformly
+            sampled signals with ``hstart`` and ``hstep`` instead.
+        :param vvalues: A `1xN` array with the values of the vertical axis for the signal, or with their integer codes
+            if ``vgain`` is provided.
         :param hunits: The units of the values of the horizontal axis for plots, defaults to no units.
-        :param vunits: The units of the values of the vertical axis for plots, defaults to no units."""
-        # pylint: disable=unused-argument
+        :param vunits: The units of the values of the vertical axis for plots, defaults to no units.
+        :param vgain: The gain to convert the integer codes to values of the vertical axis, defaults to values.
+        :param voffset: The offset to convert the integer codes to values of the vertical axis.
+        :param copy: If ``False``, use the arrays as they are if they are C-contiguous and of the expected data type,
+            otherwise copy them.
+        :param hstart: The first value of the horizontal axis, for uniformly sampled signals.
+        :param hstep: The step between consecutive values of the horizontal axis, for uniformly sampled signals.
+        :param dtype: The data type of the values of the vertical axis, either ``numpy.float64`` or ``numpy.float32``.
+        :raise SignalError: The data type of the values of the vertical axis is not supported.
+        :raise SignalError: Either the values of the horizontal axis, or its start and step, must be provided.
+        :raise SignalError: The codes are not 8-bit or 16-bit integers, or the gain and offset are not valid."""
+        # pylint: disable=unused-argument,too-many-arguments
 
         #: Logger.
         self.__logger = get_logger()
-        #: Values of the horizontal axis for the signal, must satisfy ``x[n] < x[n+1]``.
-        self.__hv = np.array(hvalues, dtype=np.float_, copy=True, order="C")
-        #: Values of the vertical axis for the signal.
-        self.__vv = np.array(vvalues, dtype=np.float_, copy=True, order="C")
+        #: Data type of the values of the vertical axis.
+        self.__dtype = np.dtype(dtype)
+        if self.__dtype not in (np.dtype(np.float64), np.dtype(np.float32)):
+            raise SignalError(f"The data type '{self.__dtype}' of the values of the vertical axis is not supported.")
+        #: Cache of results, from least to most recently used.
+        self.__cache: OrderedDict[Hashable, Any] = OrderedDict()
+        #: Number of results obtained from the cache.
+        self.__cache_hits = 0
+        #: Number of results computed as they were not in the cache.
+        self.__cache_misses = 0
+        #: Values of the horizontal axis for the signal, must satisfy ``x[n] < x[n+1]``, calculated on first use for
+        #: uniformly sampled signals.
+        self.__hv: npt.NDArray[np.float_] | None = None
+        #: Start and step of the values of the horizontal axis for uniformly sampled signals.
+        self.__huniform: tuple[np.float_, np.float_] | None = None
+        if (hvalues is None) == (hstart is None or hstep is None) or (hstart is None) != (hstep is None):
+            raise SignalError("Either the values of the horizontal axis, or its start and step, must be provided.")
+        if hvalues is not None:
+            self.__hv = np.array(hvalues, dtype=np.float_, copy=copy, order="C")
+        elif hstart is not None and hstep is not None:
+            self.__huniform = (np.float_(hstart), np.float_(hstep))
+        #: Values of the vertical axis for the signal, converted on first use for signals created from codes.
+        self.__vv: npt.NDArray[np.float_] | None = None
+        #: Integer codes of the vertical axis for signals created from codes, with their gain and offset.
+        self.__codes: npt.NDArray[np.integer] | None = None
+        (self.__vgain, self.__voffset) = (np.float_(1.0), np.float_(0.0))
+        #: Values of the vertical axis for each possible code, computed on first use.
+        self.__code_values: npt.NDArray[np.float_] | None = None
+        if vgain is None:
+            self.__vv = np.array(vvalues, dtype=self.__dtype, copy=copy, order="C")
+        else:
+            self.__codes = np.array(vvalues, copy=copy, order="C")
+            if not np.issubdtype(self.__codes.dtype, np.integer) or self.__codes.dtype.itemsize > 2:
+                raise SignalError("The codes of the vertical axis must be 8-bit or 16-bit integers.")
+            if not (np.isfinite(vgain) and np.isfinite(voffset) and vgain != 0):
+                raise SignalError("The gain and offset of the codes must be finite, and the gain not zero.")
+            (self.__vgain, self.__voffset) = (np.float_(vgain), np.float_(voffset))
         #: Units for the values on the horizontal axis.
         self.__hunits = hunits if hunits is not None else sep.Units("N/A", "N/A", "N/A")
         #: Units for the values on the vertical axis.
         self.__vunits = vunits if vunits is not None else sep.Units("N/A", "N/A", "N/A")
+        #: Index of the first value of the signal in the signal it was taken from, for windows of signals.
+        self.__offset = 0
         # Validate values after initialization finished.
         self._validate_values()
 
+    def __uniform(self, indices: npt.NDArray[np.int_]) -> npt.NDArray[np.float_]:
+        """Calculates the values of the horizontal axis at the indices given for uniformly sampled signals, all the
+        values are calculated by this method so that the value at an index is always the same.
+
+        :param indices: The indices, which must be within the signal.
+        :return: The values at the indices."""
+        (hstart, hstep) = self.__huniform
+        return np.multiply(np.add(indices, self.__offset), hstep, dtype=np.float_) + hstart
+
+    def __hsearch(self, value: float, side: Literal["left", "right"]) -> int:
+        """Finds the index where a value would be inserted in the values of the horizontal axis, as in
+        :func:`numpy.searchsorted`, for uniformly sampled signals the index is estimated from the start and the step
+        and then refined with the values around it.
+
+        :param value: The value to search for.
+        :param side: The side of the search, ``left`` or ``right``.
+        :return: The index."""
+        if self.__hv is not None or self.__huniform is None:
+            return int(np.searchsorted(self._hv, value, side))
+        (hstart, hstep) = self.__huniform
+        estimate = int(np.clip(np.ceil((value - hstart) / hstep) - self.__offset, 0, self._length))
+        (lower, upper) = (max(estimate - 2, 0), min(estimate + 2, self._length))
+        return lower + int(np.searchsorted(self.__uniform(np.arange(lower, upper)), value, side))
+
+    def __copy(self) -> Self:
+        """Creates a shallow copy of the signal, which shares the values and the units with the signal, and has a cache
+        of its own.
+
+        :return: The copy of the signal."""
+        # pylint: disable=protected-access,unused-private-member
+
+        signal = shallow_copy(self)
+        signal.__cache = OrderedDict()
+        (signal.__cache_hits, signal.__cache_misses) = (0, 0)
+
+        return signal
+
+    def __window(self, first: int, last: int) -> Self:
+        """Creates a copy of the signal with the values in the range of indices given, as views of the values of the
+        signal.
+
+        :param first: The index of the first value of the range.
+        :param last: The index after the last value of the range.
+        :return: The copy of the signal."""
+        # pylint: disable=protected-access,unused-private-member
+
+        window = self.__copy()
+        window.__hv = self.__hv[first:last] if self.__hv is not None else None
+        window.__vv = self.__vv[first:last] if self.__vv is not None else None
+        window.__codes = self.__codes[first:last] if self.__codes is not None else None
+        window.__offset = self.__offset + first
+
+        return window
+
+    def __convert(self, codes: npt.NDArray[np.integer]) -> npt.NDArray[np.float_]:
+        """Converts codes of the vertical axis to values, all the conversions are performed by this method so that the
+        same code is always converted to the same value.
+
+        :param codes: The codes to convert.
+        :return: The values of the codes."""
+        values = np.multiply(codes, self.__vgain, dtype=np.float_)
+        values = np.add(values, self.__voffset, out=values) if np.ndim(values) > 0 else values + self.__voffset
+        return values.astype(self.__dtype, copy=False)
+
     ## Protected API ###################################################################################################
     @property
     def _logger(self) -> logging.Logger:
@@ -116,6 +292,9 @@ class Signal(ABC):
 
         :meta public:
         :return: A `1xN` array with the values of the horizontal axis."""
+        if self.__hv is None:
+            self._logger.debug("Calculating the values of the horizontal axis of the signal from its start and step.")
+            self.__hv = self.__uniform(np.arange(0, self._length))
         return self.__hv
 
     @_hv.setter
@@ -129,13 +308,19 @@ class Signal(ABC):
         :meta public:
         :param new_hv: A `1xN` array with the new values of the horizontal axis."""
         self.__hv = new_hv
+        self.__huniform = None
+        self._cache_clear()
 
     @property
     def _vv(self) -> npt.NDArray[np.float_]:
-        """Getter for the values of the vertical axis.
+        """Getter for the values of the vertical axis, for signals created from codes the codes are converted to values
+        on first use, use :meth:`.Signal._vv_at` to convert only some of them.
 
         :meta public:
         :return: A `1xN` array with the values of the vertical axis."""
+        if self.__vv is None:
+            self._logger.debug("Converting the codes of the vertical axis of the signal to values.")
+            self.__vv = self.__convert(self.__codes)
         return self.__vv
 
     @_vv.setter
@@ -149,6 +334,34 @@ class Signal(ABC):
         :meta public:
         :param new_vv: A `1xN` array with the new values of the vertical axis."""
         self.__vv = new_vv
+        (self.__codes, self.__code_values) = (None, None)
+        self._cache_clear()
+
+    @property
+    def _codes(self) -> npt.NDArray[np.unsignedinteger] | None:
+        """Getter for the codes of the vertical axis, for signals created from codes, as unsigned integers of the same
+        size so that they can index :attr:`.Signal._code_values` directly.
+
+        :meta public:
+        :return: A `1xN` array with the codes, or ``None`` if the signal was not created from codes."""
+        if self.__codes is None:
+            return None
+        return self.__codes.view(np.dtype(f"u{self.__codes.dtype.itemsize}"))
+
+    @property
+    def _code_values(self) -> npt.NDArray[np.float_] | None:
+        """Getter for the values of the vertical axis of every possible code, for signals created from codes, indexed
+        by the codes in :attr:`.Signal._codes`.
+
+        :meta public:
+        :return: A `1xC` array with the values, where `C` is the number of possible codes, or ``None`` if the signal
+            was not created from codes."""
+        if self.__codes is None:
+            return None
+        if self.__code_values is None:
+            codes = np.arange(0, 2 ** (8 * self.__codes.dtype.itemsize), dtype=f"u{self.__codes.dtype.itemsize}")
+            self.__code_values = self.__convert(codes.view(self.__codes.dtype))
+        return self.__code_values
 
     @property
     def _hunits(self) -> sep.Units:
@@ -182,22 +395,133 @@ class Signal(ABC):
         :param new_vunits: The new units for the values of the vertical axis."""
         self.__vunits = new_vunits
 
+    @property
+    def _length(self) -> int:
+        """Getter for the number of values of the signal, without creating the values of either axis.
+
+        :meta public:
+        :return: The number of values."""
+        return len(self.__vv if self.__vv is not None else self.__codes)
+
+    @property
+    def _hv_axis(self) -> npt.NDArray[np.float_] | tuple[np.float_, np.float_]:
+        """Getter for the horizontal axis as accepted by :class:`.Subplot`, which for uniformly sampled signals is its
+        start and step, so that only the values plotted are calculated.
+
+        :meta public:
+        :return: A `1xN` array with the values of the horizontal axis, or its start and step."""
+        if self.__huniform is not None and self.__hv is None:
+            return (self.__uniform(np.int_(0)), self.__huniform[1])
+        return self._hv
+
+    def _hv_at(self, indices: npt.ArrayLike | slice) -> npt.NDArray[np.float_]:
+        """Obtains the values of the horizontal axis at the indices given, for uniformly sampled signals they are
+        calculated from the start and the step, unless the whole axis has already been calculated.
+
+        :meta public:
+        :param indices: The indices, as an integer, an array of integers or a slice.
+        :raise IndexError: The indices are out of the bounds of the signal.
+        :return: The values at the indices."""
+        if self.__hv is not None:
+            return self.__hv[indices]
+        if isinstance(indices, slice):
+            return self.__uniform(np.arange(*indices.indices(self._length)))
+        positions = np.asarray(indices)
+        if np.any(positions < -self._length) or np.any(positions >= self._length):
+            raise IndexError("The indices are out of the bounds of the values of the horizontal axis.")
+        return self.__uniform(np.where(positions < 0, positions + self._length, positions))
+
+    def _vv_at(self, indices: npt.ArrayLike | slice) -> npt.NDArray[np.float_]:
+        """Obtains the values of the vertical axis at the indices given, for signals created from codes only the codes
+        at those indices are converted to values, unless the whole signal has already been converted.
+
+        The values are returned as ``numpy.float64`` regardless of the data type of the signal, thus computations on
+        them are the same for signals of any data type with the same values.
+
+        :meta public:
+        :param indices: The indices, as any index supported by Numpy arrays.
+        :return: The values at the indices."""
+        values = self.__convert(self.__codes[indices]) if self.__vv is None else self.__vv[indices]
+        return values.astype(np.float_, copy=False)
+
+    def _cached(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Obtains a result from the cache of the signal, or computes it and stores it in the cache if it is not there.
+
+        The results are shared between calls, thus results with mutable values must be copied before being returned
+        to the user, or be made read-only.
+
+        :meta public:
+        :param key: The key of the result, with the name of the computation and all the arguments it depends on.
+        :param compute: The function that computes the result, exceptions raised by it are propagated.
+        :return: The result."""
+        if key in self.__cache:
+            self.__cache_hits += 1
+            self.__cache.move_to_end(key)
+            return self.__cache[key]
+
+        result = compute()
+        self.__cache_misses += 1
+        self.__cache[key] = result
+        if len(self.__cache) > self.__CACHE_SIZE:
+            self.__cache.popitem(last=False)
+
+        return result
+
+    def _cache_clear(self) -> None:
+        """Clears the cache of results of the signal, to be used when the values of the signal are modified in place.
+
+        :meta public:"""
+        self.__cache.clear()
+
+    def _derive(self, new_vv: npt.NDArray[np.float_]) -> Self:
+        """Creates a signal of the same class with new values of the vertical axis, such as those of a filter, that
+        shares the values of the horizontal axis and the units with this signal instead of copying them.
+
+        The values shared are only replaced, never modified in place, by the setters of either signal, thus the values
+        of one signal are not affected by the setters of the other.
+
+        :meta public:
+        :param new_vv: A `1xN` array with the values of the vertical axis of the new signal.
+        :return: The new signal."""
+        # pylint: disable=protected-access
+
+        signal = self.__copy()
+        signal._vv = np.asarray(new_vv, dtype=self.__dtype)
+
+        return signal
+
     def _validate_values(self) -> "Signal":
-        """Validates the values of the horizontal axis and the vertical axis.
+        """Validates the values of the horizontal axis and the vertical axis, for uniformly sampled signals only the
+        start and step of the horizontal axis are validated, in constant time.
 
         :raise SignalError: The horizontal or vertical axes values provided are not on the form `1xN`.
         :raise SignalError: The number of horizontal or vertical axis values is zero.
         :raise SignalError: The number of horizontal and vertical axis values is not the same.
         :raise SignalError: The horizontal axis values do not satisfy the `x[n] < x[n+1]` requirement.
         :return: Instance of the class."""
+        vvalues = self.__vv if self.__vv is not None else self.__codes
+        if self.__hv is None and self.__huniform is not None:
+            # Check that the values are of the form 1xN, with at least one value.
+            if len(vvalues.shape) != 1:
+                raise SignalError("The values of the horizontal or vertical axis are not of the form 1xN.")
+            if len(vvalues) == 0:
+                raise SignalError("The number of values in the horizontal or vertical axis can't be zero.")
+            # Ensure the step is larger than the spacing of the values, so that the values satisfy x[n] < x[n+1].
+            (first, last) = self.__uniform(np.array([0, len(vvalues) - 1]))
+            if not (np.isfinite(first) and np.isfinite(last)) or not (
+                self.__huniform[1] > 2 * np.spacing(max(abs(first), abs(last)))
+            ):
+                raise SignalError("The horizontal axis values given do not satisfy the x[n] < x[n+1] requirement.")
+            return self
+
         # Check that the arrays are of the form 1xN.
-        if any([len(self.__hv.shape) != 1, len(self.__vv.shape) != 1]):
+        if any([len(self.__hv.shape) != 1, len(vvalues.shape) != 1]):
             raise SignalError("The values of the horizontal or vertical axis are not of the form 1xN.")
         # Ensure both axis have at least one value.
-        if any([len(self.__hv) == 0, len(self.__vv) == 0]):
+        if any([len(self.__hv) == 0, len(vvalues) == 0]):
             raise SignalError("The number of values in the horizontal or vertical axis can't be zero.")
         # Ensure both axis have the same number of values.
-        if len(self.__hv) != len(self.__vv):
+        if len(self.__hv) != len(vvalues):
             raise SignalError("The number of values of the horizontal and vertical axis must be the same.")
         # Ensure the values of the horizontal axis satisfy the x[n] < x[n+1] requirement.
         if len(np.where(np.diff(self.__hv) <= 0)[0]) > 0:
@@ -206,6 +530,52 @@ class Signal(ABC):
         return self
 
     ## Public API ######################################################################################################
+    @property
+    def cache_info(self) -> CacheInfo:
+        """Statistics of the cache of results of the signal, the number of hits and misses are kept when the cache is
+        cleared.
+
+        :return: The statistics of the cache."""
+        return CacheInfo(self.__cache_hits, self.__cache_misses, self.__CACHE_SIZE, len(self.__cache))
+
+    @property
+    def dtype(self) -> np.dtype:
+        """The data type of the values of the vertical axis, the values of the horizontal axis and the results of the
+        mixins, such as the state levels and the edges, are always ``numpy.float64``.
+
+        :return: The data type."""
+        return self.__dtype
+
+    @property
+    def window_offset(self) -> int:
+        """The index of the first value of the signal in the signal it was taken from with :meth:`.Signal.window`,
+        for windows of windows it is the index in the first signal, and zero for signals that are not windows.
+
+        :return: The index of the first value."""
+        return self.__offset
+
+    def window(self, begin: float, end: float) -> Self:
+        """Obtains a window of the signal with the values whose horizontal axis values are between ``begin`` and
+        ``end``, both included, found with binary searches on the values of the horizontal axis.
+
+        The window is a signal of the same class whose values are views of the values of this signal, thus changes to
+        the values of one in place are reflected in the other. The results of the mixins on the window, such as the
+        edges, are in indices of the window, which can be converted to indices of this signal with
+        :attr:`.Signal.window_offset`, or with :meth:`.EdgesMixin.edges_to_parent` for edges.
+
+        :param begin: The value of the horizontal axis where the window begins.
+        :param end: The value of the horizontal axis where the window ends.
+        :raise SignalError: The begin value is greater than the end value.
+        :raise SignalError: There are no values between the begin and end values.
+        :return: The window."""
+        if not begin <= end:
+            raise SignalError("The begin value of the window must be less than or equal to its end value.")
+        (first, last) = (self.__hsearch(begin, "left"), self.__hsearch(end, "right"))
+        if last <= first:
+            raise SignalError("There are no values of the signal between the begin and end values of the window.")
+
+        return self.__window(first, last)
+
     def signal_plot(
         self,
         path: str,
@@ -230,11 +600,11 @@ class Signal(ABC):
         plotter = sep.Plotter(sep.Mode.LINEAR, rows=1, columns=1)
 
         # Adjust begin and end values if not provided.
-        begin = begin if begin is not None else float(self._hv[0])
-        end = end if end is not None else float(self._hv[-1])
+        begin = begin if begin is not None else float(self._hv_at(0))
+        end = end if end is not None else float(self._hv_at(-1))
 
         # Create plot for the signal.
-        spl = sep.Subplot("Signal", self._hv, self._hunits, self._vv, self._vunits, begin, end, munits, "red")
+        spl = sep.Subplot("Signal", self._hv_axis, self._hunits, self._vv, self._vunits, begin, end, munits, "red")
         plotter.add_plot(0, 0, spl)
 
         # Create plot.
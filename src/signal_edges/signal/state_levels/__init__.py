@@ -3,5 +3,6 @@
 ## Initialization code #################################################################################################
 
 ## Public API ##########################################################################################################
-from .definitions import Mode, StateLevels
+from .accumulator import StateLevelsAccumulator
+from .definitions import Mode, StateLevels, StateLevelsArray
 from .state_levels import StateLevelsMixin
@@ -0,0 +1,238 @@
+"""The state levels accumulator, :class:`.StateLevelsAccumulator`, calculates the state levels of a signal that is
+received in chunks, such as a capture larger than the available memory or split in several files, without holding the
+whole signal in memory. Accumulators built on different chunks, for example in parallel, can be merged into one.
+
+The accumulator keeps a histogram of the values received, either with fixed bounds or with bounds that grow with the
+values received:
+
+    - With fixed bounds, the histogram is the same as the histogram calculated by
+      :meth:`.StateLevelsMixin.state_levels` with the same bounds on all the values at once, thus the results are
+      identical.
+    - With growable bounds, the bounds of the histogram are not known until all the values are received, thus the
+      values are kept in a finer histogram whose bins widen as the bounds grow, which is resampled to the requested
+      number of bins at the end. The results are approximate, only the values in the bins of the finer histogram that
+      straddle the edges of the requested bins might be counted in a neighbouring bin.
+
+To obtain identical results to :meth:`.StateLevelsMixin.state_levels` with the default bounds, do a first pass with
+growable bounds, which calculates the exact bounds of the values, and a second pass with those bounds as fixed bounds:
+
+.. code-block:: python
+
+    import signal_edges.signal as ses
+
+    # First pass, to obtain the bounds of the values.
+    accumulator = ses.state_levels.StateLevelsAccumulator()
+    for vvalues in chunks:
+        accumulator.update(vvalues)
+    # Second pass, with fixed bounds, to obtain the histogram.
+    exact_accumulator = ses.state_levels.StateLevelsAccumulator(bounds=accumulator.bounds)
+    for vvalues in chunks:
+        exact_accumulator.update(vvalues)
+    (state_levels, histogram) = exact_accumulator.finalize()"""
+
+import numpy as np
+import numpy.typing as npt
+
+from ...exceptions import StateLevelsError
+from .definitions import Mode, StateLevels
+from .state_levels import StateLevelsMixin
+
+
+class StateLevelsAccumulator:
+    """Accumulates the histogram of the values of a signal received in chunks, to calculate its state levels."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # pylint: disable=invalid-name
+
+    #: Maximum number of bins of the finer histogram for each bin of the histogram, when the bounds are growable.
+    __RESOLUTION = 64
+    #: Minimum width of the bins of the finer histogram relative to the magnitude of the values, as a power of two.
+    __MIN_RELATIVE_WIDTH = -40
+
+    # pylint: enable=invalid-name
+
+    ## Private API #####################################################################################################
+    def __init__(self, nbins: int = 100, bounds: tuple[float, float] | None = None) -> None:
+        """Class constructor.
+
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the histogram, defaults to growable bounds from the values.
+        :raise StateLevelsError: The minimum number of bins is two.
+        :raise StateLevelsError: The bounds provided must satisfy `bounds[0] <= bounds[1]` and be finite."""
+        # Verify the number of bins and the bounds.
+        if nbins <= 1:
+            raise StateLevelsError("The number of bins when user provided must be greater than one.")
+        if bounds is not None and not (np.isfinite(bounds[0]) and np.isfinite(bounds[1]) and bounds[0] <= bounds[1]):
+            raise StateLevelsError("Bounds when user provided must be finite and satisfy lower bound <= upper bound.")
+
+        #: Number of bins of the histogram.
+        self.__nbins = nbins
+        #: The fixed bounds of the histogram, or ``None`` for growable bounds.
+        self.__fixed_bounds = bounds
+        #: Number of values received.
+        self.__count = 0
+        #: Minimum and maximum of the values received, only for growable bounds.
+        (self.__minimum, self.__maximum) = (np.float_(np.inf), np.float_(-np.inf))
+        #: The histogram for fixed bounds, or the finer histogram for growable bounds.
+        self.__hist: npt.NDArray[np.int_] = np.zeros(nbins if bounds is not None else 0, dtype=np.intp)
+        #: Width of the bins of the finer histogram, always a power of two so that the bins are aligned to it.
+        self.__width = np.float_(0)
+        #: Index of the first bin of the finer histogram, where each bin ``k`` holds `k * width <= value < (k + 1) *
+        #: width`.
+        self.__origin = 0
+
+    def __grow(self, minimum: np.float_, maximum: np.float_, width: np.float_ = np.float_(0)) -> None:
+        """Grows the finer histogram to hold values between the minimum and maximum given, widening its bins if
+        needed.
+
+        :param minimum: The minimum of the values to hold.
+        :param maximum: The maximum of the values to hold.
+        :param width: The minimum width of the bins, such as the width of the bins of another finer histogram."""
+        (minimum, maximum) = (min(minimum, self.__minimum), max(maximum, self.__maximum))
+        limit = self.__nbins * self.__RESOLUTION
+
+        # The bins must hold the range of values in the maximum number of bins, and be wide enough for the indices
+        # of the bins to be represented exactly.
+        magnitude = max(abs(minimum), abs(maximum), np.finfo(np.float_).tiny)
+        width = max(
+            width,
+            np.ldexp(1.0, int(np.ceil(np.log2(max(maximum - minimum, np.finfo(np.float_).tiny) / (limit - 2))))),
+            np.ldexp(1.0, int(np.ceil(np.log2(magnitude))) + self.__MIN_RELATIVE_WIDTH),
+            self.__width,
+        )
+
+        # Widen the existing bins, each bin is merged with its neighbours in the wider bin that contains them.
+        indices = np.arange(self.__origin, self.__origin + len(self.__hist), dtype=np.int64)
+        if width > self.__width and len(self.__hist) > 0:
+            shift = int(np.log2(width / self.__width))
+            indices = np.right_shift(indices, shift)
+        origin = int(np.floor(minimum / width))
+        if len(indices) > 0:
+            origin = min(origin, int(indices[0]))
+        hist = np.zeros(int(np.floor(maximum / width)) - origin + 1, dtype=np.intp)
+        np.add.at(hist, indices - origin, self.__hist)
+
+        (self.__hist, self.__width, self.__origin) = (hist, np.float_(width), origin)
+        (self.__minimum, self.__maximum) = (minimum, maximum)
+
+    ## Protected API ###################################################################################################
+
+    ## Public API ######################################################################################################
+    @property
+    def count(self) -> int:
+        """The number of values received.
+
+        :return: The number of values."""
+        return self.__count
+
+    @property
+    def bounds(self) -> tuple[float, float] | None:
+        """The bounds of the histogram, either the fixed bounds or, for growable bounds, the bounds that
+        :meth:`.StateLevelsMixin.state_levels` would use by default for the values received so far.
+
+        :return: The lower and upper bounds, or ``None`` if no values were received with growable bounds."""
+        if self.__fixed_bounds is not None:
+            return self.__fixed_bounds
+        if self.__count == 0:
+            return None
+        return (
+            np.subtract(self.__minimum, np.finfo(np.float_).eps),
+            np.add(self.__maximum, np.finfo(np.float_).eps),
+        )
+
+    def update(self, vvalues: npt.NDArray[np.float_]) -> "StateLevelsAccumulator":
+        """Adds a chunk of values of the vertical axis of the signal to the histogram.
+
+        :param vvalues: The values for the vertical axis of the chunk.
+        :raise StateLevelsError: The values are not a `1xN` array.
+        :raise StateLevelsError: The values are not finite, only for growable bounds.
+        :return: Instance of the class."""
+        # pylint: disable=protected-access
+
+        vvalues = np.asarray(vvalues, dtype=np.float_)
+        if len(vvalues.shape) != 1:
+            raise StateLevelsError("The values of the chunk must be a 1xN array.")
+        if len(vvalues) == 0:
+            return self
+
+        # With fixed bounds, the values outside of the bounds are discarded as in numpy.histogram.
+        if self.__fixed_bounds is not None:
+            self.__hist += StateLevelsMixin._state_levels_histogram(vvalues, self.__nbins, self.__fixed_bounds)
+        # With growable bounds, grow the finer histogram first, and then count the values in its bins.
+        else:
+            (minimum, maximum) = (np.min(vvalues), np.max(vvalues))
+            if not (np.isfinite(minimum) and np.isfinite(maximum)):
+                raise StateLevelsError("The values to calculate the state levels must be finite.")
+            self.__grow(minimum, maximum)
+            indices = np.floor(vvalues / self.__width).astype(np.int64) - self.__origin
+            self.__hist += np.bincount(indices, minlength=len(self.__hist))
+
+        self.__count += len(vvalues)
+
+        return self
+
+    def merge(self, other: "StateLevelsAccumulator") -> "StateLevelsAccumulator":
+        """Merges the values received by another accumulator into this one, as if they were received by this one.
+
+        :param other: The other accumulator, with the same number of bins and bounds.
+        :raise StateLevelsError: The accumulators do not have the same number of bins and bounds.
+        :return: Instance of the class."""
+        # pylint: disable=protected-access
+
+        if self.__nbins != other.__nbins or self.__fixed_bounds != other.__fixed_bounds:
+            raise StateLevelsError("The accumulators to merge must have the same number of bins and bounds.")
+
+        # With fixed bounds, the histograms have the same bins.
+        if self.__fixed_bounds is not None:
+            self.__hist += other.__hist
+        # With growable bounds, grow the finer histogram to hold both, and then count the bins of the other one.
+        elif other.__count > 0:
+            self.__grow(other.__minimum, other.__maximum, other.__width)
+            shift = int(np.log2(self.__width / other.__width))
+            indices = np.arange(other.__origin, other.__origin + len(other.__hist), dtype=np.int64)
+            np.add.at(self.__hist, np.right_shift(indices, shift) - self.__origin, other.__hist)
+
+        self.__count += other.__count
+
+        return self
+
+    def finalize(
+        self,
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        high_ref: float = 90.0,
+        high_runt_ref: float = 70.0,
+        intermediate_ref: float = 50.0,
+        low_runt_ref: float = 30.0,
+        low_ref: float = 10.0,
+    ) -> tuple[StateLevels, tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]]:
+        """Finds the state levels of the values received, refer to :meth:`.StateLevelsMixin.state_levels` for details
+        on the arguments, the accumulator can keep receiving values afterwards.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param high_ref: A percentage reference value of the full range for the ``high`` level.
+        :param high_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param intermediate_ref: A percentage reference value of the full range for the ``intermediate`` level.
+        :param low_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param low_ref: A percentage reference value of the full range for the ``low`` level.
+        :raise StateLevelsError: No values were received.
+        :raise StateLevelsError: The reference values are not valid.
+        :raise StateLevelsError: The mode is :attr:`.Mode.PERCENTILE`, which requires all the values at once.
+        :return: The state levels and the values for the horizontal and vertical axes of the histogram."""
+        # pylint: disable=too-many-arguments,protected-access
+
+        bounds = self.bounds
+        if self.__count == 0 or bounds is None:
+            raise StateLevelsError("No values were received to calculate the state levels.")
+
+        # With growable bounds, count the values of each bin of the finer histogram in the bin of its center.
+        hist_y = self.__hist
+        if self.__fixed_bounds is None:
+            centers = (np.arange(self.__origin, self.__origin + len(self.__hist)) + 0.5) * self.__width
+            bins = ((centers - bounds[0]) / (bounds[1] - bounds[0]) * self.__nbins).astype(np.intp)
+            bins = np.clip(bins, 0, self.__nbins - 1)
+            hist_y = np.bincount(bins, weights=self.__hist, minlength=self.__nbins).astype(np.intp)
+
+        return StateLevelsMixin._state_levels_from_histogram(
+            np.copy(hist_y), bounds, mode, (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref)
+        )
@@ -1,7 +1,12 @@
 """Definitions for signal state levels."""
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 from enum import IntEnum, auto
+from typing import overload
+
+import numpy as np
+import numpy.typing as npt
 
 
 class Mode(IntEnum):
@@ -11,6 +16,9 @@ class Mode(IntEnum):
     HISTOGRAM_MODE = auto()
     #: Histograms with mean values.
     HISTOGRAM_MEAN = auto()
+    #: Medians of the values in the lower and upper halves of the range of values, found with partial sorts rather
+    #: than histograms, thus the levels do not depend on the number of bins.
+    PERCENTILE = auto()
 
 
 @dataclass
@@ -37,3 +45,50 @@ class StateLevels:
     low_runt: float
     low: float
     lowest: float
+
+
+@dataclass
+class StateLevelsArray:
+    """Definition of several state levels at once, such as those of several portions of a signal, where each field
+    is a `1xN` array with the values of that level for each of the `N` state levels, refer to :class:`.StateLevels`
+    for details on each of the levels.
+
+    :param highest: Highest levels.
+    :param high: High levels.
+    :param high_runt: High runt levels.
+    :param intermediate: Intermediate levels.
+    :param low_runt: Low runt levels.
+    :param low: Low levels.
+    :param lowest: Lowest levels."""
+
+    highest: npt.NDArray[np.float_]
+    high: npt.NDArray[np.float_]
+    high_runt: npt.NDArray[np.float_]
+    intermediate: npt.NDArray[np.float_]
+    low_runt: npt.NDArray[np.float_]
+    low: npt.NDArray[np.float_]
+    lowest: npt.NDArray[np.float_]
+
+    def __len__(self) -> int:
+        """Number of state levels.
+
+        :return: The number of state levels."""
+        return len(self.highest)
+
+    @overload
+    def __getitem__(self, index: int) -> StateLevels:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice | Sequence[int] | npt.NDArray) -> "StateLevelsArray":
+        ...
+
+    def __getitem__(self, index: int | slice | Sequence[int] | npt.NDArray) -> "StateLevels | StateLevelsArray":
+        """Obtains one of the state levels, or a subset of them.
+
+        :param index: An integer for one of the state levels, or a slice, a boolean mask or an array of indices for a
+            subset of them.
+        :return: The state levels, or the subset as a new instance."""
+        if isinstance(index, (int, np.integer)):
+            return StateLevels(**{field.name: getattr(self, field.name)[index] for field in fields(self)})
+        return StateLevelsArray(**{field.name: getattr(self, field.name)[index] for field in fields(self)})
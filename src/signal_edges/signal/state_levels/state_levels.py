@@ -46,24 +46,38 @@ This code snippet generates the following plot:
     The generated signal with the state levels calculated and the histogram."""
 
 try:
-    from typing import Literal, Self
+    from typing import Any, Literal, Self
 except ImportError:
-    from typing_extensions import Self, Literal
+    from typing_extensions import Any, Self, Literal
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import replace
 
 import numpy as np
 import numpy.typing as npt
 
 from ... import plotter as sep
 from ...exceptions import StateLevelsError
-from .definitions import Mode, StateLevels
+from .definitions import Mode, StateLevels, StateLevelsArray
 
 
 class StateLevelsMixin:
     """State levels mixin :class:`.Signal` that implements calculation of state levels based on histograms."""
 
+    # pylint: disable=too-many-instance-attributes
+
+    # pylint: disable=invalid-name
+
+    #: Number of values processed at once when computing the bounds and the histogram of the values of the signal.
+    __HISTOGRAM_BLOCK = 65536
+    #: Maximum number of values gathered at once when calculating the state levels of several windows.
+    __WINDOWS_BLOCK = 4194304
+    #: Minimum number of values in the peak of each state in the histogram of a subsample to use it for estimation.
+    __ESTIMATE_MIN_PEAK = 64
+
+    # pylint: enable=invalid-name
+
     ## Private API #####################################################################################################
     def __init__(self, *args, **kwargs) -> None:
         """Class constructor."""
@@ -75,26 +89,26 @@ class StateLevelsMixin:
         self._vv: npt.NDArray[np.float_]
         self._hunits: sep.Units
         self._vunits: sep.Units
+        self._codes: npt.NDArray[np.unsignedinteger] | None
+        self._code_values: npt.NDArray[np.float_] | None
+        self._vv_at: Callable[[npt.ArrayLike | slice], npt.NDArray[np.float_]]
+        self._hv_at: Callable[[npt.ArrayLike | slice], npt.NDArray[np.float_]]
+        self._hv_axis: npt.NDArray[np.float_] | tuple[np.float_, np.float_]
+        self._length: int
+        self._cached: Callable[[Hashable, Callable[[], Any]], Any]
 
-    ## Protected API ###################################################################################################
-
-    ## Public API ######################################################################################################
-    def state_levels(
-        self,
-        mode: Mode = Mode.HISTOGRAM_MODE,
-        nbins: int = 100,
-        bounds: tuple[float, float] | None = None,
-        high_ref: float = 90.0,
-        high_runt_ref: float = 70.0,
-        intermediate_ref: float = 50.0,
-        low_runt_ref: float = 30.0,
-        low_ref: float = 10.0,
-    ) -> tuple[StateLevels, tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]]:
-        """Finds the state levels of a signal using histograms.
+    @staticmethod
+    def __check_arguments(
+        nbins: int,
+        high_ref: float,
+        high_runt_ref: float,
+        intermediate_ref: float,
+        low_runt_ref: float,
+        low_ref: float,
+    ) -> None:
+        """Checks the arguments common to the calculation of state levels.
 
-        :param mode: The histogram mode used to calculate the state levels.
         :param nbins: Number of bins to use in the histogram.
-        :param bounds: The lower and upper bounds of the signal, defaults to minimum and maximum peak values.
         :param high_ref: A percentage reference value of the full range for the ``high`` level.
         :param high_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
         :param intermediate_ref: A percentage reference value of the full range for the ``intermediate`` level.
@@ -103,10 +117,8 @@ class StateLevelsMixin:
         :raise StateLevelsError: The reference values must be in the range `0 <= x <= 100`.
         :raise StateLevelsError: The reference values must satisfy
             `low_ref < low_runt_ref < intermediate_ref < high_runt_ref < high_ref`.
-        :raise StateLevelsError: The bounds provided must satisfy `bounds[0] <= bounds[1]`.
-        :raise StateLevelsError: The minimum number of bins is two.
-        :return: The state levels and the values for the horizontal and vertical axes of the histogram."""
-        # pylint: disable=too-many-arguments,too-many-locals
+        :raise StateLevelsError: The minimum number of bins is two."""
+        # pylint: disable=too-many-arguments
 
         # Verify the levels are in the range 0 to 100.
         if not all(0 <= i <= 100 for i in (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref)):
@@ -114,77 +126,865 @@ class StateLevelsMixin:
         # Verify the levels are ordered properly.
         if not low_ref < low_runt_ref < intermediate_ref < high_runt_ref < high_ref:
             raise StateLevelsError("Reference values must satisfy low < low_runt < intermediate < high_runt < high.")
-        # If the bounds were provided, ensure they are consistent.
-        if bounds is not None and bounds[1] < bounds[0]:
-            raise StateLevelsError("Bounds when user provided must satisfy upper bound < lower bound.")
         # Verify the number of bins.
         if nbins <= 1:
             raise StateLevelsError("The number of bins when user provided must be greater than one.")
 
-        # Obtain the maximum and minimum amplitudes, either user provided or from the data.
-        if bounds is not None:
-            lower_bound = bounds[0]
-            upper_bound = bounds[1]
-        else:
-            lower_bound = np.subtract(np.min(self._vv), np.finfo(np.float_).eps)
-            upper_bound = np.add(np.max(self._vv), np.finfo(np.float_).eps)
+    @staticmethod
+    def __histograms(
+        values: npt.NDArray[np.float_],
+        segments: npt.NDArray[np.int_],
+        nbins: int,
+        lower_bound: npt.NDArray[np.float_],
+        upper_bound: npt.NDArray[np.float_],
+    ) -> npt.NDArray[np.int_]:
+        """Computes the histograms of several segments of values at once, with the same results as computing the
+        histogram of each segment with :func:`numpy.histogram`, including the handling of values at the bin edges.
 
-        # Compute histogram.
-        hist_x = lower_bound + (np.arange(1, nbins + 1) - 0.5) * (upper_bound - lower_bound) / nbins
-        (hist_y, _) = np.histogram(self._vv, nbins, (lower_bound, upper_bound))
+        :param values: A `1xN` array with the values of all the segments, one after the other.
+        :param segments: A `1xN` array with the index of the segment of each value.
+        :param nbins: Number of bins to use in the histograms.
+        :param lower_bound: A `1xM` array with the lower bound of each of the `M` segments.
+        :param upper_bound: A `1xM` array with the upper bound of each of the `M` segments.
+        :return: A `MxB` array with the histogram of each segment, where `B` is the number of bins."""
+        # pylint: disable=too-many-arguments
+
+        # Expand empty ranges to avoid divisions by zero, and compute the edges of the bins of each histogram.
+        empty = lower_bound == upper_bound
+        first_edge = np.where(empty, lower_bound - 0.5, lower_bound)
+        last_edge = np.where(empty, upper_bound + 0.5, upper_bound)
+        bin_edges = np.arange(0, nbins + 1, dtype=np.float_) * ((last_edge - first_edge) / nbins)[:, np.newaxis]
+        bin_edges += first_edge[:, np.newaxis]
+        bin_edges[:, -1] = last_edge
+
+        # Compute the bin of each value, and correct the values within one ULP of the edges of the bins.
+        indices = (((values - first_edge[segments]) / (last_edge - first_edge)[segments]) * nbins).astype(np.intp)
+        indices[indices == nbins] -= 1
+        indices[values < bin_edges[segments, indices]] -= 1
+        indices[(values >= bin_edges[segments, indices + 1]) & (indices != nbins - 1)] += 1
+
+        # Count the values in each bin of each segment.
+        return np.bincount(segments * nbins + indices, minlength=len(lower_bound) * nbins).reshape(-1, nbins)
+
+    @classmethod
+    def __bounds(cls, values: npt.NDArray[np.float_]) -> tuple[np.float_, np.float_]:
+        """Obtains the minimum and the maximum of the values in a single pass, processing them in blocks.
+
+        :param values: A `1xN` array with the values.
+        :raise StateLevelsError: The values are not finite.
+        :return: The minimum and the maximum of the values."""
+        (minimum, maximum) = (np.float_(np.inf), np.float_(-np.inf))
+        for start in range(0, len(values), cls.__HISTOGRAM_BLOCK):
+            block = values[start : start + cls.__HISTOGRAM_BLOCK]
+            (minimum, maximum) = (min(minimum, np.float_(np.min(block))), max(maximum, np.float_(np.max(block))))
+        # NaN values propagate, and an infinite value would make the width of the bins infinite.
+        if not (np.isfinite(minimum) and np.isfinite(maximum)):
+            raise StateLevelsError("The values to calculate the state levels must be finite.")
+
+        return (minimum, maximum)
+
+    @classmethod
+    def __histogram(
+        cls,
+        values: npt.NDArray[np.float_],
+        nbins: int,
+        lower_bound: float,
+        upper_bound: float,
+        weights: npt.NDArray[np.int_] | None = None,
+    ) -> npt.NDArray[np.int_]:
+        """Computes the histogram of the values, with the same results as :func:`numpy.histogram`, including the
+        handling of values at the bin edges and outside of the bounds.
+
+        The values are processed in blocks that fit in cache, the bin of each value is computed from its position
+        between the bounds, and only the values within a few ULPs of the edges of the bins are compared with the edges
+        to correct their bins, as :func:`numpy.histogram` does for all the values.
+
+        :param values: A `1xN` array with the values.
+        :param nbins: Number of bins to use in the histogram.
+        :param lower_bound: The lower bound of the histogram.
+        :param upper_bound: The upper bound of the histogram.
+        :param weights: A `1xN` array with the number of times each value is counted, defaults to once.
+        :raise StateLevelsError: The bounds are not finite.
+        :return: A `1xB` array with the histogram, where `B` is the number of bins."""
+        # pylint: disable=too-many-locals,too-many-arguments
+
+        # Ensure the bounds are finite, and expand empty ranges to avoid divisions by zero.
+        if not (np.isfinite(lower_bound) and np.isfinite(upper_bound)):
+            raise StateLevelsError("The bounds to calculate the state levels must be finite.")
+        (first_edge, last_edge) = (np.float_(lower_bound), np.float_(upper_bound))
+        if first_edge == last_edge:
+            (first_edge, last_edge) = (first_edge - 0.5, last_edge + 0.5)
+        bin_edges = np.linspace(first_edge, last_edge, nbins + 1, endpoint=True)
+        width = last_edge - first_edge
+
+        # Maximum error, in bins, of the position of a value between the bounds, with a wide safety margin.
+        tolerance = 16 * np.finfo(np.float_).eps * (max(abs(first_edge), abs(last_edge)) * nbins / width + nbins)
+
+        hist_y = np.zeros(nbins, dtype=np.intp)
+        for start in range(0, len(values), cls.__HISTOGRAM_BLOCK):
+            # The positions of the values must be computed with the precision of the bounds, whatever their data type.
+            block = values[start : start + cls.__HISTOGRAM_BLOCK].astype(np.float_, copy=False)
+            wblock = None if weights is None else weights[start : start + cls.__HISTOGRAM_BLOCK]
+            # Discard the values outside of the bounds or NaN, which can only exist if the bounds were user provided.
+            if not first_edge <= np.min(block) <= np.max(block) <= last_edge:
+                inside = (block >= first_edge) & (block <= last_edge)
+                (block, wblock) = (block[inside], None if wblock is None else wblock[inside])
+
+            # Compute the bin of each value from its position, and the distance to the nearest edge of a bin.
+            position = ((block - first_edge) / width) * nbins
+            indices = position.astype(np.intp)
+            np.subtract(position, indices, out=position)
+            np.minimum(position, 1 - position, out=position)
+
+            # Correct the bins of the values near the edges of the bins, as in numpy.histogram.
+            near = np.flatnonzero(position < tolerance)
+            if len(near) > 0:
+                (near_values, near_indices) = (block[near], indices[near])
+                near_indices[near_indices == nbins] -= 1
+                near_indices[near_values < bin_edges[near_indices]] -= 1
+                near_indices[(near_values >= bin_edges[near_indices + 1]) & (near_indices != nbins - 1)] += 1
+                indices[near] = near_indices
+
+            if wblock is None:
+                hist_y += np.bincount(indices, minlength=nbins)
+            else:
+                hist_y += np.bincount(indices, weights=wblock, minlength=nbins).astype(np.intp)
+
+        return hist_y
+
+    @classmethod
+    def __separated(cls, hist_y: npt.NDArray[np.int_]) -> bool:
+        """Checks if the states in the histogram of a subsample of values are well separated, which is the case if
+        each of the lower and upper halves of the histogram has a clear peak, and there is a valley between them.
+
+        A peak is clear if it has enough values, and no other bin of its half, other than its neighbours, could be the
+        peak instead due to the sampling noise, taken as three times the standard deviation of its count.
+
+        :param hist_y: A `1xB` array with the histogram, where `B` is the number of bins.
+        :return: ``True`` if the states are well separated, ``False`` otherwise."""
+        nonzero = np.flatnonzero(hist_y)
+        if len(nonzero) == 0:
+            return False
+
+        # Split the histogram in halves as for the calculation of the state levels, and find the peak of each.
+        (lowest, highest) = (int(nonzero[0]), int(nonzero[-1]))
+        split = lowest + (highest - lowest) // 2
+        peaks = []
+        for offset, half in ((lowest, hist_y[lowest : split + 1]), (split, hist_y[split : highest + 1])):
+            peak = int(np.argmax(half))
+            rivals = half[np.abs(np.arange(0, len(half)) - peak) > 1]
+            if half[peak] < cls.__ESTIMATE_MIN_PEAK or np.any(rivals >= half[peak] - 3 * np.sqrt(half[peak])):
+                return False
+            peaks.append(offset + peak)
+
+        # The valley between the peaks must be well below both of them.
+        valley = np.min(hist_y[peaks[0] : peaks[1] + 1])
+        return peaks[1] - peaks[0] >= 2 and valley <= min(hist_y[peaks[0]], hist_y[peaks[1]]) / 4
+
+    @classmethod
+    def __levels_from_histograms(
+        cls,
+        mode: Mode,
+        hist_y: npt.NDArray[np.int_],
+        lower_bound: npt.NDArray[np.float_],
+        upper_bound: npt.NDArray[np.float_],
+        refs: tuple[float, float, float, float, float],
+    ) -> StateLevelsArray:
+        """Calculates the state levels from several histograms at once.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param hist_y: A `MxB` array with the `M` histograms, where `B` is the number of bins.
+        :param lower_bound: A `1xM` array with the lower bound of the values of each histogram.
+        :param upper_bound: A `1xM` array with the upper bound of the values of each histogram.
+        :param refs: The percentage reference values for ``high``, ``high_runt``, ``intermediate``, ``low_runt``
+            and ``low`` levels.
+        :return: The state levels for each of the histograms."""
+        # pylint: disable=too-many-arguments,too-many-locals
+
+        nbins = hist_y.shape[1]
+        nonzero = hist_y > 0
+        bins = np.arange(1, nbins + 1)
 
         # Get the lowest-indexed histogram bin with non-zero count.
-        idx_lowest = np.where(hist_y > 0)[0][0] + 1
+        idx_lowest = np.argmax(nonzero, axis=1) + 1
         # Get the highest-indexed histogram bin with non-zero count.
-        idx_highest = np.where(hist_y > 0)[0][-1] + 1
+        idx_highest = nbins - np.argmax(nonzero[:, ::-1], axis=1)
 
         idx_low_low = idx_lowest
-        idx_low_high = idx_lowest + np.int_(np.floor((idx_highest - idx_lowest) / 2))
+        idx_low_high = idx_lowest + np.floor((idx_highest - idx_lowest) / 2).astype(np.int_)
         idx_upper_low = idx_low_high
         idx_upper_high = idx_highest
 
-        # Calculate lower histogram.
-        low_hist = hist_y[idx_low_low - 1 : idx_low_high]
-        # Calculate upper histogram.
-        upper_hist = hist_y[idx_upper_low - 1 : idx_upper_high]
+        # Calculate lower histogram, with the bins outside of it masked.
+        low_mask = (bins >= idx_low_low[:, np.newaxis]) & (bins <= idx_low_high[:, np.newaxis])
+        # Calculate upper histogram, with the bins outside of it masked.
+        upper_mask = (bins >= idx_upper_low[:, np.newaxis]) & (bins <= idx_upper_high[:, np.newaxis])
 
         # Calculate amplitude to ratio.
-        amp_ratio = (upper_bound - lower_bound) / len(hist_y)
+        amp_ratio = (upper_bound - lower_bound) / nbins
 
         # Calculate low and high values, using the mode specified.
         if mode is Mode.HISTOGRAM_MODE:
-            idx_max = np.add(np.argmax(low_hist), 1)
-            idx_min = np.add(np.argmax(upper_hist), 1)
+            idx_max = np.argmax(np.where(low_mask, hist_y, -1), axis=1) + 1 - (idx_low_low - 1)
+            idx_min = np.argmax(np.where(upper_mask, hist_y, -1), axis=1) + 1 - (idx_upper_low - 1)
             lowest_value = lower_bound + amp_ratio * (idx_low_low + idx_max - 1.5)
             highest_value = lower_bound + amp_ratio * (idx_upper_low + idx_min - 1.5)
         else:
-            lowest_value = lower_bound + amp_ratio * np.dot(
-                np.arange(idx_low_low, idx_low_high + 1) - 0.5, low_hist
-            ) / np.sum(low_hist)
-            highest_value = lower_bound + amp_ratio * np.dot(
-                np.arange(idx_upper_low, idx_upper_high + 1) - 0.5, upper_hist
-            ) / np.sum(upper_hist)
+            # The ranges of the histograms differ, thus the means are calculated one histogram at a time.
+            (lowest_value, highest_value) = (np.empty(len(hist_y)), np.empty(len(hist_y)))
+            for i, row in enumerate(hist_y):
+                low_hist = row[idx_low_low[i] - 1 : idx_low_high[i]]
+                upper_hist = row[idx_upper_low[i] - 1 : idx_upper_high[i]]
+                lowest_value[i] = lower_bound[i] + amp_ratio[i] * np.dot(
+                    np.arange(idx_low_low[i], idx_low_high[i] + 1) - 0.5, low_hist
+                ) / np.sum(low_hist)
+                highest_value[i] = lower_bound[i] + amp_ratio[i] * np.dot(
+                    np.arange(idx_upper_low[i], idx_upper_high[i] + 1) - 0.5, upper_hist
+                ) / np.sum(upper_hist)
+
+        return cls.__levels_from_range(lowest_value, highest_value, refs)
+
+    @staticmethod
+    def __states_from_histogram(
+        mode: Mode, hist_y: npt.NDArray[np.int_], bounds: tuple[float, float], states: int
+    ) -> npt.NDArray[np.float_]:
+        """Calculates the levels of several states from a histogram, by splitting the range of bins with values in as
+        many ranges as states, each centered on the level the state would have if the states were evenly spaced, and
+        finding the peak of each range at once.
+
+        With two states, the ranges are the lower and upper halves of the histogram, and the levels are the ``lowest``
+        and ``highest`` levels as calculated by :meth:`.StateLevelsMixin.state_levels`.
+
+        :param mode: The histogram mode used to calculate the levels.
+        :param hist_y: A `1xB` array with the histogram, where `B` is the number of bins.
+        :param bounds: The lower and upper bounds of the histogram.
+        :param states: The number of states.
+        :raise StateLevelsError: There are no values within the range of one of the states.
+        :return: A `1xS` array with the level of each of the `S` states, from the lowest to the highest."""
+        nbins = len(hist_y)
+        nonzero = np.flatnonzero(hist_y)
+        if len(nonzero) == 0:
+            raise StateLevelsError("There are no values within the bounds to calculate the state levels.")
+
+        # Get the first and last bins of the range of each state, which share the bins at the boundaries.
+        (idx_lowest, idx_highest) = (nonzero[0] + 1, nonzero[-1] + 1)
+        splits = idx_lowest + np.floor_divide(
+            np.arange(1, 2 * states - 2, 2) * (idx_highest - idx_lowest), 2 * (states - 1)
+        )
+        (first, last) = (np.append(idx_lowest, splits), np.append(splits, idx_highest))
+
+        # Find the peak of the histogram of each range, with the bins outside of the range masked.
+        bins = np.arange(1, nbins + 1)
+        masked = np.where((bins >= first[:, np.newaxis]) & (bins <= last[:, np.newaxis]), hist_y, 0)
+        if np.any(np.sum(masked, axis=1) == 0):
+            raise StateLevelsError(f"There are no values within the range of each of the {states} states.")
+        amp_ratio = (bounds[1] - bounds[0]) / nbins
+        if mode is Mode.HISTOGRAM_MODE:
+            return bounds[0] + amp_ratio * (np.argmax(masked, axis=1) + 0.5)
+        return bounds[0] + amp_ratio * np.dot(masked, bins - 0.5) / np.sum(masked, axis=1)
+
+    @staticmethod
+    def __levels_from_range(
+        lowest_value: npt.NDArray[np.float_],
+        highest_value: npt.NDArray[np.float_],
+        refs: tuple[float, float, float, float, float],
+    ) -> StateLevelsArray:
+        """Calculates the state levels from their ``lowest`` and ``highest`` levels.
+
+        :param lowest_value: A `1xM` array with the ``lowest`` level of each of the `M` state levels.
+        :param highest_value: A `1xM` array with the ``highest`` level of each of the `M` state levels.
+        :param refs: The percentage reference values for ``high``, ``high_runt``, ``intermediate``, ``low_runt``
+            and ``low`` levels.
+        :return: The state levels."""
+        (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref) = refs
 
         # Calculate full range, and from it, the remaining values based on the percentages.
         full_range = np.abs(highest_value - lowest_value)
-        high_value = lowest_value + (high_ref / 100) * full_range
-        high_runt_value = lowest_value + (high_runt_ref / 100) * full_range
-        intermediate_value = lowest_value + (intermediate_ref / 100) * full_range
-        low_runt_value = lowest_value + (low_runt_ref / 100) * full_range
-        low_value = lowest_value + (low_ref / 100) * full_range
+
+        return StateLevelsArray(
+            highest=highest_value,
+            high=lowest_value + (high_ref / 100) * full_range,
+            high_runt=lowest_value + (high_runt_ref / 100) * full_range,
+            intermediate=lowest_value + (intermediate_ref / 100) * full_range,
+            low_runt=lowest_value + (low_runt_ref / 100) * full_range,
+            low=lowest_value + (low_ref / 100) * full_range,
+            lowest=lowest_value,
+        )
+
+    @staticmethod
+    def __median(values: npt.NDArray[np.float_], weights: npt.NDArray[np.int_] | None = None) -> np.float_:
+        """Finds the median of the values with a partial sort, as the mean of the two middle values for an even
+        number of values.
+
+        :param values: A `1xN` array with the values, which is partially sorted in place.
+        :param weights: A `1xN` array with the number of times each value is counted, defaults to once.
+        :raise StateLevelsError: There are no values.
+        :return: The median of the values."""
+        if len(values) == 0:
+            raise StateLevelsError("There are no values within the bounds to calculate the state levels.")
+
+        if weights is None:
+            ranks = ((len(values) - 1) // 2, len(values) // 2)
+            values.partition(ranks)
+            return (np.float_(values[ranks[0]]) + values[ranks[1]]) / 2
+
+        # With weights, find the values at the middle ranks from the cumulative counts of the sorted values.
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        ranks = ((cumulative[-1] - 1) // 2, cumulative[-1] // 2)
+        middle = values[order[np.searchsorted(cumulative, ranks, side="right")]]
+        return (np.float_(middle[0]) + middle[1]) / 2
+
+    @classmethod
+    def __medians_ranges(
+        cls, values: npt.NDArray[np.float_], weights: npt.NDArray[np.int_] | None, edges: npt.NDArray[np.float_]
+    ) -> npt.NDArray[np.float_]:
+        """Finds the medians of the values in consecutive ranges, values outside of all the ranges are discarded.
+
+        :param values: A `1xN` array with the values.
+        :param weights: A `1xN` array with the number of times each value is counted, or ``None`` for once.
+        :param edges: A `1x(R+1)` array with the edges of the `R` ranges, where each range includes both of its edges.
+        :raise StateLevelsError: There are no values within one of the ranges.
+        :return: A `1xR` array with the median of each range."""
+        values = values.astype(np.float_, copy=False)
+        ranges = ((values >= low) & (values <= high) for (low, high) in zip(edges[:-1], edges[1:]))
+        return np.array(
+            [cls.__median(values[inside], None if weights is None else weights[inside]) for inside in ranges],
+            dtype=np.float_,
+        )
+
+    @staticmethod
+    def __medians(
+        values: npt.NDArray[np.float_],
+        segments: npt.NDArray[np.int_],
+        offsets: npt.NDArray[np.int_],
+        lower_bound: npt.NDArray[np.float_],
+        upper_bound: npt.NDArray[np.float_],
+    ) -> tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+        """Finds the medians of the values in the lower and upper halves of the bounds of several segments at once,
+        with the same results as finding them for the values of each segment on their own.
+
+        :param values: A `1xN` array with the values of all segments, one segment after the other, and sorted within
+            each segment.
+        :param segments: A `1xN` array with the segment of each value.
+        :param offsets: A `1xM` array with the index of the first value of each of the `M` segments.
+        :param lower_bound: A `1xM` array with the lower bound of the values of each segment.
+        :param upper_bound: A `1xM` array with the upper bound of the values of each segment.
+        :return: Two `1xM` arrays with the medians of the lower and upper halves of each segment."""
+        # The values of each half are consecutive in the sorted values of the segment, at its beginning and its end.
+        middle = (lower_bound + upper_bound) / 2
+        lower = np.add.reduceat(values <= middle[segments], offsets)
+        upper = np.add.reduceat(values >= middle[segments], offsets)
+        upper_offsets = np.append(offsets[1:], len(values)) - upper
 
         return (
-            StateLevels(
-                highest=highest_value,
-                high=high_value,
-                high_runt=high_runt_value,
-                intermediate=intermediate_value,
-                low_runt=low_runt_value,
-                low=low_value,
-                lowest=lowest_value,
-            ),
-            (hist_x, hist_y),
+            (values[offsets + (lower - 1) // 2] + values[offsets + lower // 2]) / 2,
+            (values[upper_offsets + (upper - 1) // 2] + values[upper_offsets + upper // 2]) / 2,
+        )
+
+    @classmethod
+    def __levels_from_segments(
+        cls,
+        values: npt.NDArray[np.float_],
+        segments: npt.NDArray[np.int_],
+        offsets: npt.NDArray[np.int_],
+        mode: Mode,
+        nbins: int,
+        refs: tuple[float, float, float, float, float],
+    ) -> StateLevelsArray:
+        """Calculates the state levels of several segments of values at once, with the bounds of each segment.
+
+        :param values: A `1xN` array with the values of all the segments, one after the other.
+        :param segments: A `1xN` array with the index of the segment of each value.
+        :param offsets: A `1xM` array with the index of the first value of each of the `M` segments.
+        :param mode: The mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histograms.
+        :param refs: The percentage reference values for ``high``, ``high_runt``, ``intermediate``, ``low_runt``
+            and ``low`` levels.
+        :raise StateLevelsError: The values of a segment are not finite.
+        :return: The state levels of each of the segments."""
+        # pylint: disable=too-many-arguments
+
+        # Obtain the minimum and maximum amplitudes of each segment.
+        lower_bound = np.subtract(np.minimum.reduceat(values, offsets), np.finfo(np.float_).eps)
+        upper_bound = np.add(np.maximum.reduceat(values, offsets), np.finfo(np.float_).eps)
+        if not np.all(np.isfinite(lower_bound) & np.isfinite(upper_bound)):
+            raise StateLevelsError("The values of the segments to calculate the state levels must be finite.")
+
+        # The lowest and highest levels are the medians of the values in the lower and upper halves of the bounds of
+        # each segment, which are consecutive once the values of each segment are sorted.
+        if mode is Mode.PERCENTILE:
+            values = values[np.lexsort((values, segments))]
+            return cls.__levels_from_range(*cls.__medians(values, segments, offsets, lower_bound, upper_bound), refs)
+
+        # Compute histograms and the state levels from them.
+        hist_y = cls.__histograms(values, segments, nbins, lower_bound, upper_bound)
+
+        return cls.__levels_from_histograms(mode, hist_y, lower_bound, upper_bound, refs)
+
+    @staticmethod
+    def __concatenate(blocks: Sequence[StateLevelsArray]) -> StateLevelsArray:
+        """Concatenates the state levels of several blocks, one after the other.
+
+        :param blocks: The state levels of each block.
+        :return: The state levels of all the blocks."""
+        return StateLevelsArray(
+            **{name: np.concatenate([getattr(i, name) for i in blocks]) for name in StateLevels.__annotations__}
+        )
+
+    def __histogram_values(
+        self, nbins: int, bounds: tuple[float, float] | None
+    ) -> tuple[npt.NDArray[np.float_], npt.NDArray[np.int_] | None, tuple[float, float], npt.NDArray[np.int_]]:
+        """Computes the histogram of the values of the signal, for the calculation of the state levels.
+
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the signal, defaults to minimum and maximum peak values.
+        :raise StateLevelsError: The bounds, either provided or from the values of the signal, are not finite.
+        :return: The values counted, the number of times each of them is counted or ``None`` for once, the bounds and
+            the histogram."""
+        # For signals created from codes, count each code with a single pass over the codes, and compute the histogram
+        # from the value of each code present weighted by its count, which is the same histogram as that of the values.
+        (codes, code_values) = (self._codes, self._code_values)
+        if codes is not None and code_values is not None:
+            weights = np.bincount(codes, minlength=len(code_values))
+            present = np.flatnonzero(weights)
+            (values, weights) = (code_values[present], weights[present])
+        else:
+            (values, weights) = (self._vv, None)
+
+        # Obtain the maximum and minimum amplitudes, either user provided or from the data.
+        if bounds is not None:
+            lower_bound = bounds[0]
+            upper_bound = bounds[1]
+        else:
+            (minimum, maximum) = self.__bounds(values)
+            lower_bound = np.subtract(minimum, np.finfo(np.float_).eps)
+            upper_bound = np.add(maximum, np.finfo(np.float_).eps)
+
+        hist_y = self.__histogram(values, nbins, lower_bound, upper_bound, weights)
+
+        return (values, weights, (lower_bound, upper_bound), hist_y)
+
+    def __state_levels(
+        self,
+        mode: Mode,
+        nbins: int,
+        bounds: tuple[float, float] | None,
+        refs: tuple[float, float, float, float, float],
+    ) -> tuple[StateLevels, tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]]:
+        """Finds the state levels of a signal using histograms, see :meth:`.StateLevelsMixin.state_levels`.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the signal, defaults to minimum and maximum peak values.
+        :param refs: The percentage reference values for ``high``, ``high_runt``, ``intermediate``, ``low_runt``
+            and ``low`` levels.
+        :raise StateLevelsError: The reference values, the bounds or the number of bins are not valid.
+        :raise StateLevelsError: The bounds, either provided or from the values of the signal, are not finite.
+        :raise StateLevelsError: There are no values within one of the halves of the bounds, for the percentile mode.
+        :return: The state levels and the values for the horizontal and vertical axes of the histogram."""
+        self.__check_arguments(nbins, *refs)
+        # If the bounds were provided, ensure they are consistent.
+        if bounds is not None and bounds[1] < bounds[0]:
+            raise StateLevelsError("Bounds when user provided must satisfy upper bound < lower bound.")
+
+        # Compute histogram, and calculate the state levels from it.
+        (values, weights, (lower_bound, upper_bound), hist_y) = self.__histogram_values(nbins, bounds)
+        if mode is not Mode.PERCENTILE:
+            return self._state_levels_from_histogram(hist_y, (lower_bound, upper_bound), mode, refs)
+
+        # The lowest and highest levels are the medians of the values in the lower and upper halves of the bounds,
+        # the histogram is still returned for reference.
+        (_, histogram) = self._state_levels_from_histogram(
+            hist_y, (lower_bound, upper_bound), Mode.HISTOGRAM_MODE, refs
+        )
+        medians = self.__medians_ranges(
+            values, weights, np.array([lower_bound, (lower_bound + upper_bound) / 2, upper_bound])
+        )
+        levels = self.__levels_from_range(medians[:-1], medians[1:], refs)
+
+        return (levels[0], histogram)
+
+    ## Protected API ###################################################################################################
+    @classmethod
+    def _state_levels_histogram(
+        cls, values: npt.NDArray[np.float_], nbins: int, bounds: tuple[float, float]
+    ) -> npt.NDArray[np.int_]:
+        """Computes the histogram of the values given, with the same bins as :meth:`.StateLevelsMixin.state_levels`
+        for the bounds given, values outside of the bounds are discarded.
+
+        :param values: A `1xN` array with the values.
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the histogram.
+        :raise StateLevelsError: The bounds are not finite.
+        :return: A `1xB` array with the histogram, where `B` is the number of bins."""
+        return cls.__histogram(values, nbins, bounds[0], bounds[1])
+
+    @classmethod
+    def _state_levels_from_histogram(
+        cls,
+        hist_y: npt.NDArray[np.int_],
+        bounds: tuple[float, float],
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        refs: tuple[float, float, float, float, float] = (90.0, 70.0, 50.0, 30.0, 10.0),
+    ) -> tuple[StateLevels, tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]]:
+        """Calculates the state levels from a histogram, as :meth:`.StateLevelsMixin.state_levels` does from the
+        histogram of the values of the signal.
+
+        :param hist_y: A `1xB` array with the histogram, where `B` is the number of bins.
+        :param bounds: The lower and upper bounds of the histogram.
+        :param mode: The histogram mode used to calculate the state levels.
+        :param refs: The percentage reference values for ``high``, ``high_runt``, ``intermediate``, ``low_runt``
+            and ``low`` levels, see :meth:`.StateLevelsMixin.state_levels`.
+        :raise StateLevelsError: The reference values or the number of bins are not valid.
+        :raise StateLevelsError: The mode is :attr:`.Mode.PERCENTILE`, which requires the values.
+        :return: The state levels and the values for the horizontal and vertical axes of the histogram."""
+        nbins = len(hist_y)
+        cls.__check_arguments(nbins, *refs)
+        if mode is Mode.PERCENTILE:
+            raise StateLevelsError("The percentile mode requires the values, it cannot be used with a histogram.")
+
+        (lower_bound, upper_bound) = bounds
+        hist_x = lower_bound + (np.arange(1, nbins + 1) - 0.5) * (upper_bound - lower_bound) / nbins
+        levels = cls.__levels_from_histograms(
+            mode,
+            hist_y[np.newaxis, :],
+            np.array([lower_bound], dtype=np.float_),
+            np.array([upper_bound], dtype=np.float_),
+            refs,
+        )
+
+        return (levels[0], (hist_x, hist_y))
+
+    def _state_levels_segments(
+        self,
+        begin: npt.NDArray[np.int_],
+        end: npt.NDArray[np.int_],
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        nbins: int = 100,
+        refs: tuple[float, float, float, float, float] = (90.0, 70.0, 50.0, 30.0, 10.0),
+    ) -> StateLevelsArray:
+        """Finds the state levels of several segments of the signal at once, with the same results as calculating
+        the state levels of each segment as a signal on its own with :meth:`.StateLevelsMixin.state_levels`.
+
+        :param begin: A `1xM` array with the value for the beginning of each of the `M` segments.
+        :param end: A `1xM` array with the value for the end of each of the `M` segments, included in the segment.
+        :param mode: The histogram mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram.
+        :param refs: The percentage reference values for ``high``, ``high_runt``, ``intermediate``, ``low_runt``
+            and ``low`` levels, see :meth:`.StateLevelsMixin.state_levels`.
+        :raise StateLevelsError: The reference values or the number of bins are not valid.
+        :raise StateLevelsError: The segments must satisfy `0 <= begin <= end < len(values)`.
+        :raise StateLevelsError: The values of a segment are not finite.
+        :return: The state levels of each of the segments."""
+        # pylint: disable=too-many-arguments
+
+        self.__check_arguments(nbins, *refs)
+        # Verify the segments are within the signal.
+        if np.any(begin < 0) or np.any(begin > end) or np.any(end >= self._length):
+            raise StateLevelsError("The segments must satisfy 0 <= begin <= end < len(values).")
+
+        # Gather the values of all segments one after the other, segments might overlap in the signal.
+        lengths = end - begin + 1
+        offsets = np.cumsum(lengths) - lengths
+        segments = np.repeat(np.arange(0, len(begin)), lengths)
+        values = self._vv_at(np.arange(0, np.sum(lengths)) - offsets[segments] + begin[segments])
+
+        return self.__levels_from_segments(values, segments, offsets, mode, nbins, refs)
+
+    ## Public API ######################################################################################################
+    def state_levels(
+        self,
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        nbins: int = 100,
+        bounds: tuple[float, float] | None = None,
+        high_ref: float = 90.0,
+        high_runt_ref: float = 70.0,
+        intermediate_ref: float = 50.0,
+        low_runt_ref: float = 30.0,
+        low_ref: float = 10.0,
+    ) -> tuple[StateLevels, tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]]:
+        """Finds the state levels of a signal using histograms, or the medians of halves of its values for
+        :attr:`.Mode.PERCENTILE`.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the signal, defaults to minimum and maximum peak values.
+        :param high_ref: A percentage reference value of the full range for the ``high`` level.
+        :param high_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param intermediate_ref: A percentage reference value of the full range for the ``intermediate`` level.
+        :param low_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param low_ref: A percentage reference value of the full range for the ``low`` level.
+        :raise StateLevelsError: The reference values must be in the range `0 <= x <= 100`.
+        :raise StateLevelsError: The reference values must satisfy
+            `low_ref < low_runt_ref < intermediate_ref < high_runt_ref < high_ref`.
+        :raise StateLevelsError: The bounds provided must satisfy `bounds[0] <= bounds[1]`.
+        :raise StateLevelsError: The minimum number of bins is two.
+        :raise StateLevelsError: The bounds, either provided or from the values of the signal, are not finite.
+        :raise StateLevelsError: There are no values within one of the halves of the bounds, for the percentile mode.
+        :return: The state levels and the values for the horizontal and vertical axes of the histogram."""
+        # pylint: disable=too-many-arguments
+
+        # The results are cached by their arguments, and copied as they are mutable.
+        refs = (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref)
+        key = ("state_levels", mode, nbins, None if bounds is None else tuple(bounds), refs)
+        (levels, (hist_x, hist_y)) = self._cached(key, lambda: self.__state_levels(mode, nbins, bounds, refs))
+
+        return (replace(levels), (np.copy(hist_x), np.copy(hist_y)))
+
+    def state_levels_estimate(
+        self,
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        nbins: int = 100,
+        bounds: tuple[float, float] | None = None,
+        high_ref: float = 90.0,
+        high_runt_ref: float = 70.0,
+        intermediate_ref: float = 50.0,
+        low_runt_ref: float = 30.0,
+        low_ref: float = 10.0,
+        samples: int = 65536,
+    ) -> tuple[StateLevels, tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]], float]:
+        """Estimates the state levels of a signal from the histogram of a random subsample of its values, which is
+        considerably faster than :meth:`.StateLevelsMixin.state_levels` for long signals with well separated states,
+        such as clean two-level signals.
+
+        The bounds of the histogram are still those of all the values, thus the bins are the same as those of
+        :meth:`.StateLevelsMixin.state_levels` and the levels estimated are within a bin of the exact ones, this
+        is reported as the uncertainty of the estimation. If the states in the histogram of the subsample are not
+        well separated, the signal is not long enough, it was created from codes or the mode is
+        :attr:`.Mode.PERCENTILE`, which does not use the histogram, the estimation falls back to the full calculation
+        with :meth:`.StateLevelsMixin.state_levels`, in which case the uncertainty is zero.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the signal, defaults to minimum and maximum peak values.
+        :param high_ref: A percentage reference value of the full range for the ``high`` level.
+        :param high_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param intermediate_ref: A percentage reference value of the full range for the ``intermediate`` level.
+        :param low_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param low_ref: A percentage reference value of the full range for the ``low`` level.
+        :param samples: Number of values in the subsample, signals with less than four times as many values are not
+            subsampled.
+        :raise StateLevelsError: The reference values, the bounds or the number of bins are not valid, see
+            :meth:`.StateLevelsMixin.state_levels`.
+        :raise StateLevelsError: The number of values in the subsample is not a positive number.
+        :return: The state levels, the values for the horizontal and vertical axes of the histogram, and the
+            uncertainty of the ``lowest`` and ``highest`` levels in units of the vertical axis."""
+        # pylint: disable=too-many-arguments,too-many-locals
+
+        refs = (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref)
+        self.__check_arguments(nbins, *refs)
+        if samples < 1:
+            raise StateLevelsError(f"The number of values in the subsample, {samples}, must be a positive number.")
+        # If the bounds were provided, ensure they are consistent.
+        if bounds is not None and bounds[1] < bounds[0]:
+            raise StateLevelsError("Bounds when user provided must satisfy upper bound < lower bound.")
+
+        # Signals created from codes are not subsampled, as all the codes are counted in a single pass anyway.
+        if self._length >= 4 * samples and self._codes is None and mode is not Mode.PERCENTILE:
+            # Take a random subsample, which avoids aliasing with periodic signals, with a fixed seed for repeatability.
+            indices = np.sort(np.random.default_rng(0).integers(0, self._length, samples))
+            values = self._vv_at(indices)
+
+            # Obtain the bounds from all the values, and add the values at the bounds to the subsample, so that the
+            # lowest and highest bins of the histogram are the same as those of all the values.
+            if bounds is not None:
+                (lower_bound, upper_bound) = bounds
+            else:
+                (minimum, maximum) = self.__bounds(self._vv)
+                values = np.append(values, (minimum, maximum))
+                lower_bound = np.subtract(minimum, np.finfo(np.float_).eps)
+                upper_bound = np.add(maximum, np.finfo(np.float_).eps)
+
+            # Use the histogram of the subsample only if the states are well separated in it.
+            hist_y = self.__histogram(values, nbins, lower_bound, upper_bound)
+            if self.__separated(hist_y):
+                (levels, histogram) = self._state_levels_from_histogram(hist_y, (lower_bound, upper_bound), mode, refs)
+                return (levels, histogram, float((upper_bound - lower_bound) / nbins))
+            self._logger.debug("The states are not well separated in the subsample, using all the values.")
+
+        (levels, histogram) = self.state_levels(mode, nbins, bounds, *refs)
+
+        return (levels, histogram, 0.0)
+
+    def state_levels_windowed(
+        self,
+        window: int,
+        step: int | None = None,
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        nbins: int = 100,
+        high_ref: float = 90.0,
+        high_runt_ref: float = 70.0,
+        intermediate_ref: float = 50.0,
+        low_runt_ref: float = 30.0,
+        low_ref: float = 10.0,
+        per_value: bool = False,
+    ) -> StateLevelsArray:
+        """Finds the state levels of windows of the signal, for signals whose baseline drifts over time, with the same
+        results as calculating the state levels of each window as a signal on its own.
+
+        The windows start every ``step`` values from the beginning of the signal, and the last window ends at the end
+        of the signal. The histograms of all the windows are computed at once, in blocks of windows for long signals.
+
+        :param window: Number of values in each window, the whole signal if it is longer than the signal.
+        :param step: Number of values between the beginning of consecutive windows, defaults to the window length.
+        :param mode: The histogram mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram.
+        :param high_ref: A percentage reference value of the full range for the ``high`` level.
+        :param high_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param intermediate_ref: A percentage reference value of the full range for the ``intermediate`` level.
+        :param low_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param low_ref: A percentage reference value of the full range for the ``low`` level.
+        :param per_value: If ``True``, return the state levels of the window whose center is the nearest to each value
+            of the signal instead, which can be used directly for the extraction of edges.
+        :raise StateLevelsError: The window length or the step are not positive numbers.
+        :raise StateLevelsError: The reference values or the number of bins are not valid.
+        :raise StateLevelsError: The values of a window are not finite.
+        :return: The state levels of each window, or of each value of the signal."""
+        # pylint: disable=too-many-arguments,too-many-locals
+
+        refs = (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref)
+        step = window if step is None else step
+        if window < 1 or step < 1:
+            raise StateLevelsError(f"The window length, {window}, and the step, {step}, must be positive numbers.")
+
+        # Get the windows, the last one ends at the end of the signal.
+        window = min(window, self._length)
+        begin = np.arange(0, self._length - window + 1, step)
+        if begin[-1] + window < self._length:
+            begin = np.append(begin, self._length - window)
+
+        # Calculate the state levels of the windows in blocks, as the values of the windows are gathered.
+        count = max(self.__WINDOWS_BLOCK // window, 1)
+        blocks = [
+            self._state_levels_segments(begin[i : i + count], begin[i : i + count] + window - 1, mode, nbins, refs)
+            for i in range(0, len(begin), count)
+        ]
+        levels = self.__concatenate(blocks)
+
+        if not per_value:
+            return levels
+        # Each value takes the levels of the window with the nearest center, the first one for the same distance.
+        centers = begin + (window - 1) / 2
+        return levels[np.searchsorted((centers[:-1] + centers[1:]) / 2, np.arange(0, self._length), "left")]
+
+    @classmethod
+    def state_levels_batch(
+        cls,
+        vvalues: npt.ArrayLike,
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        nbins: int = 100,
+        high_ref: float = 90.0,
+        high_runt_ref: float = 70.0,
+        intermediate_ref: float = 50.0,
+        low_runt_ref: float = 30.0,
+        low_ref: float = 10.0,
+    ) -> StateLevelsArray:
+        """Finds the state levels of each row of a `RxS` array at once, such as the `R` records of `S` values of a
+        segmented acquisition, with the same results as calculating the state levels of each row as a signal on its
+        own with :meth:`.StateLevelsMixin.state_levels` and the default bounds.
+
+        The rows are processed without creating a signal for each of them, with the bounds of each row and the
+        histograms of all the rows computed at once, in blocks of rows for large arrays.
+
+        :param vvalues: A `RxS` array with the values for the vertical axis of each row.
+        :param mode: The mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram.
+        :param high_ref: A percentage reference value of the full range for the ``high`` level.
+        :param high_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param intermediate_ref: A percentage reference value of the full range for the ``intermediate`` level.
+        :param low_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param low_ref: A percentage reference value of the full range for the ``low`` level.
+        :raise StateLevelsError: The values are not a `RxS` array with at least one value in each row.
+        :raise StateLevelsError: The reference values or the number of bins are not valid.
+        :raise StateLevelsError: The values of a row are not finite.
+        :return: The state levels of each row."""
+        # pylint: disable=too-many-arguments,too-many-locals
+
+        refs = (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref)
+        cls.__check_arguments(nbins, *refs)
+        vvalues = np.asarray(vvalues, dtype=np.float_)
+        if len(vvalues.shape) != 2 or vvalues.shape[1] == 0:
+            raise StateLevelsError("The values must be a RxS array with at least one value in each row.")
+
+        # Calculate the state levels of the rows in blocks, each block is a view of its rows one after the other.
+        (records, samples) = vvalues.shape
+        count = max(cls.__WINDOWS_BLOCK // samples, 1)
+        blocks = []
+        for start in range(0, records, count):
+            block = np.ascontiguousarray(vvalues[start : start + count]).reshape(-1)
+            rows = len(block) // samples
+            blocks.append(
+                cls.__levels_from_segments(
+                    block, np.repeat(np.arange(0, rows), samples), np.arange(0, rows) * samples, mode, nbins, refs
+                )
+            )
+
+        return cls.__concatenate(blocks) if len(blocks) > 0 else cls.__levels_from_range(np.empty(0), np.empty(0), refs)
+
+    def state_levels_multi(
+        self,
+        states: int,
+        mode: Mode = Mode.HISTOGRAM_MODE,
+        nbins: int = 100,
+        bounds: tuple[float, float] | None = None,
+        high_ref: float = 90.0,
+        high_runt_ref: float = 70.0,
+        intermediate_ref: float = 50.0,
+        low_runt_ref: float = 30.0,
+        low_ref: float = 10.0,
+    ) -> tuple[list[StateLevels], tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]]:
+        """Finds the state levels of a signal with more than two states, such as a pulse amplitude modulated signal,
+        from a single histogram of its values.
+
+        The range of values is split in as many ranges as states, each centered on the level the state would have if
+        the states were evenly spaced, and the level of each state is found in its range with the mode given, as
+        :meth:`.StateLevelsMixin.state_levels` does for the lower and upper halves of the values. The state levels are
+        then calculated for each pair of adjacent states, with the lower state as the ``lowest`` level and the upper
+        state as the ``highest`` level, which can be used directly for the extraction of edges with
+        :meth:`.EdgesMixin.edges_multi`.
+
+        :param states: The number of states, at least two and at most the number of bins.
+        :param mode: The mode used to calculate the level of each state.
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the signal, defaults to minimum and maximum peak values.
+        :param high_ref: A percentage reference value of the full range for the ``high`` level.
+        :param high_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param intermediate_ref: A percentage reference value of the full range for the ``intermediate`` level.
+        :param low_runt_ref: A percentage reference value of the full range for the ``low runt`` level.
+        :param low_ref: A percentage reference value of the full range for the ``low`` level.
+        :raise StateLevelsError: The reference values, the bounds or the number of bins are not valid, see
+            :meth:`.StateLevelsMixin.state_levels`.
+        :raise StateLevelsError: The number of states is not between two and the number of bins.
+        :raise StateLevelsError: There are no values within the range of one of the states.
+        :return: The state levels of each pair of adjacent states, from the lowest to the highest, and the values for
+            the horizontal and vertical axes of the histogram."""
+        # pylint: disable=too-many-arguments,too-many-locals
+
+        refs = (high_ref, high_runt_ref, intermediate_ref, low_runt_ref, low_ref)
+        self.__check_arguments(nbins, *refs)
+        if not 2 <= states <= nbins:
+            raise StateLevelsError(f"The number of states, {states}, must be between two and the number of bins.")
+        # If the bounds were provided, ensure they are consistent.
+        if bounds is not None and bounds[1] < bounds[0]:
+            raise StateLevelsError("Bounds when user provided must satisfy upper bound < lower bound.")
+
+        # Compute histogram, and calculate the level of each state from it, or from the values for the percentile mode.
+        (values, weights, (lower_bound, upper_bound), hist_y) = self.__histogram_values(nbins, bounds)
+        (_, histogram) = self._state_levels_from_histogram(
+            hist_y, (lower_bound, upper_bound), Mode.HISTOGRAM_MODE, refs
         )
+        if mode is Mode.PERCENTILE:
+            # The ranges are the same as for the bins, with the edges as weighted averages of the bounds, which gives
+            # the middle of the bounds for two states.
+            weight = np.concatenate(([0], np.arange(1, 2 * states - 2, 2), [2 * states - 2]))
+            edges = (lower_bound * (2 * states - 2 - weight) + upper_bound * weight) / (2 * states - 2)
+            levels = self.__medians_ranges(values, weights, edges)
+        else:
+            levels = self.__states_from_histogram(mode, hist_y, (lower_bound, upper_bound), states)
+
+        pairs = self.__levels_from_range(levels[:-1], levels[1:], refs)
+        return ([pairs[i] for i in range(0, len(pairs))], histogram)
 
     def state_levels_to_array(
         self,
@@ -194,28 +994,23 @@ class StateLevelsMixin:
         """Convert the specified level from the state levels provided to an array of the same length as the number
         of values in the signal.
 
+        The arrays are read-only views that take no additional memory, the values of the horizontal axis are a view of
+        those of the signal, and the values of the vertical axis are the level broadcast to the length of the signal,
+        use :func:`numpy.copy` on them to obtain arrays that can be modified. For uniformly sampled signals whose values
+        of the horizontal axis were not created yet, those are calculated from the start and the step instead, without
+        storing them in the signal.
+
         :param levels: State levels with the values to convert to arrays.
         :param array_id: The array identifier used to identify the state level to convert.
         :raise StateLevelsError: The array identifier provided is not valid.
         :return: The values of the horizontal axis and the values on the vertical axis for the level specified."""
-        # pylint: disable=too-many-return-statements
-
-        if array_id == "highest":
-            return (np.copy(self._hv), np.full_like(self._vv, levels.highest))
-        if array_id == "high":
-            return (np.copy(self._hv), np.full_like(self._vv, levels.high))
-        if array_id == "high_runt":
-            return (np.copy(self._hv), np.full_like(self._vv, levels.high_runt))
-        if array_id == "intermediate":
-            return (np.copy(self._hv), np.full_like(self._vv, levels.intermediate))
-        if array_id == "low_runt":
-            return (np.copy(self._hv), np.full_like(self._vv, levels.low_runt))
-        if array_id == "low":
-            return (np.copy(self._hv), np.full_like(self._vv, levels.low))
-        if array_id == "lowest":
-            return (np.copy(self._hv), np.full_like(self._vv, levels.lowest))
-
-        raise StateLevelsError(f"State level array identifier '{array_id}' is invalid.")
+        if array_id not in ("highest", "high", "high_runt", "intermediate", "low_runt", "low", "lowest"):
+            raise StateLevelsError(f"State level array identifier '{array_id}' is invalid.")
+
+        hvalues = self._hv_at(slice(None))
+        hvalues.flags.writeable = False
+
+        return (hvalues, np.broadcast_to(np.float_(getattr(levels, array_id)), (self._length,)))
 
     def state_levels_plot(
         self,
@@ -247,11 +1042,11 @@ class StateLevelsMixin:
         plotter = sep.Plotter(sep.Mode.LINEAR, rows=2 if histogram is not None else 1, columns=1)
 
         # Adjust begin and end values if not provided.
-        begin = begin if begin is not None else float(self._hv[0])
-        end = end if end is not None else float(self._hv[-1])
+        begin = begin if begin is not None else float(self._hv_at(0))
+        end = end if end is not None else float(self._hv_at(-1))
 
         # Create plot for the signal.
-        spl = sep.Subplot("Signal", self._hv, self._hunits, self._vv, self._vunits, begin, end, munits, "red")
+        spl = sep.Subplot("Signal", self._hv_axis, self._hunits, self._vv, self._vunits, begin, end, munits, "red")
         plotter.add_plot(0, 0, spl)
 
         # Add 'highest' state level.
@@ -267,10 +1062,10 @@ class StateLevelsMixin:
             }
 
             if len(levels) == 0 or level in levels:
-                (level_x, level_y) = self.state_levels_to_array(state_levels, level)
+                level_y = np.broadcast_to(np.float_(getattr(state_levels, level)), (self._length,))
                 subplot = sep.Subplot(
                     levels_dict[level],
-                    level_x,
+                    self._hv_axis,
                     self._hunits,
                     level_y,
                     self._vunits,
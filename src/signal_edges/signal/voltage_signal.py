@@ -34,22 +34,45 @@ class VoltageSignal(
     ## Private API #####################################################################################################
     def __init__(
         self,
-        timestamps: npt.NDArray[np.float_],
+        timestamps: npt.NDArray[np.float_] | None,
         voltages: npt.NDArray[np.float_],
         timestamp_unit_id: Literal["ms", "s"] | None = None,
         voltage_unit_id: Literal["mV", "V"] | None = None,
+        voltage_gain: float | None = None,
+        voltage_offset: float = 0.0,
+        copy: bool = True,
+        timestamp_start: float | None = None,
+        timestamp_step: float | None = None,
+        dtype: npt.DTypeLike = np.float_,
     ) -> None:
         """Class constructor.
 
-        :param timestamps: The timestamp values for the signal.
-        :param voltages: The voltage values for the signal.
+        :param timestamps: The timestamp values for the signal, or ``None`` for uniformly sampled signals with
+            ``timestamp_start`` and ``timestamp_step`` instead.
+        :param voltages: The voltage values for the signal, or their 8-bit or 16-bit integer codes as captured by a
+            digitizer if ``voltage_gain`` is provided.
         :param timestamp_unit_id: An identifier for the timestamp units, can be ignored if not plotting.
-        :param voltage_unit_id: An identifier for the voltage units, can be ignored if not plotting."""
+        :param voltage_unit_id: An identifier for the voltage units, can be ignored if not plotting.
+        :param voltage_gain: The gain to convert the codes to voltages, see :class:`.Signal`.
+        :param voltage_offset: The offset to convert the codes to voltages, see :class:`.Signal`.
+        :param copy: If ``False``, use the arrays as they are when possible instead of copying them, see
+            :class:`.Signal`.
+        :param timestamp_start: The first timestamp value, for uniformly sampled signals, see :class:`.Signal`.
+        :param timestamp_step: The step between timestamp values, for uniformly sampled signals.
+        :param dtype: The data type of the voltage values, ``numpy.float64`` or ``numpy.float32``, see
+            :class:`.Signal`."""
+        # pylint: disable=too-many-arguments
         super().__init__(
             hvalues=timestamps,
             vvalues=voltages,
             hunits=None if timestamp_unit_id is None else self.__get_timestamp_units(timestamp_unit_id),
             vunits=None if voltage_unit_id is None else self.__get_voltage_units(voltage_unit_id),
+            vgain=voltage_gain,
+            voffset=voltage_offset,
+            copy=copy,
+            hstart=timestamp_start,
+            hstep=timestamp_step,
+            dtype=dtype,
         )
 
     @staticmethod
@@ -83,17 +106,25 @@ class VoltageSignal(
     ## Public API ######################################################################################################
     @property
     def timestamps(self) -> npt.NDArray[np.float_]:
-        """Getter for the timestamps.
+        """Getter for the timestamps, as a read-only view of the timestamps of the signal, which are shared with the
+        signals derived from it, such as filtered signals, use :func:`numpy.copy` to obtain an array that can be
+        modified.
 
         :return: The timestamps."""
-        return self._hv
+        timestamps = self._hv.view()
+        timestamps.flags.writeable = False
+        return timestamps
 
     @property
     def voltages(self) -> npt.NDArray[np.float_]:
-        """Getter for the voltages
+        """Getter for the voltages, as a read-only view of the voltages of the signal, as the results cached for the
+        signal are only cleared when the voltages are replaced, use :func:`numpy.copy` to obtain an array that can be
+        modified.
 
         :return: The voltages."""
-        return self._vv
+        voltages = self._vv.view()
+        voltages.flags.writeable = False
+        return voltages
 
     @property
     def timestamp_units(self) -> Units:
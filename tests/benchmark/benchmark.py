@@ -38,9 +38,10 @@ Below some notes are listed in terms of performance:
 - If the full range of the signal calculated from the state levels, :class:`.StateLevels`, is below an expected value
   for the user system, then a processing to extract edges can be skipped as there isn't any.
 
-- Runt edges, :class:`~.edges.definitions.Type` are more time consuming to extract than normal edges, a signal with
-  an excessive amount of runt edges can be a symptom of issues in the system or in the acquisition and a better
-  signal conditioning could reduce their number.
+- Runt edges, :class:`~.edges.definitions.Type`, are split in pairs from the state levels of the portion of the signal
+  with each pair, which are calculated for all the pairs at once, thus they take about the same time to extract as
+  normal edges. Nonetheless, a signal with an excessive amount of runt edges can be a symptom of issues in the system
+  or in the acquisition and a better signal conditioning could reduce their number.
 
 - The intermediate point policy for edges, :class:`.IntPointPolicy`, can be adjusted to avoid calculation of
   intermediate points, forcing the use of the ``begin`` or ``end`` values as ``intermediate``. This can be convenient
@@ -1,12 +1,16 @@
 """Tests for signal edges."""
 
+import logging
 import os
 from typing import Literal
 
+import numpy as np
+import numpy.typing as npt
 import pytest
 
+from signal_edges.exceptions import EdgesError, SignalError
 from signal_edges.signal import VoltageSignal
-from signal_edges.signal.edges import IntPointPolicy, Type
+from signal_edges.signal.edges import EdgeStream, EdgeTable, Engine, IntPointPolicy, Output, Type, jit
 from signal_edges.signal.generator import SignalGenerator
 from signal_edges.signal.state_levels import StateLevels
 
@@ -28,6 +32,30 @@ class TestEdges:
         :return: The signal generator."""
         return SignalGenerator(0.0, 1.0, 50, -50, vinit)
 
+    def _get_noisy_runt_signal(
+        self, noise: float, repeat: int = 5
+    ) -> tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+        """Generates a noisy signal with normal edges and runt edges of different heights, with a fixed seed for
+        reproducibility.
+
+        :param noise: The standard deviation of the noise added to the signal.
+        :param repeat: The number of times the pattern of edges is repeated, of `192` values each.
+        :return: The timestamps and the voltages of the signal."""
+        # Create signal generator.
+        gen = self._get_signal_gen(self._v("high"))
+
+        # Build signal, with normal edges and runt edges of different heights.
+        for value_id in ("low", "int_low_1", "int_low_0", "low", "int_high_0", "low"):
+            gen.add_flat(8)
+            gen.add_edge("falling", self._v(value_id), 8)
+            gen.add_flat(8)
+            gen.add_edge("rising", self._v("high"), 8)
+        gen.repeat(repeat)
+
+        # Generate signal with noise, with a fixed seed for reproducibility.
+        np.random.seed(0)
+        return gen.generate((0, noise))
+
     def _get_state_levels(self) -> StateLevels:
         """Generates a predefined state levels for testing.
 
@@ -74,12 +102,14 @@ class TestEdges:
     @pytest.mark.parametrize("adir", ["edges/test_falling_and_rising_edges"], indirect=True)
     @pytest.mark.parametrize("sval", [1, 2, 3, 8])
     @pytest.mark.parametrize("ipol", list(IntPointPolicy))
-    def test_falling_and_rising_edges(self, adir: str, sval: int, ipol: IntPointPolicy) -> None:
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_falling_and_rising_edges(self, adir: str, sval: int, ipol: IntPointPolicy, engine: Engine) -> None:
         """Tests a signal with falling and rising edges.
 
         :param adir: The path where the plots will be stored.
         :param sval: Number of values per section in the generated signal.
-        :param ipol: The intermediate point policy to use."""
+        :param ipol: The intermediate point policy to use.
+        :param engine: The engine to use for the extraction of edges."""
         # Create signal generator.
         gen = self._get_signal_gen(self._v("high"))
 
@@ -96,11 +126,11 @@ class TestEdges:
 
         # Generate signal and get edges.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels(), ipol)
+        edges = signal.edges(self._get_state_levels(), ipol, engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"sval{sval}_ipol{ipol}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"sval{sval}_ipol{ipol}_engine{engine}.png"), edges)
 
         # Perform assertions on edges.
         assert len(edges) == 4
@@ -133,13 +163,19 @@ class TestEdges:
     @pytest.mark.parametrize("sval", [1, 2, 3, 8])
     @pytest.mark.parametrize("ipol", list(IntPointPolicy))
     @pytest.mark.parametrize("rint", [0, 1])
-    def test_runt_falling_and_rising_edges(self, adir: str, sval: int, ipol: IntPointPolicy, rint: int) -> None:
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_runt_falling_and_rising_edges(
+        self, adir: str, sval: int, ipol: IntPointPolicy, rint: int, engine: Engine
+    ) -> None:
         """Tests a signal with runt falling and rising edges.
 
         :param adir: The path where the plots will be stored.
         :param sval: Number of values per section in the generated signal.
         :param ipol: The intermediate point policy to use.
-        :param rint: Whether to use ``int_low_0`` or ``int_low_1`` values."""
+        :param rint: Whether to use ``int_low_0`` or ``int_low_1`` values.
+        :param engine: The engine to use for the extraction of edges."""
+        # pylint: disable=too-many-arguments
+
         # Create signal generator.
         gen = self._get_signal_gen(self._v("high"))
 
@@ -156,11 +192,11 @@ class TestEdges:
 
         # Generate signal and get edges.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels(), ipol)
+        edges = signal.edges(self._get_state_levels(), ipol, engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"rint_{rint}_sval{sval}_ipol{ipol}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"rint_{rint}_sval{sval}_ipol{ipol}_engine{engine}.png"), edges)
 
         # Perform assertions on edges.
         assert len(edges) == 4
@@ -192,12 +228,14 @@ class TestEdges:
     @pytest.mark.parametrize("adir", ["edges/test_rising_and_falling_edges"], indirect=True)
     @pytest.mark.parametrize("sval", [1, 2, 3, 8])
     @pytest.mark.parametrize("ipol", list(IntPointPolicy))
-    def test_rising_and_falling_edges(self, adir: str, sval: int, ipol: IntPointPolicy) -> None:
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_rising_and_falling_edges(self, adir: str, sval: int, ipol: IntPointPolicy, engine: Engine) -> None:
         """Tests a signal with rising and falling edges.
 
         :param adir: The path where the plots will be stored.
         :param sval: Number of values per section in the generated signal.
-        :param ipol: The intermediate point policy to use."""
+        :param ipol: The intermediate point policy to use.
+        :param engine: The engine to use for the extraction of edges."""
         # Create signal generator.
         gen = self._get_signal_gen(self._v("low"))
 
@@ -214,11 +252,11 @@ class TestEdges:
 
         # Generate signal and get edges.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels(), ipol)
+        edges = signal.edges(self._get_state_levels(), ipol, engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"sv{sval}_ip{ipol}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"sv{sval}_ip{ipol}_en{engine}.png"), edges)
 
         # Perform assertions on edges.
         assert len(edges) == 4
@@ -251,13 +289,19 @@ class TestEdges:
     @pytest.mark.parametrize("sval", [1, 2, 3, 8])
     @pytest.mark.parametrize("ipol", list(IntPointPolicy))
     @pytest.mark.parametrize("rint", [0, 1])
-    def test_runt_rising_and_falling_edges(self, adir: str, sval: int, ipol: IntPointPolicy, rint: int) -> None:
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_runt_rising_and_falling_edges(
+        self, adir: str, sval: int, ipol: IntPointPolicy, rint: int, engine: Engine
+    ) -> None:
         """Tests a signal with runt rising and falling edges.
 
         :param adir: The path where the plots will be stored.
         :param sval: Number of values per section in the generated signal.
         :param ipol: The intermediate point policy to use.
-        :param rint: Whether to use ``int_high_0`` or ``int_high_1`` values."""
+        :param rint: Whether to use ``int_high_0`` or ``int_high_1`` values.
+        :param engine: The engine to use for the extraction of edges."""
+        # pylint: disable=too-many-arguments
+
         # Create signal generator.
         gen = self._get_signal_gen(self._v("low"))
 
@@ -274,11 +318,11 @@ class TestEdges:
 
         # Generate signal and get edges.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels(), ipol)
+        edges = signal.edges(self._get_state_levels(), ipol, engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"rint_{rint}_sval{sval}_ipol{ipol}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"rint_{rint}_sval{sval}_ipol{ipol}_engine{engine}.png"), edges)
 
         # Perform assertions on edges.
         assert len(edges) == 4
@@ -309,11 +353,13 @@ class TestEdges:
 
     @pytest.mark.parametrize("adir", ["edges/test_special_edges"], indirect=True)
     @pytest.mark.parametrize("sval", [1, 2, 3, 8])
-    def test_special_edges(self, adir: str, sval: int) -> None:
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_special_edges(self, adir: str, sval: int, engine: Engine) -> None:
         """Tests special cases that do not fit anywhere else.
 
         :param adir: The path where the plots will be stored.
-        :param sval: Number of values per section in the generated signal."""
+        :param sval: Number of values per section in the generated signal.
+        :param engine: The engine to use for the extraction of edges."""
         # pylint: disable=too-many-statements
 
         signal_num = 0
@@ -336,11 +382,11 @@ class TestEdges:
 
         # Generate signal.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels())
+        edges = signal.edges(self._get_state_levels(), engine=engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}_engine{engine}.png"), edges)
             signal_num += 1
 
         # Perform assertions on edges.
@@ -362,11 +408,11 @@ class TestEdges:
 
         # Generate signal.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels())
+        edges = signal.edges(self._get_state_levels(), engine=engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}_engine{engine}.png"), edges)
             signal_num += 1
 
         # Perform assertions on edges.
@@ -389,11 +435,11 @@ class TestEdges:
 
         # Generate signal.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels())
+        edges = signal.edges(self._get_state_levels(), engine=engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}_engine{engine}.png"), edges)
             signal_num += 1
 
         # Perform assertions on edges.
@@ -418,11 +464,11 @@ class TestEdges:
 
         # Generate signal.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels())
+        edges = signal.edges(self._get_state_levels(), engine=engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}_engine{engine}.png"), edges)
             signal_num += 1
 
         # Perform assertions on edges.
@@ -449,11 +495,11 @@ class TestEdges:
 
         # Generate signal.
         signal = VoltageSignal(*gen.generate())
-        edges = signal.edges(self._get_state_levels())
+        edges = signal.edges(self._get_state_levels(), engine=engine)
 
         # Plot to file.
         if env_plots():
-            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}.png"), edges)
+            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}_engine{engine}.png"), edges)
             signal_num += 1
 
         # Perform assertions on edges.
@@ -461,3 +507,485 @@ class TestEdges:
         assert edges[0]["edge_type"] is Type.RISING_RUNT
         assert edges[1]["edge_type"] is Type.FALLING_RUNT
         assert edges[2]["edge_type"] is Type.RISING
+
+        ##
+        ## Signal that falls straight from high to low, and then rises to high through the intermediate area.
+        ##
+
+        # Create signal generator.
+        gen = self._get_signal_gen(self._v("high"))
+
+        # Build signal.
+        gen.add_flat(sval)
+        gen.add_edge("falling", self._v("low"), 1)
+        gen.add_flat(sval)
+        gen.add_edge("rising", self._v("int_high_1"), sval)
+        gen.add_flat(sval)
+        gen.add_edge("rising", self._v("high"), sval)
+        gen.add_flat(sval)
+
+        # Generate signal.
+        signal = VoltageSignal(*gen.generate())
+        edges = signal.edges(self._get_state_levels(), engine=engine)
+
+        # Plot to file.
+        if env_plots():
+            signal.edges_plot(os.path.join(adir, f"{signal_num:03}_sval{sval}_engine{engine}.png"), edges)
+            signal_num += 1
+
+        # Perform assertions on edges.
+        assert len(edges) == 2
+        assert edges[0]["edge_type"] is Type.FALLING
+        assert edges[0]["ibegin"] <= edges[0]["iintermediate"] <= edges[0]["iend"]
+        assert edges[1]["edge_type"] is Type.RISING
+        assert edges[1]["ibegin"] <= edges[1]["iintermediate"] <= edges[1]["iend"]
+
+    @pytest.mark.parametrize("adir", ["edges/test_engines"], indirect=True)
+    @pytest.mark.parametrize("noise", [0.5, 5.0])
+    @pytest.mark.parametrize("ipol", list(IntPointPolicy))
+    def test_engines(self, adir: str, noise: float, ipol: IntPointPolicy) -> None:
+        """Tests that all engines extract the same edges from a noisy signal with normal and runt edges.
+
+        :param adir: The path where the plots will be stored.
+        :param noise: The standard deviation of the noise added to the signal.
+        :param ipol: The intermediate point policy to use."""
+        # Create the noisy signal with normal edges and runt edges.
+        signal = VoltageSignal(*self._get_noisy_runt_signal(noise, 20))
+        (levels, _) = signal.state_levels()
+
+        # Get edges with all the engines.
+        edges = {engine: signal.edges(levels, ipol, engine) for engine in Engine}
+
+        # Plot to file.
+        if env_plots():
+            signal.edges_plot(os.path.join(adir, f"noise{noise}_ipol{ipol}.png"), edges[Engine.SEARCH])
+
+        # Perform assertions on edges.
+        assert len(edges[Engine.SEARCH]) > 0
+        assert all(np.array_equal(i.values, edges[Engine.SEARCH].values) for i in edges.values())
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_edge_table(self, engine: Engine) -> None:
+        """Tests the access to the edges in a table of edges by columns, subsets and as a sequence of edges.
+
+        :param engine: The engine to use for the extraction of edges."""
+        # Create signal generator.
+        gen = self._get_signal_gen(self._v("high"))
+
+        # Build signal.
+        for _ in range(0, 3):
+            gen.add_flat(4)
+            gen.add_edge("falling", self._v("low"), 4)
+            gen.add_flat(4)
+            gen.add_edge("rising", self._v("high"), 4)
+        gen.add_flat(4)
+
+        # Generate signal and get edges.
+        signal = VoltageSignal(*gen.generate())
+        edges = signal.edges(self._get_state_levels(), engine=engine)
+
+        # Perform assertions on the columns, which must be views of the table.
+        assert len(edges) == 6
+        assert list(edges["ibegin"]) == [4, 12, 20, 28, 36, 44]
+        assert list(edges["iend"]) == [8, 16, 24, 32, 40, 48]
+        assert np.shares_memory(edges["ibegin"], edges.values)
+
+        # Perform assertions on subsets of the table.
+        falling = edges[edges["edge_type"] == Type.FALLING]
+        assert isinstance(falling, EdgeTable)
+        assert len(falling) == 3
+        assert all(i["edge_type"] is Type.FALLING for i in falling)
+        assert list(edges[1:3]["ibegin"]) == [12, 20]
+
+        # Perform assertions on the table as a sequence of edges.
+        sequence = list(edges)
+        assert sequence[1] == edges[1]
+        assert sequence[1]["edge_type"] is Type.RISING
+        assert isinstance(sequence[1]["ibegin"], int)
+        assert np.array_equal(EdgeTable.from_edges(sequence).values, edges.values)
+        for array_id in ("begin", "intermediate", "end"):
+            assert all(
+                np.array_equal(i, j)
+                for (i, j) in zip(signal.edges_to_array(edges, array_id), signal.edges_to_array(sequence, array_id))
+            )
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    @pytest.mark.parametrize("chunk", [1, 7, 100, 10000])
+    def test_edge_stream(self, engine: Engine, chunk: int) -> None:
+        """Tests that the edges of a signal fed in chunks to an edge stream are the same as those of the whole signal.
+
+        :param engine: The engine to use for the extraction of edges.
+        :param chunk: The number of values in each chunk."""
+        # Create the noisy signal with normal edges and runt edges.
+        (hvalues, vvalues) = self._get_noisy_runt_signal(5.0)
+        signal = VoltageSignal(hvalues, vvalues)
+        (levels, _) = signal.state_levels()
+
+        # Feed the signal in chunks to the stream, keeping track of the values pending on each chunk.
+        stream = EdgeStream(levels, engine=engine)
+        (tables, pending) = ([], [])
+        for index in range(0, len(hvalues), chunk):
+            tables.append(stream.feed(hvalues[index : index + chunk], vvalues[index : index + chunk]))
+            pending.append(stream.pending)
+        edges = EdgeTable.concatenate(tables)
+
+        # Perform assertions on edges, on the values kept, which are bounded by the length of the edges, and on chunks
+        # with values of the horizontal axis before those kept.
+        assert len(edges) > 0
+        assert np.array_equal(edges.values, signal.edges(levels, engine=engine).values)
+        assert max(pending) <= chunk + 8 * 4
+        with pytest.raises(SignalError):
+            stream.feed(hvalues[-2:], vvalues[-2:])
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    @pytest.mark.parametrize("workers", [2, 3, 16])
+    def test_edges_parallel(self, caplog: pytest.LogCaptureFixture, engine: Engine, workers: int) -> None:
+        """Tests that the edges extracted in partitions in parallel are the same as those extracted serially, and that
+        a warning is logged for the search engine, whose partitions do not run in parallel.
+
+        :param caplog: Fixture to capture the warnings logged.
+        :param engine: The engine to use for the extraction of edges.
+        :param workers: The number of workers to use."""
+        # Create the noisy signal with normal edges and runt edges.
+        signal = VoltageSignal(*self._get_noisy_runt_signal(5.0))
+        (levels, _) = signal.state_levels()
+
+        # Perform assertions on edges, and on the warnings.
+        with caplog.at_level(logging.WARNING):
+            edges = signal.edges(levels, engine=engine, workers=workers)
+        search = engine is Engine.SEARCH or (engine is Engine.JIT and not jit.AVAILABLE)
+        assert any("GIL" in i.getMessage() for i in caplog.records) == search
+        assert len(edges) > 0
+        assert np.array_equal(edges.values, signal.edges(levels, engine=engine).values)
+        with pytest.raises(EdgesError):
+            signal.edges(levels, engine=engine, workers=0)
+
+    @pytest.mark.parametrize("kernels", ["compiled", "interpreted", "fallback"])
+    @pytest.mark.parametrize("ipol", list(IntPointPolicy))
+    def test_jit_engine(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, kernels: str, ipol: IntPointPolicy
+    ) -> None:
+        """Tests that the JIT engine extracts the same edges as the search engine, with the kernels compiled with numba
+        or run as regular Python code, and that without numba it falls back to the search engine with a single warning.
+
+        :param monkeypatch: Fixture to patch the availability of numba, the kernels and the fallback.
+        :param caplog: Fixture to capture the warnings logged.
+        :param kernels: The kernels to use, ``compiled`` with numba, skipped if it is not installed, ``interpreted``
+            as regular Python code, or none with the ``fallback`` to the search engine.
+        :param ipol: The intermediate point policy to use."""
+        if kernels == "compiled":
+            pytest.importorskip("numba")
+        else:
+            monkeypatch.setattr(jit, "AVAILABLE", False)
+        if kernels == "interpreted":
+            monkeypatch.setattr(jit, "fallback", lambda _: False)
+        elif kernels == "fallback":
+            monkeypatch.setattr(jit, "_FALLBACK_LOGGED", False)
+            monkeypatch.setattr(jit, "kernels", lambda: pytest.fail("The kernels must not be used."))
+
+        # Create the noisy signal with normal edges and runt edges, longer than a block.
+        signal = VoltageSignal(*self._get_noisy_runt_signal(5.0, 25))
+        (levels, _) = signal.state_levels()
+        edges = signal.edges(levels, ipol, Engine.SEARCH)
+
+        # Perform assertions on edges, in whole, in partitions and in blocks, and on the warnings.
+        with caplog.at_level(logging.WARNING):
+            assert len(edges) > 0
+            assert np.array_equal(signal.edges(levels, ipol, Engine.JIT).values, edges.values)
+            assert np.array_equal(signal.edges(levels, ipol, Engine.JIT, workers=4).values, edges.values)
+            iterated = EdgeTable.from_edges(list(signal.iter_edges(levels, ipol, engine=Engine.JIT)))
+            assert np.array_equal(iterated.values, edges.values)
+        assert len([i for i in caplog.records if "numba" in i.getMessage()]) == (1 if kernels == "fallback" else 0)
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_iter_edges(self, engine: Engine) -> None:
+        """Tests that iterating over the edges yields the same edges as extracting them, in whole and in portions.
+
+        :param engine: The engine to use for the extraction of edges."""
+        # Create the noisy signal with normal edges and runt edges, longer than a block.
+        signal = VoltageSignal(*self._get_noisy_runt_signal(5.0, 100))
+        (levels, _) = signal.state_levels()
+        edges = signal.edges(levels, engine=engine)
+
+        # Perform assertions on the whole signal, and on the first edge only.
+        assert len(edges) > 0
+        assert np.array_equal(EdgeTable.from_edges(list(signal.iter_edges(levels, engine=engine))).values, edges.values)
+        assert next(signal.iter_edges(levels, engine=engine)) == edges[0]
+
+        # Perform assertions on a portion of the signal, which only has the edges within it.
+        (start, stop) = (int(edges["iend"][3]), int(edges["iend"][-3]) + 1)
+        portion = EdgeTable.from_edges(list(signal.iter_edges(levels, start=start, stop=stop, engine=engine)))
+        assert np.array_equal(portion.values, edges[4:-2].values)
+        with pytest.raises(EdgesError):
+            next(signal.iter_edges(levels, start=10, stop=5, engine=engine))
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_edges_outputs(self, engine: Engine, workers: int) -> None:
+        """Tests that the indices and the counts of the edges match the table of edges.
+
+        :param engine: The engine to use for the extraction of edges.
+        :param workers: The number of workers to use."""
+        # Create the noisy signal with normal edges and runt edges.
+        signal = VoltageSignal(*self._get_noisy_runt_signal(5.0))
+        (levels, _) = signal.state_levels()
+        edges = signal.edges(levels, engine=engine)
+
+        # Perform assertions on the indices.
+        (ibegin, iend, types) = signal.edges(levels, engine=engine, workers=workers, output=Output.INDICES)
+        assert np.array_equal(ibegin, edges["ibegin"])
+        assert np.array_equal(iend, edges["iend"])
+        assert np.array_equal(types, edges["edge_type"])
+
+        # Perform assertions on the counts.
+        counts = signal.edges(levels, engine=engine, workers=workers, output=Output.COUNTS)
+        assert counts[Type.FALLING_RUNT] > 0
+        assert counts == {i: int(np.count_nonzero(edges["edge_type"] == i)) for i in Type}
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_edges_windowed(self, engine: Engine, workers: int) -> None:
+        """Tests the edges extracted with state levels that vary over the signal.
+
+        :param engine: The engine to use for the extraction of edges.
+        :param workers: The number of workers to use."""
+        # Create the noisy signal with normal edges and runt edges.
+        (timestamps, voltages) = self._get_noisy_runt_signal(5.0)
+        signal = VoltageSignal(timestamps, voltages)
+        (levels, _) = signal.state_levels()
+        edges = signal.edges(levels, engine=engine)
+
+        # Perform assertions on the edges with the same state levels for each value, which are the same edges.
+        constant = signal.state_levels_windowed(len(voltages), per_value=True)
+        assert len(edges) > 0
+        assert np.array_equal(signal.edges(constant, engine=engine, workers=workers).values, edges.values)
+        assert np.array_equal(
+            EdgeTable.from_edges(list(signal.iter_edges(constant, engine=engine))).values, edges.values
+        )
+
+        # Perform assertions on the edges of a square signal with a drifting baseline, where the levels of the whole
+        # signal miss edges, and the levels of each window find all of them as normal edges.
+        rng = np.random.default_rng(0)
+        voltages = np.tile([0.0] * 20 + [5.0] * 20, 50) + np.linspace(0, 8.0, 2000) + rng.normal(0, 0.05, 2000)
+        signal = VoltageSignal(np.arange(0.0, 2000.0), voltages)
+        windowed = signal.state_levels_windowed(200, 50, per_value=True)
+        drifted = signal.edges(windowed, engine=engine, workers=workers)
+        assert len(signal.edges(signal.state_levels()[0], engine=engine)) < 99
+        assert np.array_equal(drifted["iend"], np.arange(20, 2000, 20))
+        assert np.array_equal(drifted["edge_type"], np.resize([Type.RISING, Type.FALLING], 99))
+        with pytest.raises(EdgesError):
+            signal.edges(windowed[1:], engine=engine, workers=workers)
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_edges_cache(self, engine: Engine) -> None:
+        """Tests the labels of the values are cached for the same state levels, and cleared with the values.
+
+        :param engine: The engine to use for the extraction of edges."""
+        # Create signal, and obtain edges for the first time.
+        rng = np.random.default_rng(0)
+        signal = VoltageSignal(np.arange(0.0, 1000.0), np.tile([0.0] * 10 + [5.0] * 10, 50) + rng.normal(0, 0.1, 1000))
+        (levels, _) = signal.state_levels()
+        edges = signal.edges(levels, engine=engine)
+        misses = signal.cache_info.misses
+
+        # Perform assertions on the edges obtained from the cached labels, and after the values are replaced.
+        assert np.array_equal(signal.edges(levels, engine=engine).values, edges.values)
+        assert signal.cache_info.hits == 1 and signal.cache_info.misses == misses
+        signal._vv = -signal._vv  # pylint: disable=protected-access
+        assert signal.cache_info.currsize == 0
+        edges = signal.edges(levels, engine=engine)
+        assert len(edges) == 0
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_edges_codes(self, engine: Engine, workers: int) -> None:
+        """Tests the edges of a signal created from integer codes are the same as those of its values.
+
+        :param engine: The engine to use for the extraction of edges.
+        :param workers: The number of workers to use."""
+        # Create the noisy signal with normal edges and runt edges, and quantize it to codes.
+        (timestamps, voltages) = self._get_noisy_runt_signal(5.0)
+        codes = np.round(voltages / 0.01).astype(np.int16)
+        signal = VoltageSignal(timestamps, codes, voltage_gain=0.01, voltage_offset=-0.5)
+        expected = VoltageSignal(timestamps, codes.astype(np.float_) * 0.01 - 0.5)
+        (levels, _) = signal.state_levels()
+
+        # Perform assertions on edges.
+        edges = signal.edges(levels, engine=engine, workers=workers)
+        assert len(edges) > 0
+        assert np.array_equal(edges.values, expected.edges(levels, engine=engine).values)
+        counts = signal.edges(levels, engine=engine, workers=workers, output=Output.COUNTS)
+        assert counts == expected.edges(levels, engine=engine, output=Output.COUNTS)
+
+    def test_edges_crossings(self) -> None:
+        """Tests the interpolated crossings of the levels in normal and runt edges."""
+        # Create signal, with a falling edge followed by a pair of runt edges that do not reach 'intermediate'.
+        voltages = np.asarray([50, 50, 30, 10, -10, -30, -50, -50, -10, 10, -10, -50, -50], dtype=np.float_)
+        signal = VoltageSignal(np.arange(0, len(voltages)) * 2.0, voltages)
+        edges = signal.edges(self._get_state_levels())
+
+        # Perform assertions on the crossings.
+        assert len(edges) == 3
+        assert np.array_equal(
+            signal.edges_crossings(edges, self._get_state_levels(), "high"), [3.0, np.nan, np.nan], True
+        )
+        assert np.array_equal(
+            signal.edges_crossings(list(edges), self._get_state_levels(), "intermediate"), [7.0, np.nan, np.nan], True
+        )
+        assert np.array_equal(signal.edges_crossings(edges, self._get_state_levels(), "low"), [11.0, 14.5, 21.5])
+        with pytest.raises(EdgesError):
+            signal.edges_crossings(edges, self._get_state_levels(), "highest")  # type: ignore
+
+    @pytest.mark.parametrize("ipol", list(IntPointPolicy))
+    def test_edges_multi(self, ipol: IntPointPolicy) -> None:
+        """Tests the edges of a signal with four states are the transitions between its symbols, and that the edges
+        of a signal with two states are the same as those of :meth:`.EdgesMixin.edges` without runt edges.
+
+        :param ipol: The intermediate point policy."""
+        # Create signal, with four evenly spaced states and a symbol every ten values.
+        rng = np.random.default_rng(0)
+        symbols = rng.integers(0, 4, 500)
+        voltages = np.repeat(symbols, 10) + rng.normal(0, 0.01, 5000)
+        signal = VoltageSignal(np.arange(0.0, 5000.0), voltages)
+        (levels, _) = signal.state_levels_multi(4)
+
+        # Perform assertions on the edges, one for each change of symbol.
+        (edges, states) = signal.edges_multi(levels, ipol)
+        changes = np.flatnonzero(symbols[1:] != symbols[:-1])
+        assert len(edges) == len(changes)
+        assert np.array_equal(edges["ibegin"], changes * 10 + 9)
+        assert np.array_equal(edges["iend"], changes * 10 + 10)
+        assert np.array_equal(states, np.stack((symbols[changes], symbols[changes + 1]), axis=1))
+        assert np.array_equal(edges["edge_type"], np.where(states[:, 1] > states[:, 0], Type.RISING, Type.FALLING))
+        assert np.all((edges["iintermediate"] == edges["ibegin"]) | (edges["iintermediate"] == edges["iend"]))
+
+        # Perform assertions on a signal with two states.
+        voltages = np.tile([0.0] * 20 + [5.0] * 20, 100) + rng.normal(0, 0.1, 4000)
+        signal = VoltageSignal(np.arange(0.0, 4000.0), voltages)
+        (levels, _) = signal.state_levels_multi(2)
+        (edges, states) = signal.edges_multi(levels, ipol)
+        assert np.array_equal(edges.values, signal.edges(levels[0], ipol).values)
+        assert np.array_equal(states[:, 0], np.where(edges["edge_type"] == Type.RISING, 0, 1))
+
+        # Perform assertions on the sanity checks of the levels.
+        with pytest.raises(EdgesError):
+            signal.edges_multi([])
+        with pytest.raises(EdgesError):
+            signal.edges_multi([StateLevels(5.0, 1.0, 4.0, 3.0, 2.0, 1.0, 0.0)])
+        with pytest.raises(EdgesError):
+            signal.edges_multi([self._get_state_levels(), self._get_state_levels()])
+
+    @pytest.mark.parametrize("engine", [Engine.SEARCH, Engine.VECTORIZED, Engine.JIT])
+    def test_edges_uniform(self, engine: Engine) -> None:
+        """Tests the edges of a signal with the timestamps given by their start and step are the same as those of the
+        signal with the equivalent timestamps, without creating them.
+
+        :param engine: The engine to use for the extraction of the edges."""
+        # Create signals, with the same voltages and the timestamps given as an array and by their start and step.
+        rng = np.random.default_rng(0)
+        voltages = np.tile([0.0] * 20 + [5.0] * 20, 100) + rng.normal(0, 0.1, 4000)
+        timestamps = np.multiply(np.arange(0, 4000), 0.001, dtype=np.float_) + 1.5
+        signal = VoltageSignal(timestamps, voltages)
+        uniform = VoltageSignal(None, voltages, timestamp_start=1.5, timestamp_step=0.001)
+
+        # Perform assertions on the state levels and edges, the timestamps must not be created.
+        (levels, _) = uniform.state_levels()
+        assert levels == signal.state_levels()[0]
+        edges = uniform.edges(levels, engine=engine)
+        assert np.array_equal(edges.values, signal.edges(levels, engine=engine).values)
+        for point in ("begin", "intermediate", "end"):
+            assert np.array_equal(uniform.edges_to_array(edges, point)[0], signal.edges_to_array(edges, point)[0])
+        assert getattr(uniform, "_Signal__hv") is None
+        assert np.array_equal(uniform.timestamps, timestamps)
+
+        # Perform assertions on the sanity checks of the timestamps.
+        for kwargs in ({}, {"timestamp_start": 0.0}, {"timestamp_start": 0.0, "timestamp_step": 0.0}):
+            with pytest.raises(SignalError):
+                VoltageSignal(None, voltages, **kwargs)  # type: ignore
+        with pytest.raises(SignalError):
+            VoltageSignal(timestamps, voltages, timestamp_start=0.0, timestamp_step=1.0)
+
+    @pytest.mark.parametrize("uniform", [False, True])
+    def test_edges_window(self, uniform: bool) -> None:
+        """Tests the edges of a window of a signal are the edges of the signal within the window, and that the window
+        shares the values with the signal.
+
+        :param uniform: Whether the timestamps of the signal are given by their start and step."""
+        # pylint: disable=consider-ternary-expression
+
+        # Create signal, and a window of it from the timestamps of its 410th and 3209th values.
+        rng = np.random.default_rng(0)
+        voltages = np.tile([0.0] * 20 + [5.0] * 20, 100) + rng.normal(0, 0.1, 4000)
+        timestamps = np.multiply(np.arange(0, 4000), 0.001, dtype=np.float_) + 1.5
+        if uniform:
+            signal = VoltageSignal(None, voltages, timestamp_start=1.5, timestamp_step=0.001)
+        else:
+            signal = VoltageSignal(timestamps, voltages)
+        window = signal.window(timestamps[410], timestamps[3209])
+
+        # Perform assertions on the values of the window.
+        assert window.window_offset == 410
+        assert np.array_equal(window.timestamps, timestamps[410:3210])
+        assert np.shares_memory(window.voltages, signal.voltages)
+        assert window.window(timestamps[1000], timestamps[1500]).window_offset == 1000
+
+        # Perform assertions on the edges, those of the signal within the window.
+        (levels, _) = signal.state_levels()
+        edges = signal.edges(levels)
+        edges = edges[(edges["ibegin"] >= 410) & (edges["iend"] < 3210)]
+        window_edges = window.edges(levels)
+        assert np.array_equal(window.edges_to_parent(window_edges).values, edges.values)
+        assert np.array_equal(window.edges_to_parent(list(window_edges)).values, edges.values)
+        assert np.array_equal(window_edges["ibegin"], edges["ibegin"] - 410)
+
+        # Perform assertions on the sanity checks of the window.
+        with pytest.raises(SignalError):
+            signal.window(3.0, 2.0)
+        with pytest.raises(SignalError):
+            signal.window(0.0, 1.0)
+
+    @pytest.mark.parametrize("noise", [0.5, 5.0])
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_edges_float32(self, noise: float, engine: Engine) -> None:
+        """Tests the edges of a signal with ``numpy.float32`` voltages against those of the same signal with
+        ``numpy.float64`` voltages, on the noisy signal of :meth:`.TestEdges.test_engines`.
+
+        The edges must be the same as those of the ``numpy.float64`` voltages rounded to ``numpy.float32``, as the
+        voltages are compared exactly with the levels. Compared with the original ``numpy.float64`` voltages, only
+        the voltages that round to the other side of a level can differ, thus the tolerance is the same number of
+        edges, with their indices at most one value apart, and the same values within the precision of
+        ``numpy.float32``.
+
+        :param noise: The standard deviation of the noise added to the signal.
+        :param engine: The engine to use for the extraction of edges."""
+        # pylint: disable=too-many-locals
+
+        # Create the noisy signal with normal edges and runt edges, with voltages in both data types.
+        (timestamps, voltages) = self._get_noisy_runt_signal(noise, 20)
+        signal = VoltageSignal(timestamps, voltages, dtype=np.float32)
+        rounded = VoltageSignal(timestamps, voltages.astype(np.float32).astype(np.float_))
+        reference = VoltageSignal(timestamps, voltages)
+        assert signal.voltages.dtype == np.float32 and signal.dtype == np.float32
+
+        # Perform assertions on the state levels and edges, the same as those of the rounded voltages.
+        (levels, _) = signal.state_levels()
+        assert levels == rounded.state_levels()[0]
+        edges = signal.edges(levels, engine=engine)
+        assert len(edges) > 0
+        assert np.array_equal(edges.values, rounded.edges(levels, engine=engine).values)
+
+        # Perform assertions on the edges against the original voltages, within the tolerance.
+        reference_edges = reference.edges(levels, engine=engine)
+        assert len(edges) == len(reference_edges)
+        assert np.array_equal(edges["edge_type"], reference_edges["edge_type"])
+        for column in ("ibegin", "iintermediate", "iend"):
+            assert np.max(np.abs(edges[column] - reference_edges[column])) <= 1
+        for point in ("begin", "end"):
+            same = edges[f"i{point}"] == reference_edges[f"i{point}"]
+            (values, reference_values) = (edges[f"v{point}"][same], reference_edges[f"v{point}"][same])
+            assert np.allclose(values, reference_values, rtol=np.finfo(np.float32).eps, atol=0)
+
+        # Perform assertions on the data type of the filtered signal, and on the sanity checks of the data type.
+        assert signal.filters_butterworth(1.0e6, 2, 1.0e5).voltages.dtype == np.float32
+        with pytest.raises(SignalError):
+            VoltageSignal(timestamps, voltages, dtype=np.int16)
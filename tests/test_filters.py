@@ -2,6 +2,7 @@
 
 import os
 
+import numpy as np
 import pytest
 
 from signal_edges.signal import VoltageSignal
@@ -13,7 +14,7 @@ from .conftest import env_plots
 class TestFilters:
     """A collection of tests for filters."""
 
-    # pylint: disable=no-self-use,too-few-public-methods
+    # pylint: disable=no-self-use
 
     ## Private API #####################################################################################################
 
@@ -56,3 +57,59 @@ class TestFilters:
         elliptic_signal = signal.filters_elliptic(sfreq, 6, sfreq / 6)
         if env_plots():
             signal.filters_plot(os.path.join(adir, "filter_lowpass_elliptic.png"), elliptic_signal)
+
+    def test_zero_copy(self, tmp_path: str) -> None:
+        """Tests a signal created without copies uses the arrays given, including read-only and memory-mapped arrays,
+        and that filtering it creates new arrays without modifying them.
+
+        :param tmp_path: The path where the memory-mapped file is stored."""
+        # Create read-only arrays, the values in a memory-mapped file.
+        timestamps = np.arange(0.0, 1000.0)
+        timestamps.flags.writeable = False
+        path = os.path.join(tmp_path, "voltages.bin")
+        np.tile([0.0] * 10 + [5.0] * 10, 50).tofile(path)
+        voltages = np.memmap(path, dtype=np.float_, mode="r", shape=(1000,))
+
+        # Perform assertions on the arrays of the signals, copied only when needed or requested.
+        signal = VoltageSignal(timestamps, voltages, copy=False)
+        assert np.shares_memory(signal.timestamps, timestamps) and np.shares_memory(signal.voltages, voltages)
+        assert not np.shares_memory(VoltageSignal(timestamps, voltages).voltages, voltages)
+        assert not np.shares_memory(VoltageSignal(timestamps[::2], voltages[::2], copy=False).voltages, voltages)
+        assert not np.shares_memory(
+            VoltageSignal(timestamps, voltages.astype(np.float32), copy=False).voltages, voltages
+        )
+        assert len(signal.edges(signal.state_levels()[0])) == 99
+
+        # Perform assertions on the filtered signal, with the values of the original signal unmodified.
+        filtered = signal.filters_butterworth(1.0, 2, 0.2)
+        assert not np.shares_memory(filtered.voltages, voltages)
+        assert np.array_equal(voltages, np.tile([0.0] * 10 + [5.0] * 10, 50))
+
+    def test_shared_timestamps(self) -> None:
+        """Tests the filtered signals share the timestamps and units with the signal they are filtered from, and that
+        replacing or writing the values of one of them does not affect the others."""
+        # Create signal, and chain filters on it.
+        voltages = np.tile([0.0] * 10 + [5.0] * 10, 50)
+        signal = VoltageSignal(np.arange(0.0, 1000.0), voltages, "s", "V")
+        (levels, _) = signal.state_levels()
+        filtered = signal.filters_butterworth(1.0, 2, 0.2)
+        chained = filtered.filters_bessel(1.0, 2, 0.2).filters_elliptic(1.0, 2, 0.4)
+
+        # Perform assertions on the values and units shared, and on the values of the vertical axis which are not.
+        assert np.shares_memory(filtered.timestamps, signal.timestamps)
+        assert np.shares_memory(chained.timestamps, signal.timestamps)
+        assert filtered.timestamp_units is signal.timestamp_units
+        assert not np.shares_memory(filtered.voltages, signal.voltages)
+        assert not np.shares_memory(chained.voltages, filtered.voltages)
+        assert filtered.cache_info.currsize == 0 and signal.cache_info.currsize == 1
+
+        # Perform assertions on writes in place to the timestamps, which would affect the signals that share them.
+        with pytest.raises(ValueError):
+            signal.timestamps[0] = -1.0
+        assert filtered.timestamps[0] == 0.0 and chained.timestamps[0] == 0.0
+
+        # Perform assertions on the values after replacing them in the filtered signal.
+        setattr(filtered, "_hv", np.arange(1.0, 1001.0))
+        assert np.array_equal(signal.timestamps, np.arange(0.0, 1000.0))
+        assert np.array_equal(signal.voltages, voltages)
+        assert len(signal.edges(levels)) == 99 and filtered.timestamps[0] == 1.0
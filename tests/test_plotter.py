@@ -6,6 +6,7 @@ import numpy as np
 import numpy.typing as npt
 import pytest
 
+from signal_edges.exceptions import PlotterError
 from signal_edges.plotter import Cursor, Mode, Plotter, Subplot, Units
 
 from .conftest import env_plots
@@ -141,3 +142,37 @@ class TestPlotter:
         # Perform plot and save to file.
         if env_plots():
             plotter.plot(plot_path)
+
+    @pytest.mark.parametrize("adir", ["uniform_plot"], indirect=True)
+    def test_uniform_plot(self, adir: str) -> None:
+        """Tests a plot with the values of the horizontal axis given by their start and step, which must plot the same
+        range of values as the equivalent array.
+
+        :param adir: The path where the plots will be stored."""
+        # pylint: disable=protected-access,no-self-use
+
+        # Create plotter with a subplot with uniformly spaced values, and a cursor on it.
+        (start, step, count) = (0.25, 0.001, 100000)
+        hvalues = np.multiply(np.arange(0, count), step, dtype=np.float_) + start
+        plot = Subplot(
+            "pl0", (start, step), Units("N/A", "N/A", "N/A"), np.sin(hvalues), Units("N/A", "N/A", "N/A"), 10, 20
+        )
+        plotter = Plotter(Mode.LINEAR).add_plot(0, 0, plot).add_cursor(Cursor("A", 12000, 0, 0, ["pl0"]))
+
+        # Perform assertions on the values and the searches, which must match those of the array.
+        assert np.array_equal(plotter._hvalues_at(plot, slice(0, count)), hvalues)
+        assert plotter._hvalues_at(plot, -1) == hvalues[-1]
+        for value in np.concatenate(([-1.0, 0.25, 100.249, 1000.0], hvalues[::997], hvalues[::997] + step / 2)):
+            for side in ("left", "right"):
+                assert plotter._hsearch(plot, value, side) == np.searchsorted(hvalues, value, side)  # type: ignore
+
+        # Perform assertions on the sanity checks of the values.
+        for invalid in ((0.0, 0.0), (0.0, -1.0), (np.nan, 1.0)):
+            with pytest.raises(PlotterError):
+                Plotter(Mode.LINEAR).add_plot(
+                    0, 0, Subplot("pl0", invalid, plot.hunits, plot.vvalues, plot.vunits, 0, 1)
+                )
+
+        # Perform plot and save to file.
+        if env_plots():
+            plotter.plot(os.path.join(adir, "uniform.png"))
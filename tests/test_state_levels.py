@@ -5,8 +5,9 @@ import os
 import numpy as np
 import pytest
 
+from signal_edges.exceptions import SignalError, StateLevelsError
 from signal_edges.signal import VoltageSignal
-from signal_edges.signal.state_levels import Mode
+from signal_edges.signal.state_levels import Mode, StateLevelsAccumulator
 
 from .conftest import env_plots
 
@@ -14,7 +15,7 @@ from .conftest import env_plots
 class TestStateLevels:
     """A collection of tests for signal state levels."""
 
-    # pylint: disable=no-self-use,too-few-public-methods
+    # pylint: disable=no-self-use
 
     ## Private API #####################################################################################################
 
@@ -56,3 +57,347 @@ class TestStateLevels:
         assert np.isclose(levels.low_runt, -9.9 + (9.9 - -9.9) * 0.30)
         assert np.isclose(levels.low, -9.9 + (9.9 - -9.9) * 0.10)
         assert np.isclose(levels.lowest, -9.9)
+
+    def test_percentile(self) -> None:
+        """Tests the state levels calculated with the percentile mode are the medians of the halves of the values,
+        regardless of the number of bins."""
+        # Create signal, a noisy two-level signal long enough to be processed in several blocks.
+        rng = np.random.default_rng(0)
+        timestamps = np.arange(0.0, 200001.0)
+        voltages = np.append(np.tile([0.0] * 50 + [5.0] * 50, 2000), 5.0) + rng.normal(0, 0.1, 200001)
+        signal = VoltageSignal(timestamps, voltages)
+
+        # Calculate the medians of the halves that numpy would calculate.
+        bounds = (np.min(voltages) - np.finfo(np.float_).eps, np.max(voltages) + np.finfo(np.float_).eps)
+        middle = (bounds[0] + bounds[1]) / 2
+        (lowest, highest) = (np.median(voltages[voltages <= middle]), np.median(voltages[voltages >= middle]))
+
+        # Perform assertions on the state levels, for any number of bins.
+        for nbins in (2, 7, 100):
+            (levels, (hist_x, hist_y)) = signal.state_levels(Mode.PERCENTILE, nbins)
+            assert levels.lowest == lowest
+            assert levels.highest == highest
+            assert np.isclose(levels.intermediate, (lowest + highest) / 2)
+            assert np.array_equal(hist_y, np.histogram(voltages, nbins, bounds)[0])
+            assert len(hist_x) == nbins
+        assert abs(lowest) < 0.01 and abs(highest - 5.0) < 0.01
+
+        # Perform assertions on the bounds provided by the user, and on the estimation, which does not subsample.
+        (levels, _) = signal.state_levels(Mode.PERCENTILE, bounds=(0.0, 5.0))
+        assert levels.lowest == np.median(voltages[(voltages >= 0.0) & (voltages <= 2.5)])
+        assert levels.highest == np.median(voltages[(voltages >= 2.5) & (voltages <= 5.0)])
+        (estimated, _, uncertainty) = signal.state_levels_estimate(Mode.PERCENTILE)
+        assert estimated == signal.state_levels(Mode.PERCENTILE)[0]
+        assert uncertainty == 0.0
+        with pytest.raises(StateLevelsError):
+            signal.state_levels(Mode.PERCENTILE, bounds=(10.0, 20.0))
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    def test_multi(self, mode: Mode) -> None:
+        """Tests the state levels of a signal with four states are near each state, and that the state levels of a
+        signal with two states are the same as those of :meth:`.StateLevelsMixin.state_levels`.
+
+        :param mode: The mode used to calculate the level of each state."""
+        # Create signal, with four evenly spaced states and a symbol every ten values.
+        rng = np.random.default_rng(0)
+        voltages = np.repeat(rng.integers(0, 4, 2000), 10) + rng.normal(0, 0.05, 20000)
+        signal = VoltageSignal(np.arange(0.0, 20000.0), voltages)
+
+        # Perform assertions on the state levels of each pair of adjacent states.
+        (levels, (hist_x, hist_y)) = signal.state_levels_multi(4, mode)
+        assert len(levels) == 3
+        assert np.allclose([i.lowest for i in levels], [0.0, 1.0, 2.0], atol=0.025)
+        assert np.allclose([i.highest for i in levels], [1.0, 2.0, 3.0], atol=0.025)
+        assert all(levels[i].highest == levels[i + 1].lowest for i in range(0, 2))
+        assert np.array_equal(hist_y, signal.state_levels(mode)[1][1])
+        assert len(hist_x) == 100
+
+        # Perform assertions on two states, and on the number of states.
+        assert signal.state_levels_multi(2, mode)[0] == [signal.state_levels(mode)[0]]
+        bounds = (-0.5, 1.5)
+        assert signal.state_levels_multi(2, mode, bounds=bounds)[0] == [signal.state_levels(mode, bounds=bounds)[0]]
+        for states in (1, 101):
+            with pytest.raises(StateLevelsError):
+                signal.state_levels_multi(states, mode)
+        with pytest.raises(StateLevelsError):
+            VoltageSignal(np.arange(0.0, 4.0), [0.0, 0.0, 1.0, 1.0]).state_levels_multi(3, mode, nbins=9)
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    @pytest.mark.parametrize("nbins", [2, 7, 100])
+    def test_batch(self, mode: Mode, nbins: int) -> None:
+        """Tests the state levels calculated for the rows of a 2D array at once are the same as those calculated for
+        each row as a signal on its own.
+
+        :param mode: The mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram."""
+        # Create records, with values rounded so that many of them are at the edges of the bins.
+        rng = np.random.default_rng(0)
+        records = np.round(np.tile([0.0] * 20 + [5.0] * 20, (50, 5)) + rng.normal(0, 0.5, (50, 200)), 1)
+        records[:, :10] += np.arange(0, 50)[:, np.newaxis] / 10
+
+        # Perform assertions on the state levels of each row, also for a non contiguous array.
+        levels = VoltageSignal.state_levels_batch(records, mode, nbins)
+        assert len(levels) == 50
+        for i in range(0, 50):
+            assert levels[i] == VoltageSignal(np.arange(0.0, 200.0), records[i]).state_levels(mode, nbins)[0]
+        assert VoltageSignal.state_levels_batch(records[::2, ::2], mode, nbins)[3] == (
+            VoltageSignal(np.arange(0.0, 100.0), records[6, ::2]).state_levels(mode, nbins)[0]
+        )
+        assert len(VoltageSignal.state_levels_batch(np.empty((0, 10)), mode, nbins)) == 0
+        for values in (records[0], np.empty((5, 0)), np.where(records > 4.0, np.nan, records)):
+            with pytest.raises(StateLevelsError):
+                VoltageSignal.state_levels_batch(values, mode, nbins)
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    @pytest.mark.parametrize("nbins", [2, 7, 100])
+    def test_segments(self, mode: Mode, nbins: int) -> None:
+        """Tests the state levels calculated for several segments of a signal at once are the same as those
+        calculated for each segment as a signal on its own.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram."""
+        # pylint: disable=protected-access
+
+        # Create signal, with values rounded so that many of them are at the edges of the bins.
+        rng = np.random.default_rng(0)
+        timestamps = np.arange(0.0, 2000.0)
+        voltages = np.round(np.cumsum(rng.normal(0, 1, 2000)), 1)
+        signal = VoltageSignal(timestamps, voltages)
+
+        # Create overlapping segments of different lengths, and calculate their state levels.
+        begin = rng.integers(0, 1900, 50)
+        end = begin + rng.integers(1, 100, 50)
+        levels = signal._state_levels_segments(begin, end, mode, nbins)
+
+        assert len(levels) == 50
+        for i in range(0, 50):
+            segment = VoltageSignal(timestamps[begin[i] : end[i] + 1], voltages[begin[i] : end[i] + 1])
+            assert levels[i] == segment.state_levels(mode, nbins)[0]
+
+    @pytest.mark.parametrize("nbins", [2, 7, 100])
+    @pytest.mark.parametrize("bounds", [None, (-20.0, 20.0), (-5.0, 5.0), (3.0, 3.0)])
+    def test_histogram_counts(self, nbins: int, bounds: tuple[float, float] | None) -> None:
+        """Tests the histogram of the state levels is the same as the one computed with :func:`numpy.histogram`.
+
+        :param nbins: Number of bins to use in the histogram.
+        :param bounds: The lower and upper bounds of the histogram, some values are outside of them."""
+        # Create signal longer than a block, with values rounded so that many of them are at the edges of the bins.
+        rng = np.random.default_rng(0)
+        timestamps = np.arange(0.0, 200000.0)
+        voltages = np.round(rng.normal(0, 5, 200000), 1)
+        signal = VoltageSignal(timestamps, voltages)
+
+        # Calculate the histogram that numpy would calculate.
+        if bounds is None:
+            bounds = (np.min(voltages) - np.finfo(np.float_).eps, np.max(voltages) + np.finfo(np.float_).eps)
+        (expected, _) = np.histogram(voltages, nbins, bounds)
+
+        # Perform assertions on the histogram.
+        (_, (_, hist_y)) = signal.state_levels(nbins=nbins, bounds=bounds)
+        assert np.array_equal(hist_y, expected)
+
+    @pytest.mark.parametrize("mode", [Mode.HISTOGRAM_MODE, Mode.HISTOGRAM_MEAN])
+    @pytest.mark.parametrize("nbins", [2, 7, 100])
+    def test_accumulator(self, mode: Mode, nbins: int) -> None:
+        """Tests the state levels calculated from chunks of a signal in merged accumulators are the same as those
+        calculated for the whole signal with fixed bounds, and close to them with growable bounds.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param nbins: Number of bins to use in the histogram."""
+        # pylint: disable=too-many-locals
+
+        # Create signal, with values rounded so that many of them are at the edges of the bins.
+        rng = np.random.default_rng(0)
+        timestamps = np.arange(0.0, 20000.0)
+        voltages = np.round(np.tile([0.0] * 50 + [5.0] * 50, 200) + rng.normal(0, 0.5, 20000), 1)
+        signal = VoltageSignal(timestamps, voltages)
+        (levels, (hist_x, hist_y)) = signal.state_levels(mode, nbins)
+        chunks = np.split(voltages, [10, 3000, 3001, 12000])
+
+        # Accumulate the chunks in two accumulators with growable bounds, and merge them.
+        accumulators = (StateLevelsAccumulator(nbins), StateLevelsAccumulator(nbins))
+        for i, chunk in enumerate(chunks):
+            accumulators[i % 2].update(chunk)
+        accumulator = accumulators[0].merge(accumulators[1])
+        (approx_levels, (approx_x, _)) = accumulator.finalize(mode)
+
+        # Perform assertions on the results with growable bounds, the levels are within a bin of the exact ones.
+        assert accumulator.count == len(voltages)
+        assert np.array_equal(approx_x, hist_x)
+        assert abs(approx_levels.highest - levels.highest) <= hist_x[1] - hist_x[0]
+        assert abs(approx_levels.lowest - levels.lowest) <= hist_x[1] - hist_x[0]
+
+        # Accumulate the chunks again with the bounds of the first pass as fixed bounds, and merge them.
+        accumulators = (
+            StateLevelsAccumulator(nbins, accumulator.bounds),
+            StateLevelsAccumulator(nbins, accumulator.bounds),
+        )
+        for i, chunk in enumerate(chunks):
+            accumulators[i % 2].update(chunk)
+        (exact_levels, (exact_x, exact_y)) = accumulators[0].merge(accumulators[1]).finalize(mode)
+
+        # Perform assertions on the results with fixed bounds, which are identical.
+        assert exact_levels == levels
+        assert np.array_equal(exact_x, hist_x)
+        assert np.array_equal(exact_y, hist_y)
+        with pytest.raises(StateLevelsError):
+            accumulators[0].merge(accumulator)
+        with pytest.raises(StateLevelsError):
+            StateLevelsAccumulator(nbins).finalize(mode)
+        with pytest.raises(StateLevelsError):
+            accumulator.finalize(Mode.PERCENTILE)
+
+    @pytest.mark.parametrize("mode", [Mode.HISTOGRAM_MODE, Mode.HISTOGRAM_MEAN])
+    def test_estimate(self, mode: Mode) -> None:
+        """Tests the state levels estimated from a subsample are within the uncertainty of the exact ones, and that
+        the estimation falls back to all the values when the states are not well separated.
+
+        :param mode: The histogram mode used to calculate the state levels."""
+        # Create signal, a noisy two-level signal long enough to be subsampled.
+        rng = np.random.default_rng(0)
+        timestamps = np.arange(0.0, 400000.0)
+        voltages = np.tile([0.0] * 50 + [5.0] * 50, 4000) + rng.normal(0, 0.1, 400000)
+        signal = VoltageSignal(timestamps, voltages)
+
+        # Perform assertions on the estimation.
+        (levels, _) = signal.state_levels(mode)
+        (estimated, (hist_x, hist_y), uncertainty) = signal.state_levels_estimate(mode)
+        assert np.isclose(uncertainty, hist_x[1] - hist_x[0])
+        assert np.sum(hist_y) < len(voltages)
+        assert abs(estimated.lowest - levels.lowest) <= uncertainty
+        assert abs(estimated.highest - levels.highest) <= uncertainty
+
+        # Perform assertions on the fallback, for a signal without separated states and for a short signal.
+        signal = VoltageSignal(timestamps, rng.uniform(0, 5, 400000))
+        (estimated, (_, hist_y), uncertainty) = signal.state_levels_estimate(mode)
+        assert estimated == signal.state_levels(mode)[0]
+        assert np.sum(hist_y) == len(timestamps)
+        assert uncertainty == 0.0
+        signal = VoltageSignal(timestamps[:1000], voltages[:1000])
+        assert signal.state_levels_estimate(mode)[0] == signal.state_levels(mode)[0]
+        with pytest.raises(StateLevelsError):
+            signal.state_levels_estimate(mode, samples=0)
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    @pytest.mark.parametrize("window,step", [(100, None), (100, 30), (64, 64), (5000, None)])
+    def test_windowed(self, mode: Mode, window: int, step: int | None) -> None:
+        """Tests the state levels of the windows are the same as those of each window on its own.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param window: Number of values in each window.
+        :param step: Number of values between the beginning of consecutive windows."""
+        # Create signal, a noisy two-level signal with a drifting baseline.
+        rng = np.random.default_rng(0)
+        timestamps = np.arange(0.0, 1000.0)
+        voltages = np.tile([0.0] * 10 + [5.0] * 10, 50) + np.linspace(0, 3, 1000) + rng.normal(0, 0.1, 1000)
+        signal = VoltageSignal(timestamps, voltages)
+
+        # Perform assertions on the state levels of each window, where the last window ends at the end of the signal.
+        levels = signal.state_levels_windowed(window, step, mode)
+        (window, step) = (min(window, 1000), window if step is None else step)
+        begin = list(range(0, 1000 - window + 1, step))
+        begin = begin if begin[-1] + window == 1000 else begin + [1000 - window]
+        assert len(levels) == len(begin)
+        for index, value in enumerate(begin):
+            window_signal = VoltageSignal(timestamps[value : value + window], voltages[value : value + window])
+            assert levels[index] == window_signal.state_levels(mode)[0]
+
+        # Perform assertions on the state levels of each value, from the window with the nearest center.
+        per_value = signal.state_levels_windowed(window, step, mode, per_value=True)
+        assert len(per_value) == len(voltages)
+        assert per_value[0] == levels[0]
+        assert per_value[len(voltages) - 1] == levels[len(levels) - 1]
+        assert np.array_equal(per_value[5:10].low, np.full(5, levels.low[0]))
+        with pytest.raises(StateLevelsError):
+            signal.state_levels_windowed(0)
+        with pytest.raises(StateLevelsError):
+            signal.state_levels_windowed(window, 0)
+
+    def test_cache(self) -> None:
+        """Tests the state levels are cached by their arguments, that the cache is cleared with the values, and that the
+        values can't be modified in place without clearing it."""
+        # Create signal.
+        rng = np.random.default_rng(0)
+        signal = VoltageSignal(np.arange(0.0, 1000.0), np.tile([0.0] * 10 + [5.0] * 10, 50) + rng.normal(0, 0.1, 1000))
+
+        # Perform assertions on the hits and misses, and that results are copies.
+        (levels, (hist_x, hist_y)) = signal.state_levels()
+        hist_y[0] += 100
+        levels.high = 0.0
+        (cached, (cached_x, cached_y)) = signal.state_levels()
+        assert signal.cache_info.hits == 1 and signal.cache_info.misses == 1
+        assert cached != levels
+        assert np.array_equal(cached_x, hist_x)
+        assert np.sum(cached_y) == len(signal._vv)  # pylint: disable=protected-access
+        signal.state_levels(nbins=50)
+        assert signal.cache_info.misses == 2 and signal.cache_info.currsize == 2
+
+        # Perform assertions on writes in place to the values, which would not clear the cache.
+        with pytest.raises(ValueError):
+            signal.voltages[:] *= 2.0
+        assert signal.state_levels()[0] == cached
+
+        # Perform assertions on the cache being cleared with new values, and on its size being bounded.
+        signal._vv = signal._vv * 2.0  # pylint: disable=protected-access
+        assert signal.cache_info.currsize == 0
+        assert signal.state_levels()[0].highest == pytest.approx(2 * cached.highest)
+        for nbins in range(2, 2 + 2 * signal.cache_info.maxsize):
+            signal.state_levels(nbins=nbins)
+        assert signal.cache_info.currsize == signal.cache_info.maxsize
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    @pytest.mark.parametrize("dtype", [np.int8, np.uint8, np.int16, np.uint16])
+    @pytest.mark.parametrize("gain", [1e-3, -0.25])
+    def test_codes(self, mode: Mode, dtype: type, gain: float) -> None:
+        """Tests the state levels of a signal created from integer codes are the same as those of its values.
+
+        :param mode: The histogram mode used to calculate the state levels.
+        :param dtype: The data type of the codes.
+        :param gain: The gain to convert the codes to values."""
+        # pylint: disable=too-many-locals
+
+        # Create signals, one from the codes and another one from the values of the codes.
+        rng = np.random.default_rng(0)
+        info = np.iinfo(dtype)
+        levels = np.tile([info.min // 2 + info.max // 4] * 10 + [info.max // 2 + info.max // 4] * 10, 50)
+        codes = np.clip(levels + rng.normal(0, info.max / 50, 1000), info.min, info.max).astype(dtype)
+        signal = VoltageSignal(np.arange(0.0, 1000.0), codes, voltage_gain=gain, voltage_offset=1.5)
+        expected = VoltageSignal(np.arange(0.0, 1000.0), codes.astype(np.float_) * gain + 1.5)
+
+        # Perform assertions on the state levels, and on the bounds provided by the user.
+        (levels, (hist_x, hist_y)) = signal.state_levels(mode)
+        (expected_levels, (expected_x, expected_y)) = expected.state_levels(mode)
+        assert levels == expected_levels
+        assert np.array_equal(hist_x, expected_x)
+        assert np.array_equal(hist_y, expected_y)
+        bounds = (float(np.percentile(expected_x, 10)), float(np.percentile(expected_x, 90)))
+        assert signal.state_levels(mode, bounds=bounds)[0] == expected.state_levels(mode, bounds=bounds)[0]
+        with pytest.raises(SignalError):
+            VoltageSignal(np.arange(0.0, 1000.0), codes.astype(np.int32), voltage_gain=gain)
+        with pytest.raises(SignalError):
+            VoltageSignal(np.arange(0.0, 1000.0), codes, voltage_gain=0.0)
+
+    def test_to_array(self) -> None:
+        """Tests the arrays of the levels are read-only views that do not copy the values of the signal, nor create the
+        values of the horizontal axis of uniformly sampled signals."""
+        # Create signal.
+        signal = VoltageSignal(np.arange(0.0, 1000.0), np.tile([0.0] * 10 + [5.0] * 10, 50))
+        (levels, _) = signal.state_levels()
+
+        # Perform assertions on the arrays of each level.
+        for level in ("highest", "high", "high_runt", "intermediate", "low_runt", "low", "lowest"):
+            (level_x, level_y) = signal.state_levels_to_array(levels, level)  # type: ignore
+            assert np.array_equal(level_x, np.arange(0.0, 1000.0))
+            assert np.array_equal(level_y, np.full(1000, getattr(levels, level)))
+            assert np.shares_memory(level_x, signal._hv)  # pylint: disable=protected-access
+            assert level_y.strides == (0,)
+            assert not level_x.flags.writeable and not level_y.flags.writeable
+        with pytest.raises(StateLevelsError):
+            signal.state_levels_to_array(levels, "invalid")  # type: ignore
+
+        # Perform assertions on the arrays of uniformly sampled signals, whose horizontal axis is not created.
+        signal = VoltageSignal(None, signal.voltages, timestamp_start=0.0, timestamp_step=1.0)
+        (level_x, level_y) = signal.state_levels_to_array(levels, "high")
+        assert np.array_equal(level_x, np.arange(0.0, 1000.0))
+        assert not level_x.flags.writeable and not level_y.flags.writeable
+        assert isinstance(signal._hv_axis, tuple)  # pylint: disable=protected-access